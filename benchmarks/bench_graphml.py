@@ -0,0 +1,72 @@
+"""
+Check that readers.read_graphml and writers.write_graphml round-trip the graph
+files of the pipeline (same nodes, edges and layout attributes as networkx),
+and compare their speed with networkx.read_graphml/write_graphml on scaled-up
+copies of the graphs.
+Usage: python benchmarks/bench_graphml.py [--nodes 100000]
+"""
+import os
+import argparse
+import tempfile
+import networkx as nx
+from common import GRAPHML_FILES, best_time
+import readers
+import writers
+
+def layout_attributes(graph, n):
+	return dict((k, v) for k, v in graph.node[n].items() if k in readers.graph_attributes)
+
+def same_graph(g1, g2):
+	""" Compare nodes, edges and layout attributes of two graphs """
+	if set(g1.nodes()) != set(g2.nodes()) or set(g1.edges()) != set(g2.edges()):
+		return False
+	return all(layout_attributes(g1, n) == layout_attributes(g2, n) for n in g1.nodes())
+
+def scale_graph(graph, num_nodes):
+	""" Disjoint copies of a graph (shifted in x-direction) with at least num_nodes nodes """
+	xs = [graph.node[n]['x'] for n in graph.nodes()]
+	width = max(xs) - min(xs) + 100
+	scaled = readers.LayoutGraph()
+	for c in range(num_nodes//len(graph.node) + 1):
+		for n in graph.nodes():
+			attr = layout_attributes(graph, n)
+			attr['x'] += c*width
+			scaled.add_node('{}_{}'.format(n, c), **attr)
+		for u, v in graph.edges():
+			scaled.add_edge('{}_{}'.format(u, c), '{}_{}'.format(v, c))
+	return scaled
+
+def main(args):
+	fd, tmp = tempfile.mkstemp(suffix = '.graphml')
+	os.close(fd)
+	try:
+		print '{:<40} {:>10}'.format('file', 'round-trip')
+		for file_name in GRAPHML_FILES:
+			reference = nx.read_graphml(file_name)
+			graph = readers.read_graphml(file_name)
+			writers.write_graphml(graph, tmp)
+			ok = same_graph(graph, reference) and same_graph(readers.read_graphml(tmp), reference) \
+				and same_graph(nx.read_graphml(tmp), reference)
+			print '{:<40} {:>10}'.format(os.path.basename(file_name)[:40], 'ok' if ok else 'FAILED')
+
+		print
+		print '{:<40} {:>8} {:>9} {:>9} {:>9} {:>9}'.format('file (scaled)', 'nodes', 'nx read', 'read', 'nx write', 'write')
+		for file_name in GRAPHML_FILES:
+			graph = scale_graph(readers.read_graphml(file_name), args.nodes)
+			writers.write_graphml(graph, tmp)
+			nx_graph = nx.read_graphml(tmp)
+			t1, _ = best_time(lambda: nx.read_graphml(tmp), args.repeat)
+			t2, _ = best_time(lambda: readers.read_graphml(tmp), args.repeat)
+			t3, _ = best_time(lambda: nx.write_graphml(nx_graph, tmp), args.repeat)
+			t4, _ = best_time(lambda: writers.write_graphml(graph, tmp), args.repeat)
+			print '{:<40} {:>8} {:>8.2f}s {:>8.2f}s {:>8.2f}s {:>8.2f}s'.format(
+				os.path.basename(file_name)[:40], len(graph.node), t1, t2, t3, t4)
+	finally:
+		os.remove(tmp)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--nodes', type = int, default = 100000, help = "Number of nodes of the scaled-up graphs.")
+	parser.add_argument('--repeat', type = int, default = 3)
+	args = parser.parse_args()
+	main(args)
@@ -0,0 +1,49 @@
+"""
+Compare time and peak memory of loading a (scaled-up) layout from json
+(readers.load_json_data), graphml (readers.read_graphml + read_graph) and the
+binary layout format (readers.read_layout_npz, with and without mmap).
+Usage: python benchmarks/bench_layout_npz.py [--edges 100000]
+"""
+import os
+import json
+import shutil
+import argparse
+import tempfile
+from common import JSON_FILES, load_json, time_and_memory, scale_json_layout
+import readers
+import writers
+from json_to_graphml import layout_to_graph
+
+def main(args):
+	tmp_dir = tempfile.mkdtemp()
+	json_file = os.path.join(tmp_dir, 'layout.json')
+	graphml_file = os.path.join(tmp_dir, 'layout.graphml')
+	npz_file = os.path.join(tmp_dir, 'layout.npz')
+	try:
+		print '{:<32} {:>14} {:>14} {:>14} {:>14} {:>14}'.format('file (scaled)', 'json', 'graphml', 'npz', 'npz (mmap)', 'arrays (mmap)')
+		for file_name in JSON_FILES:
+			with open(json_file, 'w') as f:
+				json.dump(scale_json_layout(load_json(file_name), args.edges), f)
+			d = readers.load_json_data(json_file)
+			writers.write_layout_npz(d, npz_file)
+			writers.write_graphml(layout_to_graph(d), graphml_file)
+
+			results = [
+				time_and_memory(lambda: readers.load_json_data(json_file)),
+				time_and_memory(lambda: readers.read_graph(readers.read_graphml(graphml_file))),
+				time_and_memory(lambda: readers.read_layout_npz(npz_file)),
+				time_and_memory(lambda: readers.read_layout_npz(npz_file, mmap_mode = True)),
+				time_and_memory(lambda: readers.read_layout_arrays(npz_file, mmap_mode = True))]
+			print '{:<32}'.format(os.path.basename(file_name)[:32]) + ''.join(
+				' {:>6.2f}s {:>4.0f}MB'.format(t, m) for t, m in results)
+		print
+		print 'file sizes: json {:.1f} MB, graphml {:.1f} MB, npz {:.1f} MB (last file)'.format(
+			*[os.path.getsize(f)/1024.**2 for f in (json_file, graphml_file, npz_file)])
+	finally:
+		shutil.rmtree(tmp_dir)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--edges', type = int, default = 100000, help = "Number of edges of the scaled-up layouts.")
+	args = parser.parse_args()
+	main(args)
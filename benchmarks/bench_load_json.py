@@ -0,0 +1,38 @@
+"""
+Compare peak memory and time of loading a (scaled-up) json layout file with
+json.load + readers.read_json_data and with the incremental readers.load_json_data.
+Usage: python benchmarks/bench_load_json.py [--edges 100000]
+"""
+import os
+import json
+import argparse
+import tempfile
+from common import JSON_FILES, load_json, time_and_memory, scale_json_layout
+import readers
+
+def load_whole_file(file_name):
+	with open(file_name) as f:
+		data = json.load(f)
+	return readers.read_json_data(data)
+
+def main(args):
+	print 'incremental parser:', readers.ijson.__name__ if readers.ijson else 'not available (ijson not installed)'
+	print '{:<45} {:>8} {:>12} {:>12}'.format('file (scaled)', 'MB', 'json.load', 'incremental')
+	for file_name in JSON_FILES:
+		fd, tmp = tempfile.mkstemp(suffix = '.json')
+		with os.fdopen(fd, 'w') as f:
+			json.dump(scale_json_layout(load_json(file_name), args.edges), f)
+		try:
+			size = os.path.getsize(tmp)/1024.**2
+			t1, m1 = time_and_memory(lambda: load_whole_file(tmp))
+			t2, m2 = time_and_memory(lambda: readers.load_json_data(tmp))
+			print '{:<45} {:>8.1f} {:>5.1f}s {:>4.0f}MB {:>5.1f}s {:>4.0f}MB'.format(
+				os.path.basename(file_name)[:45], size, t1, m1, t2, m2)
+		finally:
+			os.remove(tmp)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--edges', type = int, default = 100000, help = "Number of edges of the scaled-up layouts.")
+	args = parser.parse_args()
+	main(args)
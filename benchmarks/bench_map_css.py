@@ -0,0 +1,102 @@
+"""
+Stylesheet size of final maps: the shared rules of layout_final.map_style
+against the rules per reaction that visualize.py makes of them (the css that
+layout_final.py wrote before, see visualize.expand_reaction_rules), for a
+synthetic map and for final map files. The script only measures the size of
+the css, not the time of the style recalculation. With --html, it writes pages
+with each map inline that time the style recalculation when they are opened
+in a browser (the result is shown on the page); no recalculation times have
+been recorded with them so far.
+Usage: python benchmarks/bench_map_css.py [--reactions 4000] [--species 3000] [--maps final.svg ...] [--html DIR]
+"""
+import os
+import re
+import argparse
+from cStringIO import StringIO
+from common import ROOT
+from svg_output import open_svg
+import layout_final
+import visualize
+from bench_map_writer import FixedWidthFont, synthetic_map
+
+font_face_pattern = re.compile(r'@font-face\s*{[^}]*}')
+style_pattern = re.compile(r'<style>(.*?)</style>', re.DOTALL)
+
+recalc_html = """<!DOCTYPE html>
+<html>
+<head><meta charset="ISO-8859-1"><title>style recalculation: MAP_NAME</title></head>
+<body>
+<p id="result">measuring...</p>
+MAP_SVG
+<script>
+// force a style recalculation (and layout) of the whole map a number of times
+window.addEventListener('load', function() {
+  var svg = document.getElementsByTagName('svg')[0], times = [];
+  for (var i = 0; i < 20; i++) {
+    svg.style.display = 'none';
+    document.body.offsetHeight;
+    var t0 = performance.now();
+    svg.style.display = '';
+    svg.getBoundingClientRect();
+    document.body.offsetHeight;
+    times.push(performance.now() - t0);
+  }
+  times.sort(function(a, b) { return a - b; });
+  var text = 'MAP_NAME: median ' + times[10].toFixed(1) + ' ms, fastest ' + times[0].toFixed(1) + ' ms';
+  document.getElementById('result').textContent = text;
+  console.log(text);
+});
+</script>
+</body>
+</html>
+"""
+
+def stylesheet(svg_lines):
+	""" Css of a map without the embedded font: (bytes, number of rules) """
+	css = font_face_pattern.sub('', ''.join(style_pattern.findall(''.join(svg_lines))))
+	return len(css), css.count('{')
+
+def per_reaction(svg_lines):
+	""" Lines of a map with rules per reaction, as after visualize.py """
+	rids = set(re.findall('id="(r_\w+)"', ''.join(svg_lines)))
+	return visualize.expand_reaction_rules(svg_lines, rids, True)
+
+def synthetic_final_map(num_reactions, num_species):
+	svg = StringIO()
+	layout_final.write_map_templates(svg, *(synthetic_map(num_reactions, num_species) + (FixedWidthFont(),)))
+	xml = layout_final.wrap_svg_metabolic_map(svg.getvalue(), layout_final.map_style, 4000, 4000, 'synthetic map')
+	return xml.splitlines(True)
+
+def write_page(directory, name, svg_lines):
+	svg = ''.join(line for line in svg_lines if not line.startswith('<?xml'))
+	with open(os.path.join(directory, name + '.html'), 'wb') as f:
+		f.write(recalc_html.replace('MAP_NAME', name).replace('MAP_SVG', svg))
+
+def main(args):
+	maps = [('synthetic', synthetic_final_map(args.reactions, args.species))]
+	for file_name in args.maps:
+		with open_svg(file_name) as f:
+			maps.append((os.path.splitext(os.path.basename(file_name))[0], f.readlines()))
+	if args.html and not os.path.exists(args.html):
+		os.makedirs(args.html)
+
+	print '{:<30} {:>12} {:>8} {:>12} {:>8}'.format('map', 'shared css', 'rules', 'per reaction', 'rules')
+	for name, lines in maps:
+		expanded = per_reaction(lines)
+		size, rules = stylesheet(lines)
+		size_r, rules_r = stylesheet(expanded)
+		print '{:<30} {:>11.1f}k {:>8} {:>11.1f}k {:>8}'.format(name[:30], size/1e3, rules, size_r/1e3, rules_r)
+		if args.html:
+			write_page(args.html, name + '_shared', lines)
+			write_page(args.html, name + '_per_reaction', expanded)
+	if args.html:
+		print 'style recalculation not measured: open the pages in {} in a browser'.format(args.html)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--reactions', type = int, default = 4000, help = "Number of reactions of the synthetic map.")
+	parser.add_argument('--species', type = int, default = 3000, help = "Number of metabolite labels of the synthetic map.")
+	parser.add_argument('--maps', nargs = '*', default = [], help = "Final maps (layout_final.py) to measure as well.")
+	parser.add_argument('--html', metavar = 'DIR', default = '', help = "Directory for the style recalculation pages.")
+	args = parser.parse_args()
+	main(args)
@@ -0,0 +1,390 @@
+"""
+Compare time and peak memory of writing the reactions, metabolite labels and
+tooltips of a synthetic final map with svg element objects (write_map_elements
+below, with the pysvg element classes and the lightweight classes of lite_elements.py) and with the string
+templates of layout_final.write_map_templates, and check that they give the
+same xml. Label widths are measured with a fixed-width
+font, so the times are those of building and writing the xml.
+Usage: python benchmarks/bench_map_writer.py [--reactions 5000] [--species 5000]
+"""
+import argparse
+from cStringIO import StringIO
+from common import time_and_memory
+from pysvg.core import TextContent
+from lite_elements import pysvg_elements, lite_elements
+from timing import NoTimer
+from layout_final import get_label_width
+import layout_final
+
+class FixedWidthFont(object):
+	""" Font with the interface of ImageFont used by layout_final.get_label_width """
+	size = 1000
+	def getsize(self, text):
+		return 600*len(text), 1000
+
+def synthetic_map(num_reactions, num_species):
+	""" Arguments of the map writers (see layout_final.get_layout_from_easy_edit and parse_annotations) """
+	rxn_id, met_id, rxn_layout, labels, annotations = {}, {}, {}, {}, {}
+	for i in range(num_reactions):
+		rid = 'r_{:04d}'.format(i)
+		x, y = 10.0 + (i % 50)*75, 10.0 + (i // 50)*75
+		rxn_id[rid] = rid
+		genes = ['Y{}_{}'.format(rid, k) for k in range(i % 3)]
+		rxn_layout[rid] = {'circle': {'x': x, 'y': y}, 'value': {'x': x + 7, 'y': y - 7},
+			'reversibility': ['reversible', 'irreversible', 'inactive'][i % 3],
+			'genes': genes if len(genes) == 1 else [{'d': 'm {},{} a 10,10 0 0 1 10,10'.format(x, y), 'id': g} for g in genes],
+			'paths': [{'d': 'm {},{} c 0,10 5,10 5,20'.format(x, y), 'marker': m} for m in ['substrate', 'substrate', 'product', 'product']]}
+		labels[rid] = 'reaction name ' + rid
+		annotations[rid] = {'link': 'http://identifiers.org/kegg.reaction/R00200' if i % 2 else None,
+			'DBrefs': {'kegg.reaction': ['R00200']}, 'GENE_ASSOCIATION': ' or '.join(genes)}
+	for i in range(num_species):
+		sid = 's_{:04d}'.format(i)
+		x, y = 40.0 + (i % 50)*75, 40.0 + (i // 50)*75
+		met_id[sid] = sid
+		labels[sid] = {'x': x, 'y': y, 'label_text': 'metabolite ' + sid, 'hover_text': 'metabolite ' + sid, 'font_size': '10'}
+		annotations[sid] = {'link': 'http://identifiers.org/chebi/CHEBI:1' if i % 2 else None,
+			'DBrefs': {'kegg.compound': ['C00001']} if i % 3 else {'chebi': ['1']}, 'formula': 'C6H12O6',
+			'stoichiometry': [('r_{:04d}'.format((i + k) % max(num_reactions, 1)), k + 1) for k in range(i % 30 + 1)]}
+	return rxn_id, met_id, rxn_layout, labels, annotations
+
+def write_map_elements(E, out, rxn_id, met_id, rxn_layout, labels, annotations, font, timer = NoTimer()):
+	"""
+	Build the reactions, genes, metabolite labels and tooltips of the final map
+	as svg elements (E: element classes, see lite_elements.Elements) and write
+	their xml to out (file-like). This was the writer of layout_final.py before
+	write_map_templates, it is kept here as the reference for its xml.
+	timer records the time of measuring the tooltip texts.
+	"""
+	for r, rid in rxn_id.items():
+
+		# get coordinates
+		x = rxn_layout[r]['circle']['x']
+		y = rxn_layout[r]['circle']['y']
+
+		# add element for visualizing gene expression
+		G_gn = E.g()
+		G_gn.set_class('gene_expression')
+
+		if len(rxn_layout[r]['genes']) == 1:
+			# if single gene, make a circle
+			C = E.circle(x,y, 10)
+			C.set_id(rxn_layout[r]['genes'][0])
+			G_gn.addElement(C)
+		else:
+			# if multiple genes, make path segments
+			# (or do nothing if no genes)
+			for layout in rxn_layout[r]['genes']:
+				P = E.path(layout['d'])
+				P.set_id(layout['id'])
+				G_gn.addElement(P)
+		out.write(G_gn.getXML())
+
+		# add reaction
+		G_rn = E.g()
+		G_rn.set_id(rid)
+		G_rn.set_class('reaction {}_reaction'.format(rxn_layout[r]['reversibility']))
+		G_rn.set_style('fill:none; stroke-linecap:round; stroke-linejoin:round')
+
+		# add paths (reaction arrows) to reaction
+		if 'paths' in rxn_layout[r]:
+			for layout in rxn_layout[r]['paths']:
+				P = E.path(layout['d'])
+				P.set_id(rid)
+				P.set_class(layout['marker'])
+				G_rn.addElement(P)
+
+		# add circle (displaying reversibility) to reaction
+		C = E.circle(x, y, 5)
+		C.set_id(rid) 
+		C.set_style('fill:#ffffff; stroke-dasharray:none')
+		G_rn.addElement(C)
+
+		P_rev = E.path('m {},{} h 2 m -2,2 h 2'.format(x-1, y-1))
+		P_rev.set_id(rid)
+		P_rev.set_class('reversible')
+		P_rev.set_style('stroke:#000000; stroke-width:1.0; stroke-dasharray:none')
+		G_rn.addElement(P_rev)
+
+		P_irr = E.path('m {},{} 2,1 -2,1'.format(x-1, y-1))
+		P_irr.set_id(rid)
+		P_irr.set_class('irreversible')
+		P_irr.set_style('stroke:#000000; stroke-width:1.0; stroke-dasharray:none')
+		G_rn.addElement(P_irr)
+
+		P_ko = E.path('m {},{} 3,3 m -3,0 3,-3'.format(x-1.5, y-1.5))
+		P_ko.set_id(rid)
+		P_ko.set_class('inactive')
+		P_ko.set_style('stroke:#ff0000; stroke-width:1.0; stroke-dasharray:none')
+		G_rn.addElement(P_ko)
+
+		# add flux value placeholder
+		x = rxn_layout[r]['value']['x']
+		y = rxn_layout[r]['value']['y']
+
+		T = E.text('ReactionValue:abs2:'+rid, x, y) # ':abs2:' means display absolute value in 2 significant digits
+		T.set_id(rid)
+		T.set_class('fluxvalue')
+		T.set_style('font-size:8px; fill:black; stroke-opacity:0')
+		G_rn.addElement(T)
+
+		# add span value placeholder
+		T = E.text('ReactionSpan:2:'+rid, x, y) # :2: means display value in 2 significant digits
+		T.set_id(rid)
+		T.set_class('FVAspan')
+		T.set_style('font-size:8px; fill:black; stroke-opacity:0')
+		G_rn.addElement(T)
+
+		out.write(G_rn.getXML())
+
+	for s, sid in met_id.items():
+		# add metabolite labels
+		x = labels[s]['x']
+		y = labels[s]['y']
+		T = E.text(labels[s]['label_text'], x, y)
+		T.set_id(sid)
+		T.set_style('font-size:{}px;'.format(labels[s]['font_size']))
+
+		out.write(T.getXML())
+
+	# add reaction info on hover
+
+	for r, rid in rxn_id.items():
+
+		G_nfo = E.g()
+		G_nfo.set_id(rid)
+		G_nfo.set_class('annotations reaction')
+
+		x = rxn_layout[r]['circle']['x']
+		y = rxn_layout[r]['circle']['y']
+
+		C = E.circle(x, y, 5)
+		C.set_style('fill:#000000')
+
+		href = annotations[rid]['link']
+		if href:
+			A = E.a()
+			A.set_target('_blank')
+			A.set_xlink_href(href)
+			A.addElement(C)
+			G_nfo.addElement(A)
+		else:
+			G_nfo.addElement(C)
+
+		DBrefs = [] # database references
+		for DBname, reflist in annotations[rid]['DBrefs'].items():
+			DBrefs += [DBname+':'+ref for ref in reflist]
+		DBrefs = ', '.join(DBrefs)
+
+		gene_assoc = annotations[rid]['GENE_ASSOCIATION']
+		if not gene_assoc:
+			gene_assoc = 'NA'
+
+		G_ttp = E.g()
+		G_ttp.set_class('tooltip')
+		with timer.stage('final_labels'):
+			w1 = get_label_width(labels[r], font, 10)
+			w2 = get_label_width('Genes: '+gene_assoc, font, 10)
+			w3 = get_label_width(DBrefs, font, 10)
+			w4 = get_label_width('ID: '+rid, font, 10)
+			ttp_w = max([100, w1, w2, w3, w4]) +10
+			timer.count('final_label_widths', 4)
+
+		shadow = E.rect(x+14, y-51, width= ttp_w, height= 110, rx=5)
+		shadow.set_style('fill:#000000; stroke:#000000; stroke-width:1.0; opacity:0.1; stroke-dasharray:none')
+		G_ttp.addElement(shadow)
+		box = E.rect(x+10, y-55, width= ttp_w, height= 110, rx=5)
+		box.set_id(rid)
+		box.set_style('fill:#ffffff; stroke-width:1.0; stroke-dasharray:none')
+		G_ttp.addElement(box)
+
+		T = E.text(labels[r], x+15, y-42.5)
+		T.set_style('fill:black; font-size:10px; stroke-opacity:0')
+		G_ttp.addElement(T)
+
+		T = E.text('ID: '+rid, x+15, y-27.5)
+		T.set_style('fill:black; font-size:10px; stroke-opacity:0')
+		G_ttp.addElement(T)
+
+		T = E.text(DBrefs, x+15, y-12.5)
+		T.set_style('fill:black; font-size:10px; stroke-opacity:0')
+		G_ttp.addElement(T)
+
+		T = E.text('Genes: '+gene_assoc, x+15, y+2.5)
+		T.set_style('fill:black; font-size:10px; stroke-opacity:0')
+		G_ttp.addElement(T)
+
+		T = E.text('ReactionValue:6:'+rid, x+15, y+17.5)
+		T.set_id(rid)
+		T.set_class('fluxvalue_tooltip')
+		T.set_style('fill:black; font-size:10px; stroke-opacity:0')
+		G_ttp.addElement(T)
+
+		T = E.text('min: ReactionMinValue:6:'+rid, x+15, y+32.5)
+		T.set_id(rid)
+		T.set_class('FVAmin')
+		T.set_style('fill:black; font-size:10px; stroke-opacity:0')
+		G_ttp.addElement(T)
+
+		T = E.text('max: ReactionMaxValue:6:'+rid, x+15, y+47.5)
+		T.set_id(rid)
+		T.set_class('FVAmax')
+		T.set_style('fill:black; font-size:10px; stroke-opacity:0')
+		G_ttp.addElement(T)
+
+		G_nfo.addElement(G_ttp)
+
+		out.write(G_nfo.getXML())
+
+
+	img_str = '<image class="tooltip" x="{}" y="{}" width="100" height="60" preserveAspectRatio="xMinYMid meet" xlink:href="http://www.genome.jp/Fig/compound/{}.gif"></image>'
+	for s, sid in met_id.items():
+		x = labels[s]['x']
+		y = labels[s]['y']
+
+		G_nfo = E.g()
+		G_nfo.set_class('annotations')
+
+		DBrefs = [] # database references
+		for DBname, reflist in annotations[sid]['DBrefs'].items():
+			DBrefs += [DBname+':'+ref for ref in reflist]
+		DBrefs = ', '.join(DBrefs)
+
+		chemform = annotations[sid]['formula']
+		if not chemform:
+			chemform='NA'
+
+		with timer.stage('final_labels'):
+			w1 = get_label_width('Chemical formula: '+chemform, font, 10)
+			w2 = get_label_width(DBrefs, font, 10)
+			w3 = get_label_width('ID: '+sid, font, 10)
+			w_rids=[]
+			w_coef=[]
+			stoichiometry = annotations[sid]['stoichiometry']
+			for rid, coef in stoichiometry:
+				w_rids.append(get_label_width(rid, font, 10))
+				w_coef.append(get_label_width(str(coef), font, 10))
+			w_col1 = max(w_rids)
+			w_col2 = max(w_coef)
+
+			w4 = w_col1 + w_col2 + 80
+
+			ttp_w = max([110, w1, w2, w3, w4]) + 10
+			ttp_h = 130+min(26, len(stoichiometry))*15
+			timer.count('final_label_widths', 3 + 2*len(stoichiometry))
+
+		# table with reactions
+		G_ttp = E.g()
+		G_ttp.set_class('tooltip')
+
+		R = E.rect(x-2.5, y-12.5, width = get_label_width(labels[s]['hover_text'], font, 10)+5, height = 15)
+		R.set_style('fill:#ffffff; stroke:none')
+		G_ttp.addElement(R) 
+
+		shadow = E.rect(x+4, y+9, width= ttp_w, height= ttp_h , rx=5)
+		shadow.set_style('fill:#000000; stroke:#000000; opacity:0.1; stroke-dasharray:none')
+		G_ttp.addElement(shadow)
+		box = E.rect(x, y+5, width= ttp_w, height= ttp_h, rx=5)
+		box.set_id(rid)
+		box.set_style('fill:#ffffff; stroke:#000000; stroke-width:1.0; stroke-dasharray:none')
+		G_ttp.addElement(box)
+
+		if 'kegg.compound' in annotations[sid]['DBrefs']:
+			kegg_ref = annotations[sid]['DBrefs']['kegg.compound']
+			if kegg_ref:
+				kegg_ref=kegg_ref[0]
+				img = TextContent(img_str.format(x+5, y+15, kegg_ref))
+			else:
+				img=TextContent(' ')
+		else:
+			img=TextContent(' ')
+
+		G_ttp.addElement(img)
+
+		x = x+5
+
+		T = E.text('Chemical formula: '+chemform, x, y + 97.5)
+		T.set_style('fill:black; font-size:10px')
+		G_ttp.addElement(T)
+
+		T = E.text('ID: '+sid, x, y + 112.5)
+		T.set_style('fill:black; font-size:10px')
+		G_ttp.addElement(T)
+
+		T = E.text(DBrefs, x, y+127.5)
+		T.set_style('fill:black; font-size:10px')
+		G_ttp.addElement(T)
+
+		for i in range(len(stoichiometry)):
+			rid = stoichiometry[i][0]
+			coef= stoichiometry[i][1]
+			x0 = x
+			x1 = x + w_col1 + 5 + w_col2 - w_coef[i]
+			x2 = x + w_col1 + w_col2 + 15
+
+			T = E.text(rid, x0, y+142.5 + i*15)
+			T.set_style('fill:black; font-size:10px')
+			G_ttp.addElement(T)
+
+			T = E.text(str(coef)+' x ', x1, y+142.5 + i*15)
+			T.set_style('fill:black; font-size:10px')
+			G_ttp.addElement(T)
+
+			T = E.text('ReactionValue:6:'+rid, x2, y+142.5 + i*15)
+			T.set_id(rid)
+			T.set_class('fluxvalue_tooltip')
+			T.set_style('fill:black; font-size:10px; stroke-opacity:0')
+			G_ttp.addElement(T)
+
+			if i == 24:
+				T = E.text('...and {} more'.format(len(stoichiometry)-25), x, y+157.5 + i*15)
+				T.set_style('fill:black; font-size:10px')
+				G_ttp.addElement(T)
+				break
+
+		G_nfo.addElement(G_ttp)
+
+		A = E.a()
+		href = annotations[sid]['link']
+		if href:
+			A.set_target('_blank')
+			A.set_xlink_href(href)
+		else:
+			A.set_xlink_href('#')
+
+		T = E.text(labels[s]['hover_text'], x-5, y)
+		T.set_style('fill:#999999; font-size:10px')
+		A.addElement(T)
+
+		G_nfo.addElement(A)
+
+		out.write(G_nfo.getXML())
+
+def write_elements(E, data):
+	svg = StringIO()
+	write_map_elements(E, svg, *(data + (FixedWidthFont(),)))
+	return svg.getvalue()
+
+def write_templates(data):
+	svg = StringIO()
+	layout_final.write_map_templates(svg, *(data + (FixedWidthFont(),)))
+	return svg.getvalue()
+
+def main(args):
+	small = synthetic_map(50, 50)
+	if not write_elements(pysvg_elements, small) == write_elements(lite_elements, small) == write_templates(small):
+		print 'ERROR: the map writers give different xml'
+		return
+	print 'same xml: yes'
+	data = synthetic_map(args.reactions, args.species)
+	print '{:<20} {:>10} {:>10}'.format('', 'time', 'memory')
+	for name, func in [('pysvg', lambda: write_elements(pysvg_elements, data)),
+			('lite', lambda: write_elements(lite_elements, data)), ('templates', lambda: write_templates(data))]:
+		t, m = time_and_memory(func)
+		print '{:<20} {:>9.2f}s {:>8.0f}MB'.format(name, t, m)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--reactions', type = int, default = 5000, help = "Number of reactions of the map.")
+	parser.add_argument('--species', type = int, default = 5000, help = "Number of metabolite labels of the map.")
+	args = parser.parse_args()
+	main(args)
@@ -0,0 +1,47 @@
+"""
+Check that the compact path data of path_encoding.py gives the same paths
+(within the rounding tolerance) and report the size reduction, for the paths
+of the example svg files and of the json example maps (svg_assembly.get_svgdata
+without overlap prevention).
+Usage: python benchmarks/bench_path_encoding.py [--precision 1 2 3]
+"""
+import os
+import re
+import glob
+import argparse
+from PIL import ImageFont
+from common import ROOT, JSON_FILES, load_json
+from readers import read_json_data
+from svg_assembly import get_svgdata
+from path_encoding import compact_path, path_deviation
+
+def svg_file_paths(file_name):
+	with open(file_name) as f:
+		return re.findall(r'\sd="([^"]*)"', f.read())
+
+def json_file_paths(file_name, font):
+	d = read_json_data(load_json(file_name))
+	svg_data = get_svgdata(d, font, 10.0, [20.0, 20.0], [20.0, 20.0], None, True, True)
+	return [p['d'] for p in svg_data['paths'].values()]
+
+def main(args):
+	font = ImageFont.truetype(os.path.join(ROOT, 'fonts', 'Raleway', 'Raleway-Regular.ttf'), 1000)
+	maps = [(os.path.basename(f), svg_file_paths(f)) for f in sorted(glob.glob(os.path.join(ROOT, 'editable_svg_files', '*.svg')))]
+	maps += [(os.path.basename(f), json_file_paths(f, font)) for f in JSON_FILES]
+
+	print '{:<40} {:>6} {:>10} {:>10} {:>7} {:>10} {:>6}'.format('map', 'paths', 'precision', 'bytes', 'size', 'deviation', 'ok')
+	for name, paths in maps:
+		size = sum(len(d) for d in paths)
+		for precision in args.precision:
+			compact = [compact_path(d, precision) for d in paths]
+			deviation = max([path_deviation(d, c) for d, c in zip(paths, compact)] + [0.0])
+			# every point is within 0.5*10**-precision of the original in x and y
+			ok = deviation <= 0.5**0.5*10**-precision + 1e-9
+			print '{:<40} {:>6} {:>10} {:>10} {:>6.0f}% {:>10.2g} {:>6}'.format(name[:40], len(paths), precision,
+				sum(len(c) for c in compact), 100.0*sum(len(c) for c in compact)/max(size, 1), deviation, 'yes' if ok else 'NO')
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--precision', type = int, nargs = '+', default = [1, 2, 3], help = "Numbers of decimals of the compact path data.")
+	args = parser.parse_args()
+	main(args)
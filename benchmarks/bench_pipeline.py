@@ -0,0 +1,247 @@
+"""
+Time and peak memory of each stage of the pipeline on the example files and
+on scaled-up copies of them, compared with a stored baseline
+(baseline_pipeline.json, next to this script):
+json_files		read_json_data, infodict_to_graph (json_to_graphml.py), get_svgdata,
+				get_paths without and with prevent_overlap, get_svgdoc
+graphml_files	read_graph
+editable_svg_files	pysvg.parser.parse, get_layout_from_easy_edit, Vmod.mapFBA (on the
+				final map that layout_final.py makes of the svg)
+The scaled-up layouts are copies of the graph next to each other (see
+common.scale_json_layout and bench_graphml.scale_graph), the scaled-up svg
+files have copies of the reaction arrows, circles and labels (with _copy_
+ids, on top of the originals). get_paths with prevent_overlap is only run on
+the scaled-up layouts with --scaled_overlap (it takes minutes).
+The graphml examples don't have pathways (read_graph needs them, they are set
+to ''); examples without node types are skipped.
+Without cbmpy (or without --model), the model of layout_final.py and
+visualize.py is a stand-in made from the ids in the svg (see stub_model.py),
+so no solver is needed.
+Usage: python benchmarks/bench_pipeline.py [--copies 3] [--stages get_paths ...] [--inputs TCA ...] [--save_baseline]
+"""
+import os
+import sys
+import copy
+import json
+import glob
+import shutil
+import itertools
+import argparse
+import tempfile
+import webbrowser
+from xml.dom import minidom
+from PIL import ImageFont
+from common import ROOT, JSON_FILES, GRAPHML_FILES, load_json, time_and_memory, scale_json_layout
+from bench_graphml import scale_graph
+from stub_model import stub_model_from_svg
+import cbmpy as cbm
+import readers
+import svg_paths
+import svg_assembly
+import layout_final
+import visualize
+from json_to_graphml import infodict_to_graph
+from svg_assembly import get_svgdata, get_svgdoc
+from pysvg.parser import parse
+
+SVG_FILES = sorted(glob.glob(os.path.join(ROOT, 'editable_svg_files', '*.svg')))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline_pipeline.json')
+STAGES = ['read_json_data', 'infodict_to_graph', 'get_svgdata', 'get_paths', 'get_paths (overlap)', 'get_svgdoc',
+	'read_graph', 'parse', 'get_layout_from_easy_edit', 'mapFBA']
+
+# settings of json_to_svg.py (default scale, padding and font size)
+font_size = 10.0
+scale = [20.0, 20.0]
+padding = [20.0, 20.0]
+
+def svgdata(d, font):
+	""" get_svgdata without overlap prevention (changes d) """
+	return get_svgdata(d, font, font_size, scale, padding, None, True, True)
+
+def get_paths_arguments(d, font):
+	""" Keyword arguments of the get_paths call of get_svgdata """
+	arguments = {}
+	def record(**kwargs):
+		arguments.update(copy.deepcopy(kwargs))
+		return svg_paths.get_paths(**kwargs)
+	svg_assembly.get_paths = record
+	try:
+		svgdata(copy.deepcopy(d), font)
+	finally:
+		svg_assembly.get_paths = svg_paths.get_paths
+	return arguments
+
+def scale_svg(file_name, copies, out_file):
+	"""
+	Write an editable svg with copies of the reaction arrows, circles, flux
+	value placeholders and labels of an svg file (ids with a _copy_ suffix)
+	"""
+	doc = minidom.parse(file_name)
+	elements = [e for e in doc.getElementsByTagName('*') if e.getAttribute('id').startswith(('path_r_', 'r_', 'rval_r_', 's_'))]
+	for k in range(1, copies):
+		for e in elements:
+			e_id = e.getAttribute('id')
+			if e_id.startswith('path_'):
+				# after the reaction id, so copies are separate reactions of the map
+				# (path_r_0001s_0001 or path_r_0001_s_0001)
+				rid = e_id.split('s_')[0].rstrip('_')
+				new_id = '{}_copy_{}{}'.format(rid, k, e_id[len(rid):])
+			else:
+				new_id = '{}_copy_{}'.format(e_id, k)
+			c = e.cloneNode(True)
+			c.setAttribute('id', new_id)
+			e.parentNode.appendChild(c)
+	with open(out_file, 'wb') as f:
+		f.write(doc.toxml('utf-8'))
+
+def final_map(svg_file, model, font, output_dir):
+	""" Final map (layout_final.py) of an editable svg file """
+	args = layout_final.argument_parser().parse_args([svg_file, 'model.xml', 'r_', 's_',
+		'--output_dir', output_dir, '-o', os.path.basename(svg_file)])
+	args.open_browser = False
+	annotations = model.annotations() if hasattr(model, 'annotations') else None
+	layout_final.main(args, model, font, annotations)
+	return os.path.join(output_dir, os.path.basename(svg_file))
+
+def get_model(svg_file, args):
+	""" Model of an svg file: the sbml model of --model with cbmpy, otherwise a stand-in """
+	if args.model and hasattr(cbm, 'CBRead'):
+		return cbm.CBRead.readSBML3FBC(args.model)
+	return stub_model_from_svg(svg_file)
+
+def map_fba(svg_file, model, out_file):
+	D_bounds = dict((r.id, (r.getLowerBound(), r.getUpperBound())) for r in model.reactions)
+	visualize.Vmod(svg_file, model).mapFBA(model.getReactionValues(), D_bounds, out_file = out_file)
+
+def json_cases(args, font):
+	""" (stage, input, size, function) tuples of the json files """
+	for file_name in JSON_FILES:
+		data = load_json(file_name)
+		name = os.path.basename(file_name)
+		num_edges = len(data['graph']['edges'])
+		for label, layout in [(name, data), (name + ' x{}'.format(args.copies), scale_json_layout(data, args.copies*num_edges))]:
+			if not wanted(label, args):
+				continue
+			scaled = layout is not data
+			d = readers.read_json_data(layout)
+			size = '{} edges'.format(len(d['edges']))
+			yield 'read_json_data', label, size, lambda: readers.read_json_data(layout)
+			# (the functions are run in a separate process, so they can change d)
+			yield 'infodict_to_graph', label, size, lambda: infodict_to_graph(d, normalize = True)
+			yield 'get_svgdata', label, size, lambda: svgdata(d, font)
+			if selected('get_paths', args) or selected('get_paths (overlap)', args):
+				arguments = get_paths_arguments(d, font)
+				yield 'get_paths', label, size, lambda: svg_paths.get_paths(**dict(arguments, prevent_overlap = False))
+				if not scaled or args.scaled_overlap:
+					yield 'get_paths (overlap)', label, size, lambda: svg_paths.get_paths(**dict(arguments, prevent_overlap = True))
+			if selected('get_svgdoc', args):
+				data_svg = svgdata(copy.deepcopy(d), font)
+				yield 'get_svgdoc', label, size, lambda: get_svgdoc(**data_svg)
+
+def graphml_cases(args):
+	""" (stage, input, size, function) tuples of the graphml files """
+	for file_name in GRAPHML_FILES:
+		graph = readers.read_graphml(file_name)
+		name = os.path.basename(file_name)
+		if not all('node_type' in graph.node[n] for n in graph.nodes()):
+			print 'skipped {} (no node types)'.format(name)
+			continue
+		for n in graph.nodes():
+			graph.node[n].setdefault('pathway', u'')
+		for label, g in [(name, graph), (name + ' x{}'.format(args.copies), scale_graph(graph, (args.copies - 1)*len(graph.node)))]:
+			if not wanted(label, args):
+				continue
+			yield 'read_graph', label, '{} nodes'.format(len(g.node)), lambda: readers.read_graph(g)
+
+def svg_cases(args, font, tmp):
+	""" (stage, input, size, function) tuples of the editable svg files """
+	for file_name in SVG_FILES:
+		name = os.path.basename(file_name)
+		scaled_file = os.path.join(tmp, name.replace('.svg', '_x{}.svg'.format(args.copies)))
+		for label, svg_file in [(name, file_name), (name + ' x{}'.format(args.copies), scaled_file)]:
+			if not wanted(label, args):
+				continue
+			if svg_file == scaled_file:
+				scale_svg(file_name, args.copies, scaled_file)
+			size = '{:.0f} kB'.format(os.path.getsize(svg_file)/1e3)
+			model = get_model(svg_file, args)
+			yield 'parse', label, size, lambda: parse(svg_file)
+			if selected('get_layout_from_easy_edit', args):
+				svgdoc = quiet(lambda: parse(svg_file))
+				yield 'get_layout_from_easy_edit', label, size, lambda: layout_final.get_layout_from_easy_edit(svgdoc, model)
+			if selected('mapFBA', args):
+				try:
+					map_file = quiet(lambda: final_map(svg_file, model, font, os.path.join(tmp, 'final')))
+				except Exception as e:
+					print 'skipped mapFBA of {} (layout_final.py failed: {!r})'.format(label, e)
+					continue
+				yield 'mapFBA', label, size, lambda: map_fba(map_file, model, os.path.join(tmp, 'FBA_result.svg'))
+
+def quiet(func):
+	""" Run func without its output (e.g. the messages of pysvg.parser) """
+	stdout = sys.stdout
+	sys.stdout = open(os.devnull, 'w')
+	try:
+		return func()
+	finally:
+		sys.stdout.close()
+		sys.stdout = stdout
+
+def selected(stage, args):
+	return not args.stages or stage in args.stages
+
+def wanted(label, args):
+	return not args.inputs or any(i in label for i in args.inputs)
+
+def main(args):
+	font = ImageFont.truetype(os.path.join(ROOT, 'fonts', 'Raleway', 'Raleway-Regular.ttf'), 1000)
+	baseline = {}
+	if os.path.exists(BASELINE):
+		with open(BASELINE) as f:
+			baseline = json.load(f)
+	# the result of mapFBA is not opened in a browser
+	webbrowser.open_new_tab = lambda url: False
+
+	tmp = tempfile.mkdtemp()
+	results = {}
+	try:
+		print '{:<26} {:<48} {:>12} {:>9} {:>9} {:>9} {:>9}'.format('stage', 'input', 'size', 'time', 'memory', 'baseline', 'ratio')
+		for stage, label, size, func in itertools.chain(json_cases(args, font), graphml_cases(args), svg_cases(args, font, tmp)):
+			if not selected(stage, args):
+				continue
+			try:
+				t, m = min(time_and_memory(lambda: quiet(func)) for _ in range(args.repeat))
+			except RuntimeError as e:
+				print '{:<26} {:<48} {:>12} failed: {}'.format(stage, label[:48], size, str(e).strip().splitlines()[-1])
+				continue
+			key = '{} | {}'.format(stage, label)
+			results[key] = [round(t, 4), round(m, 1)]
+			if key in baseline:
+				ratio = t/baseline[key][0]
+				# (short stages vary more than the tolerance between runs)
+				flag = ' slower' if ratio > 1 + args.tolerance and t - baseline[key][0] > args.min_difference else ''
+				print '{:<26} {:<48} {:>12} {:>8.3f}s {:>7.1f}MB {:>8.3f}s {:>8.2f}x{}'.format(stage, label[:48], size, t, m, baseline[key][0], ratio, flag)
+			else:
+				print '{:<26} {:<48} {:>12} {:>8.3f}s {:>7.1f}MB {:>9} {:>9}'.format(stage, label[:48], size, t, m, '-', '-')
+	finally:
+		shutil.rmtree(tmp)
+
+	if args.save_baseline:
+		baseline.update(results)
+		with open(BASELINE, 'wb') as f:
+			json.dump(baseline, f, indent = 1, sort_keys = True)
+		print 'saved {} results to {}'.format(len(results), BASELINE)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--copies', type = int, default = 3, help = "Number of copies of the scaled-up layouts and svg files.")
+	parser.add_argument('--stages', nargs = '+', choices = STAGES, help = "Only run these stages.")
+	parser.add_argument('--inputs', nargs = '+', help = "Only run on the inputs with one of these strings in the name.")
+	parser.add_argument('--scaled_overlap', dest = 'scaled_overlap', action = 'store_true', help = "Also run get_paths with prevent_overlap on the scaled-up layouts.")
+	parser.add_argument('--model', metavar = 'model.xml', help = "SBML model of the editable svg files (with cbmpy), instead of the stand-in model.")
+	parser.add_argument('--repeat', type = int, default = 1)
+	parser.add_argument('--tolerance', type = float, default = 0.25, help = "Flag stages that are this fraction slower than the baseline.")
+	parser.add_argument('--min_difference', type = float, default = 0.05, help = "Only flag stages that are at least this many seconds slower than the baseline.")
+	parser.add_argument('--save_baseline', dest = 'save_baseline', action = 'store_true', help = "Store the results as the new baseline.")
+	args = parser.parse_args()
+	main(args)
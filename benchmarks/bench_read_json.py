@@ -0,0 +1,25 @@
+"""
+Benchmark readers.read_json_data on the example json files and on
+synthetically scaled-up versions of them.
+Usage: python benchmarks/bench_read_json.py [--edges 100000]
+"""
+import os
+import argparse
+from common import JSON_FILES, load_json, best_time, scale_json_layout
+from readers import read_json_data
+
+def main(args):
+	print '{:<45} {:>8} {:>10}'.format('file', 'edges', 'time (s)')
+	for file_name in JSON_FILES:
+		data = load_json(file_name)
+		name = os.path.basename(file_name)
+		for label, layout in [(name, data), (name + ' (scaled)', scale_json_layout(data, args.edges))]:
+			t, d = best_time(lambda: read_json_data(layout), args.repeat)
+			print '{:<45} {:>8} {:>10.4f}'.format(label[:45], len(d['edges']), t)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--edges', type = int, default = 100000, help = "Number of edges of the scaled-up layouts.")
+	parser.add_argument('--repeat', type = int, default = 3)
+	args = parser.parse_args()
+	main(args)
@@ -0,0 +1,60 @@
+"""
+Time transform.assign_grid_cells (snap_to_grid.py --unique) on the reaction
+and species nodes of the example graph files, on scaled-up copies of them and
+on crowded input (many points in a small area, so most points have to move
+far from their nearest cell), and check that every point gets its own cell
+at least the clearance away from the others.
+Usage: python benchmarks/bench_snap_grid.py [--nodes 20000] [--crowded 500 1000 2000] [--clearance 2 1]
+"""
+import os
+import argparse
+import numpy as np
+from common import GRAPHML_FILES, best_time
+from bench_graphml import scale_graph
+import readers
+from transform import pack_graph_coordinates, assign_grid_cells
+
+def check_cells(cells, grid, clearance):
+	""" True if all cells are distinct and at least the clearance apart """
+	ij = np.round(cells/np.asarray(grid, dtype=float)).astype(int)
+	taken = set(map(tuple, ij.tolist()))
+	if len(taken) != len(ij):
+		return False
+	cx, cy = clearance
+	for i, j in ij.tolist():
+		if any((i+di, j+dj) in taken for di in range(-cx+1, cx) for dj in range(-cy+1, cy) if (di, dj) != (0, 0)):
+			return False
+	return True
+
+def graph_coordinates(graph):
+	""" Coordinates of the reaction and species nodes of a graph (as in snap_to_grid) """
+	nodes = [n for n, attr in graph.node.items() if attr.get('node_type') != 'ctrl']
+	return pack_graph_coordinates(graph, nodes)[1]
+
+def main(args):
+	grid = [args.grid, args.grid]
+	cases = []
+	for file_name in GRAPHML_FILES:
+		graph = readers.read_graphml(file_name)
+		name = os.path.basename(file_name)
+		cases.append((name, graph_coordinates(graph)))
+		cases.append((name + ' (scaled)', graph_coordinates(scale_graph(graph, args.nodes))))
+	rnd = np.random.RandomState(0)
+	for n in args.crowded:
+		cases.append(('crowded (10 x 10 cells)', rnd.uniform(0, 10*args.grid, (n, 2))))
+
+	print '{:<40} {:>8} {:>10} {:>6}'.format('input (clearance {} {})'.format(*args.clearance), 'nodes', 'time (s)', 'ok')
+	for label, coords in cases:
+		t, cells = best_time(lambda: assign_grid_cells(coords, grid, (0, 0), args.clearance), args.repeat)
+		ok = check_cells(cells, grid, args.clearance)
+		print '{:<40} {:>8} {:>10.4f} {:>6}'.format(label[:40], len(coords), t, 'ok' if ok else 'FAILED')
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--nodes', type = int, default = 20000, help = "Number of nodes of the scaled-up graphs.")
+	parser.add_argument('--crowded', type = int, nargs = '+', default = [500, 1000, 2000], help = "Numbers of points of the crowded inputs (random points in an area of 10 x 10 cells).")
+	parser.add_argument('--grid', type = float, default = 10.0)
+	parser.add_argument('--clearance', type = int, nargs = 2, default = [1, 1])
+	parser.add_argument('--repeat', type = int, default = 1)
+	args = parser.parse_args()
+	main(args)
@@ -0,0 +1,114 @@
+"""
+Time of the path routing (svg_assembly.get_svgdata) of a synthetic map with
+one hub metabolite, without splitting the hub and with the split_hubs.py
+stage (copies or cofactors). Also checks the copies on the json example maps
+(split with each of --example_degree): no copy at the position of another
+node, the smallest distance between species labels at the same height (the
+width of the labels of get_svgdata) stays the same, and the paths of the
+split map can be drawn (get_svgdata).
+Usage: python benchmarks/bench_split_hubs.py [--reactions 25 50 100] [--max_degree 10] [--example_degree 2 3]
+"""
+import os
+import sys
+import argparse
+from PIL import ImageFont
+from common import ROOT, JSON_FILES, load_json, best_time
+from readers import read_json_data
+from svg_assembly import get_svgdata
+from split_hubs import split_hubs, hubs_to_cofactors, label_boxes, row_spacing
+
+def hub_layout(num_reactions):
+	"""
+	Layout dictionary (see readers.read_json_data) with a hub species on top,
+	a row of reactions below it that all consume the hub and a species per 
+	reaction (the product) below each reaction.
+	"""
+	d = {'edges': [], 'nodes': [], 'node_type': {}, 'edge_type': {}, 'extra_nodes': {}, 'pos': {}, 'label': {}, 'pathway': {}}
+
+	def add_node(n, node_type, pos):
+		d['nodes'].append(n)
+		d['node_type'][n] = node_type
+		d['pos'][n] = pos
+		d['label'][n] = n
+		d['pathway'][n] = 'Undefined'
+
+	def add_edge(e, edge_type):
+		d['edges'].append(e)
+		d['edge_type'][e] = edge_type
+		d['extra_nodes'][e] = []
+
+	add_node('hub', 'species', (1.5*num_reactions, 0.0))
+	for i in range(num_reactions):
+		r, s = 'R_{}'.format(i), 'M_{}'.format(i)
+		add_node(r, 'reaction', (3.0*i, -3.0))
+		add_node(s, 'species', (3.0*i, -6.0))
+		add_edge((r, 'hub'), 'substrate')
+		add_edge((r, s), 'product')
+	return d
+
+def route(d, font, cofactors = None):
+	return get_svgdata(d, font, 10.0, [20.0, 20.0], [20.0, 20.0], None, True, False, cofactors = cofactors)
+
+def check_copies(file_name, font, max_degree):
+	"""
+	Number of copies, whether they are all at free positions, whether the label
+	width is kept and the error of drawing the paths (None if they are drawn)
+	"""
+	d = read_json_data(load_json(file_name))
+	spacing = row_spacing(d)
+	split_hubs(d, max_degree, label_boxes(d, font, 10.0, [20.0, 20.0], None))
+	copies = [n for n in d['nodes'] if '_copy_' in n]
+	positions = [d['pos'][n] for n in d['nodes']]
+	free = all(positions.count(d['pos'][n]) == 1 for n in copies)
+	width = row_spacing(d) == spacing
+	try:
+		quiet(lambda: route(d, font))
+		error = None
+	except Exception as e:
+		error = e
+	return len(copies), free, width, error
+
+def quiet(func):
+	""" Run func without its output (the messages of get_paths) """
+	stdout = sys.stdout
+	sys.stdout = open(os.devnull, 'w')
+	try:
+		return func()
+	finally:
+		sys.stdout.close()
+		sys.stdout = stdout
+
+def main(args):
+	font = ImageFont.truetype(os.path.join(ROOT, 'fonts', 'Raleway', 'Raleway-Regular.ttf'), 1000)
+	print '{:<50} {:>7} {:>7} {:>15} {:>12} {:>8}'.format('example', 'degree', 'copies', 'free positions', 'label width', 'paths')
+	for file_name in JSON_FILES:
+		for max_degree in args.example_degree:
+			copies, free, width, error = check_copies(file_name, font, max_degree)
+			print '{:<50} {:>7} {:>7} {:>15} {:>12} {:>8}'.format(os.path.basename(file_name)[:50], max_degree, copies,
+				'yes' if free else 'NO', 'kept' if width else 'SMALLER', 'ok' if error is None else 'FAILED')
+			if error is not None:
+				print '  {!r}'.format(error)
+	print
+	print '{:>10} {:>12} {:>12} {:>12}'.format('reactions', 'hub', 'copies', 'cofactors')
+	for n in args.reactions:
+		t_hub, _ = best_time(lambda: route(hub_layout(n), font), args.repeat)
+		t_copy, _ = best_time(lambda: route(split_hubs(hub_layout(n), args.max_degree), font), args.repeat)
+
+		def cofactor_route():
+			d = hub_layout(n)
+			cofactors = hubs_to_cofactors(d, args.max_degree)
+			for r in cofactors:
+				for s in cofactors[r]:
+					d['edge_type'][(r, s)] = cofactors[r][s]['role']
+			return route(d, font, cofactors)
+		t_cof, _ = best_time(cofactor_route, args.repeat)
+		print '{:>10} {:>11.2f}s {:>11.2f}s {:>11.2f}s'.format(n, t_hub, t_copy, t_cof)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--reactions', type = int, nargs = '+', default = [25, 50, 100], help = "Number of reactions of the hub.")
+	parser.add_argument('--max_degree', type = int, default = 10, help = "Maximum number of edges of a species after splitting.")
+	parser.add_argument('--example_degree', type = int, nargs = '+', default = [2, 3], help = "Maximum numbers of edges of a species when splitting the example maps.")
+	parser.add_argument('--repeat', type = int, default = 1)
+	args = parser.parse_args()
+	main(args)
@@ -0,0 +1,122 @@
+"""
+Compare time and peak memory of building a Y7-sized final map (the elements
+that layout_final.main creates for each reaction and metabolite) with the pysvg
+element classes and the lightweight classes of lite_elements.py, and check that
+both give the same xml.
+Usage: python benchmarks/bench_svg_elements.py [--reactions 1300] [--species 1300]
+"""
+import argparse
+from common import time_and_memory
+from pysvg.core import TextContent
+from lite_elements import pysvg_elements, lite_elements
+
+def build_map(E, num_reactions, num_species):
+	""" Element trees of a map (same structure as the final maps of layout_final.py) """
+	elements = []
+	for i in range(num_reactions):
+		rid = 'r_{:04d}'.format(i)
+		x, y = 10.0 + (i % 50)*75, 10.0 + (i // 50)*75
+
+		G_gn = E.g()
+		G_gn.set_class('gene_expression')
+		C = E.circle(x, y, 10)
+		C.set_id('Y' + rid)
+		G_gn.addElement(C)
+		elements.append(G_gn)
+
+		G_rn = E.g()
+		G_rn.set_id(rid)
+		G_rn.set_style('fill:none; stroke-linecap:round; stroke-linejoin:round')
+		for marker in ['substrate', 'substrate', 'product', 'product']:
+			P = E.path('m {},{} c 0,10 5,10 5,20'.format(x, y))
+			P.set_id(rid)
+			P.set_class(marker)
+			G_rn.addElement(P)
+		C = E.circle(x, y, 5)
+		C.set_id(rid)
+		C.set_style('fill:#ffffff; stroke-dasharray:none')
+		G_rn.addElement(C)
+		for cls, d in [('reversible', 'm {},{} h 2 m -2,2 h 2'), ('irreversible', 'm {},{} 2,1 -2,1'), ('inactive', 'm {},{} 3,3 m -3,0 3,-3')]:
+			P = E.path(d.format(x-1, y-1))
+			P.set_id(rid)
+			P.set_class(cls)
+			P.set_style('stroke:#000000; stroke-width:1.0; stroke-dasharray:none')
+			G_rn.addElement(P)
+		for cls, content in [('fluxvalue', 'ReactionValue:abs2:'), ('FVAspan', 'ReactionSpan:2:')]:
+			T = E.text(content + rid, x, y)
+			T.set_id(rid)
+			T.set_class(cls)
+			T.set_style('font-size:8px; fill:black; stroke-opacity:0')
+			G_rn.addElement(T)
+		elements.append(G_rn)
+
+		G_nfo = E.g()
+		G_nfo.set_id(rid)
+		G_nfo.set_class('annotations')
+		A = E.a()
+		A.set_target('_blank')
+		A.set_xlink_href('http://identifiers.org/kegg.reaction/R00200')
+		A.addElement(E.circle(x, y, 5))
+		G_nfo.addElement(A)
+		G_ttp = E.g()
+		G_ttp.set_class('tooltip')
+		shadow = E.rect(x+14, y-51, width = 150, height = 110, rx = 5)
+		shadow.set_style('fill:#000000; stroke:#000000; stroke-width:1.0; opacity:0.1; stroke-dasharray:none')
+		G_ttp.addElement(shadow)
+		box = E.rect(x+10, y-55, width = 150, height = 110, rx = 5)
+		box.set_id(rid)
+		box.set_style('fill:#ffffff; stroke-width:1.0; stroke-dasharray:none')
+		G_ttp.addElement(box)
+		for k, content in enumerate(['reaction name', 'ID: ' + rid, 'kegg.reaction:R00200', 'Genes: YAL001C',
+				'ReactionValue:6:' + rid, 'min: ReactionMinValue:6:' + rid, 'max: ReactionMaxValue:6:' + rid]):
+			T = E.text(content, x+15, y-42.5 + 15*k)
+			T.set_style('fill:black; font-size:10px; stroke-opacity:0')
+			G_ttp.addElement(T)
+		G_nfo.addElement(G_ttp)
+		elements.append(G_nfo)
+
+	for i in range(num_species):
+		sid = 's_{:04d}'.format(i)
+		x, y = 40.0 + (i % 50)*75, 40.0 + (i // 50)*75
+		T = E.text('metabolite ' + sid, x, y)
+		T.set_id(sid)
+		T.set_style('font-size:10px;')
+		elements.append(T)
+
+		G_nfo = E.g()
+		G_nfo.set_class('annotations')
+		G_ttp = E.g()
+		G_ttp.set_class('tooltip')
+		for dx, dy, style in [(-2.5, -12.5, 'fill:#ffffff; stroke:none'), (4, 9, 'fill:#000000; opacity:0.1'), (0, 5, 'fill:#ffffff; stroke:#000000')]:
+			R = E.rect(x+dx, y+dy, width = 160, height = 175, rx = 5)
+			R.set_style(style)
+			G_ttp.addElement(R)
+		G_ttp.addElement(TextContent(' '))
+		for k in range(8):
+			T = E.text('r_{:04d} 1 x ReactionValue:6:r_{:04d}'.format(k, k), x+5, y+97.5 + 15*k)
+			T.set_style('fill:black; font-size:10px')
+			G_ttp.addElement(T)
+		G_nfo.addElement(G_ttp)
+		elements.append(G_nfo)
+	return elements
+
+def build_xml(E, num_reactions, num_species):
+	return ''.join(e.getXML() for e in build_map(E, num_reactions, num_species))
+
+def main(args):
+	if build_xml(pysvg_elements, 50, 50) != build_xml(lite_elements, 50, 50):
+		print 'ERROR: the lightweight elements give different xml'
+		return
+	print 'same xml: yes'
+	print '{:<20} {:>10} {:>10} {:>10} {:>10}'.format('', 'build', 'memory', 'getXML', 'memory')
+	for name, E in [('pysvg', pysvg_elements), ('lite', lite_elements)]:
+		t1, m1 = time_and_memory(lambda: build_map(E, args.reactions, args.species))
+		t2, m2 = time_and_memory(lambda: build_xml(E, args.reactions, args.species))
+		print '{:<20} {:>9.2f}s {:>8.0f}MB {:>9.2f}s {:>8.0f}MB'.format(name, t1, m1, t2 - t1, m2)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--reactions', type = int, default = 1300, help = "Number of reactions of the map.")
+	parser.add_argument('--species', type = int, default = 1300, help = "Number of metabolite labels of the map.")
+	args = parser.parse_args()
+	main(args)
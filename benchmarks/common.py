@@ -0,0 +1,103 @@
+"""
+Shared helpers for the benchmark scripts: import path set-up, timing and
+synthetic scaling of the example layouts.
+"""
+import os
+import sys
+import imp
+import json
+import glob
+import time
+import math
+import resource
+import traceback
+import multiprocessing
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'modules'))
+
+try:
+	import cbmpy
+except ImportError:
+	# the readers module imports cbmpy, but the layout readers don't use it
+	sys.modules['cbmpy'] = imp.new_module('cbmpy')
+
+JSON_FILES = sorted(glob.glob(os.path.join(ROOT, 'json_files', '*.json')))
+GRAPHML_FILES = sorted(glob.glob(os.path.join(ROOT, 'graphml_files', '*.graphml')))
+
+def load_json(file_name):
+	with open(file_name) as f:
+		return json.load(f)
+
+def best_time(func, repeat = 3):
+	""" Run func repeat times, return the fastest wall time (seconds) and the last result """
+	best = None
+	for _ in range(repeat):
+		t0 = time.time()
+		result = func()
+		t = time.time() - t0
+		if best is None or t < best:
+			best = t
+	return best, result
+
+def scale_json_layout(data, num_edges):
+	"""
+	Make a bigger layout (Nicholas's json format) by placing copies of the
+	graph next to each other until it has at least num_edges edges.
+	"""
+	graph = data['graph']
+	num_nodes = max(int(n) for n in graph['properties']['type']['nodesValues']) + 1
+	copies = int(math.ceil(num_edges/float(len(graph['edges']))))
+	layout = graph['properties']['viewLayout']
+	x = [float(v.strip('()').split(',')[0]) for v in layout['nodesValues'].values()]
+	width = max(x) - min(x) + 10
+
+	def shift(value, dx):
+		points = [p.strip('() ').split(',') for p in value.split('), (')]
+		points = ['({},{},{})'.format(float(p[0]) + dx, p[1], p[2]) for p in points]
+		if value.startswith('(('):
+			return '({})'.format(', '.join(points))
+		return points[0]
+
+	properties = {}
+	for name, prop in graph['properties'].items():
+		properties[name] = dict((k, v) for k, v in prop.items() if not k.endswith('Values'))
+		move = shift if name == 'viewLayout' else lambda v, dx: v
+		if 'nodesValues' in prop:
+			properties[name]['nodesValues'] = dict((str(int(n) + i*num_nodes), move(v, i*width))
+				for i in range(copies) for n, v in prop['nodesValues'].items())
+		if 'edgesValues' in prop:
+			properties[name]['edgesValues'] = dict((str(int(e) + i*len(graph['edges'])), move(v, i*width))
+				for i in range(copies) for e, v in prop['edgesValues'].items())
+
+	edges = [[e[0] + i*num_nodes, e[1] + i*num_nodes] for i in range(copies) for e in graph['edges']]
+	return {'graph': {'edges': edges, 'properties': properties}}
+
+def _measure(func, conn):
+	rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	t0 = time.time()
+	try:
+		func()
+	except Exception:
+		conn.send(traceback.format_exc())
+		conn.close()
+		return
+	t = time.time() - t0
+	rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	conn.send((t, (rss1 - rss0)/1024.))
+	conn.close()
+
+def time_and_memory(func):
+	"""
+	Run func in a separate process. Return the wall time (seconds) and the 
+	increase of the peak memory use (resident set size, MB) of that process.
+	An exception in func is raised as a RuntimeError with its traceback.
+	"""
+	parent, child = multiprocessing.Pipe()
+	p = multiprocessing.Process(target = _measure, args = (func, child))
+	p.start()
+	result = parent.recv()
+	p.join()
+	if isinstance(result, basestring):
+		raise RuntimeError(result)
+	return result
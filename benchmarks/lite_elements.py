@@ -0,0 +1,210 @@
+"""
+Lightweight versions of the pysvg element classes (g, text, path, circle, rect,
+a and svg), for svg documents that are only written. They have the same
+constructors and set_*/get_* methods as the pysvg classes and getXML gives the
+same xml, but the elements have no __dict__ (__slots__) and keep their
+attributes in two short lists instead of a dictionary per element.
+layout_final.py writes the final map with the templates of svg_lite.py
+instead; these classes are used by bench_svg_elements.py and
+bench_map_writer.py, to compare the element writers with the templates.
+"""
+from pysvg import structure, shape, linking
+from pysvg import text as pysvg_text
+from pysvg.core import TextContent
+from svg_lite import quote_attrib
+
+# order in which a dictionary iterates over a sequence of inserted keys, the
+# attributes are written in the same order as pysvg (which uses a dictionary)
+key_orders = {}
+
+class Element(object):
+	""" Base class of the lightweight elements (see pysvg.core.BaseElement) """
+	__slots__ = ('_elementName', '_keys', '_values', '_subElements')
+
+	def __init__(self, elementName):
+		self._elementName = elementName
+		self._keys = []
+		self._values = []
+		self._subElements = []
+
+	def setAttribute(self, attribute_name, attribute_value):
+		if attribute_name in self._keys:
+			self._values[self._keys.index(attribute_name)] = attribute_value
+		else:
+			self._keys.append(attribute_name)
+			self._values.append(attribute_value)
+
+	def getAttribute(self, attribute_name):
+		if attribute_name in self._keys:
+			return self._values[self._keys.index(attribute_name)]
+		return None
+
+	def setKWARGS(self, **kwargs):
+		for key in kwargs.keys():
+			getattr(self, 'set_' + key)(kwargs[key])
+
+	def appendTextContent(self, text):
+		self._subElements.append(TextContent(text))
+
+	def addElement(self, element):
+		self._subElements.append(element)
+
+	def getElementAt(self, pos):
+		return self._subElements[pos]
+
+	def insertElementAt(self, element, pos):
+		return self._subElements.insert(pos, element)
+
+	def getXML(self):
+		keys = self._keys
+		values = self._values
+		order = key_orders.get(tuple(keys))
+		if order is None:
+			order = key_orders[tuple(keys)] = [keys.index(k) for k in dict.fromkeys(keys)]
+		xml = ['<', self._elementName, ' ']
+		for i in order:
+			value = values[i]
+			if value != None:
+				value = str(value)
+				if '&' in value or '<' in value or '>' in value or '"' in value:
+					value = quote_attrib(value)
+				xml.append(keys[i] + '="' + value + '" ')
+		if self._subElements:
+			xml.append(' >\n')
+			for e in self._subElements:
+				xml.append(str(e.getXML()))
+			xml.append('</' + self._elementName + '>\n')
+		else:
+			xml.append(' />\n')
+		return ''.join(xml)
+
+	def wrap_xml(self, xml, encoding = 'ISO-8859-1', standalone = 'no'):
+		header = '''<?xml version="1.0" encoding="%s" standalone="%s"?>''' % (encoding, standalone)
+		return header + xml
+
+	def save(self, filename, encoding = 'ISO-8859-1', standalone = 'no'):
+		with open(filename, 'w') as f:
+			f.write(self.wrap_xml(self.getXML(), encoding, standalone))
+
+def attribute_setter(key):
+	def setter(self, value):
+		if key in self._keys:
+			self._values[self._keys.index(key)] = value
+		else:
+			self._keys.append(key)
+			self._values.append(value)
+	return setter
+
+def attribute_getter(key):
+	def getter(self):
+		if key in self._keys:
+			return self._values[self._keys.index(key)]
+		return None
+	return getter
+
+def add_attribute_methods(cls, pysvg_class):
+	"""
+	Add the set_*/get_* methods of a pysvg class to a lightweight class. The
+	attribute name of each method is found by calling the pysvg setter on an
+	empty element (e.g. set_xlink_href sets 'xlink:href').
+	"""
+	marker = object()
+	for name in dir(pysvg_class):
+		if not name.startswith('set_') or hasattr(cls, name):
+			continue
+		element = pysvg_class()
+		element._attributes = {}
+		try:
+			getattr(element, name)(marker)
+		except Exception:
+			continue
+		keys = [k for k, v in element._attributes.items() if v is marker]
+		if len(keys) == 1:
+			setattr(cls, name, attribute_setter(keys[0]))
+			setattr(cls, 'get_' + name[4:], attribute_getter(keys[0]))
+	return cls
+
+class g(Element):
+	__slots__ = ()
+	def __init__(self, **kwargs):
+		Element.__init__(self, 'g')
+		self.setKWARGS(**kwargs)
+
+class a(Element):
+	__slots__ = ()
+	def __init__(self, target = None):
+		self._elementName = 'a'
+		self._keys = ['target']
+		self._values = [target]
+		self._subElements = []
+
+class path(Element):
+	__slots__ = ()
+	def __init__(self, pathData = "", pathLength = None, style = None, focusable = None, **kwargs):
+		if pathData != '' and not pathData.endswith(' '):
+			pathData += ' '
+		self._elementName = 'path'
+		self._keys = ['d']
+		self._values = [pathData]
+		self._subElements = []
+		if style != None:
+			self.set_style(style)
+		if kwargs:
+			self.setKWARGS(**kwargs)
+
+class circle(Element):
+	__slots__ = ()
+	def __init__(self, cx = None, cy = None, r = None, **kwargs):
+		self._elementName = 'circle'
+		self._keys = ['cx', 'cy', 'r']
+		self._values = [cx, cy, r]
+		self._subElements = []
+		if kwargs:
+			self.setKWARGS(**kwargs)
+
+class rect(Element):
+	__slots__ = ()
+	def __init__(self, x = None, y = None, width = None, height = None, rx = None, ry = None, **kwargs):
+		self._elementName = 'rect'
+		self._keys = ['x', 'y', 'height', 'width', 'rx', 'ry']
+		self._values = [x, y, height, width, rx, ry]
+		self._subElements = []
+		if kwargs:
+			self.setKWARGS(**kwargs)
+
+class text(Element):
+	__slots__ = ()
+	def __init__(self, content = None, x = None, y = None, dx = None, dy = None, rotate = None, textLength = None, lengthAdjust = None, **kwargs):
+		self._elementName = 'text'
+		self._keys = ['x', 'y', 'dx', 'dy', 'rotate', 'textLength', 'lengthAdjust']
+		self._values = [x, y, dx, dy, rotate, textLength, lengthAdjust]
+		self._subElements = [TextContent(content)] if content != None else []
+		if kwargs:
+			self.setKWARGS(**kwargs)
+
+class svg(Element):
+	__slots__ = ()
+	def __init__(self, x = None, y = None, width = None, height = None, **kwargs):
+		Element.__init__(self, 'svg')
+		self.set_xmlns('http://www.w3.org/2000/svg')
+		self.set_xmlns_xlink('http://www.w3.org/1999/xlink')
+		self.set_version('1.1')
+		self.set_x(x)
+		self.set_y(y)
+		self.set_height(height)
+		self.set_width(width)
+		self.setKWARGS(**kwargs)
+
+for cls, pysvg_class in [(g, structure.g), (a, linking.a), (path, shape.path), (circle, shape.circle),
+		(rect, shape.rect), (text, pysvg_text.text), (svg, structure.svg)]:
+	add_attribute_methods(cls, pysvg_class)
+
+class Elements(object):
+	""" Element classes for building a document, by element name """
+	def __init__(self, **classes):
+		for name, cls in classes.items():
+			setattr(self, name, cls)
+
+pysvg_elements = Elements(g = structure.g, a = linking.a, path = shape.path, circle = shape.circle,
+	rect = shape.rect, text = pysvg_text.text, svg = structure.svg)
+lite_elements = Elements(g = g, a = a, path = path, circle = circle, rect = rect, text = text, svg = svg)
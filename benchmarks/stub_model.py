@@ -0,0 +1,131 @@
+"""
+Stand-in for a cbmpy model, for running layout_final.py and visualize.py
+offline (without cbmpy or a solver). The model is made from the ids of an
+editable svg file (see layout_final.get_layout_from_easy_edit): a reaction
+for each reaction id, a species for each species id, and a reagent for each
+reaction arrow. Roles, coefficients, bounds, genes and flux values are
+pseudo-random, but the same in every run.
+"""
+import re
+import zlib
+import random
+from readers import copy_pattern
+
+id_pattern = re.compile(r'\sid="([^"]+)"')
+
+def _random(key):
+	""" Random generator seeded with a string (same numbers in every run) """
+	return random.Random(zlib.crc32(key))
+
+class StubReagent:
+	def __init__(self, sid, role, coefficient):
+		self.sid = sid
+		self.role = role
+		self.coefficient = coefficient
+
+	def getSpecies(self):
+		return self.sid
+
+class StubReaction:
+	def __init__(self, rid):
+		self.id = rid
+		self.name = 'reaction ' + rid
+		self.reagents = []
+		rnd = _random(rid)
+		self.bounds = rnd.choice([(0.0, 1000.0), (-1000.0, 1000.0), (-1000.0, 1000.0), (0.0, 0.0)])
+		self.value = rnd.choice([0.0, rnd.uniform(-10.0, 10.0)]) if self.bounds != (0.0, 0.0) else 0.0
+
+	def getLowerBound(self):
+		return self.bounds[0]
+
+	def getUpperBound(self):
+		return self.bounds[1]
+
+class StubSpecies:
+	def __init__(self, sid):
+		self.id = sid
+		self.name = 'species ' + sid
+
+class StubGPR:
+	def __init__(self, genes):
+		self.generefs = genes
+		self.assoc = ' or '.join(genes)
+
+class StubModel:
+	"""
+	The parts of a cbmpy model that layout_final.py and visualize.py use:
+	reactions (with reagents and bounds), species, getGPRforReaction and
+	getReactionValues. annotations gives the annotations of parse_annotations
+	(which needs a solver).
+	"""
+	def __init__(self):
+		self.reactions = []
+		self.species = []
+		self._reactions = {}
+		self._species = {}
+
+	def reaction(self, rid):
+		if rid not in self._reactions:
+			self._reactions[rid] = StubReaction(rid)
+			self.reactions.append(self._reactions[rid])
+		return self._reactions[rid]
+
+	def add_species(self, sid):
+		if sid not in self._species:
+			self._species[sid] = StubSpecies(sid)
+			self.species.append(self._species[sid])
+		return self._species[sid]
+
+	def add_reagent(self, rid, sid):
+		R = self.reaction(rid)
+		self.add_species(sid)
+		if sid not in [rg.sid for rg in R.reagents]:
+			rnd = _random(rid + sid)
+			role = rnd.choice(['substrate', 'product'])
+			coefficient = rnd.choice([1, 1, 2])
+			R.reagents.append(StubReagent(sid, role, -coefficient if role == 'substrate' else coefficient))
+
+	def getGPRforReaction(self, rid):
+		genes = ['Y{}_{}'.format(rid, k) for k in range(_random(rid + 'genes').choice([0, 1, 1, 2, 3]))]
+		return StubGPR(genes) if genes else None
+
+	def getReactionValues(self):
+		return dict((R.id, R.value) for R in self.reactions)
+
+	def annotations(self):
+		""" Annotations as made by layout_final.parse_annotations """
+		stoichiometry = {}
+		for R in self.reactions:
+			for rg in R.reagents:
+				stoichiometry.setdefault(rg.sid, []).append((R.id, rg.coefficient))
+		annotations = {}
+		for R in self.reactions:
+			gpr = self.getGPRforReaction(R.id)
+			annotations[R.id] = {'link': 'http://identifiers.org/kegg.reaction/' + R.id, 'DBrefs': {'kegg.reaction': [R.id]},
+				'GENE_ASSOCIATION': gpr.assoc if gpr else None}
+		for S in self.species:
+			annotations[S.id] = {'link': None, 'DBrefs': {'kegg.compound': [S.id]}, 'formula': 'C6H12O6',
+				'stoichiometry': sorted(stoichiometry.get(S.id, []), key = lambda k: abs(self._reactions[k[0]].value), reverse = True)}
+		return annotations
+
+def stub_model_from_svg(file_name, r_suffix = 'r_', s_suffix = 's_'):
+	""" StubModel with the reactions and species of an editable svg file """
+	with open(file_name) as f:
+		ids = id_pattern.findall(f.read())
+	model = StubModel()
+	path_pattern = re.compile('path_({}.+?)_?({}.+)'.format(r_suffix, s_suffix))
+	for e_id in ids:
+		match_path = path_pattern.match(e_id)
+		if match_path:
+			model.add_reagent(copy_pattern.sub('', match_path.group(1)), copy_pattern.sub('', match_path.group(2)))
+		elif e_id.startswith(s_suffix):
+			model.add_species(re.sub('{}.+$'.format(r_suffix), '', copy_pattern.sub('', e_id)))
+		elif e_id.startswith(r_suffix):
+			model.reaction(copy_pattern.sub('', e_id))
+	# labels of species without reaction arrows (layout_final.py needs a reaction
+	# for the tooltip of each species)
+	reagents = set(rg.sid for R in model.reactions for rg in R.reagents)
+	for S in list(model.species):
+		if S.id not in reagents:
+			model.add_reagent(r_suffix + 'stub', S.id)
+	return model
@@ -0,0 +1,206 @@
+"""
+Render many maps in one go. The font, sbml models and annotations are loaded
+once and shared by all maps, the maps are rendered in a pool of worker
+processes, and the time of each stage is reported per map.
+
+The maps are listed in a manifest (json), e.g.:
+{
+  "output_dir": "batch_maps",
+  "args": ["--font_file", "fonts/Raleway/Raleway-Regular.ttf"],
+  "maps": [
+    {"input": "json_files/iIT341_TCA cycle.json", "args": ["--normalize"]},
+    {"input": "graphml_files/Y7thf.graphml", "args": ["-cof", "models/Y7.xml"],
+     "final": ["models/Y7.xml", "r_", "s_"]}
+  ]
+}
+"input" is a layout file; json and npz files are rendered with json_to_svg.py,
+other (graph) files with graph_to_svg.py. "args" are the command line flags
+of those scripts ("args" at the top level are used for all maps). If "final"
+is given (the positional arguments and flags of layout_final.py, without the
+svg file), the final svg with annotations is made as well.
+Layout files and directories can also be given on the command line.
+"""
+import os
+import sys
+import json
+import time
+import glob
+import shlex
+import argparse
+import traceback
+import multiprocessing
+import cbmpy as cbm
+from PIL import ImageFont
+import json_to_svg
+import graph_to_svg
+import layout_final
+from timing import StageTimer
+from readers import get_model_index
+from svg_output import svg_file_name
+
+# resources shared by the maps (per process), keys are file names
+fonts = {}
+models = {}
+annotations = {}
+
+def get_font(file_name):
+	if file_name not in fonts:
+		fonts[file_name] = ImageFont.truetype(file_name, 1000)
+	return fonts[file_name]
+
+def get_model(file_name):
+	if file_name not in models:
+		models[file_name] = cbm.CBRead.readSBML3FBC(file_name)
+		# lookup tables of the model, also shared by the maps
+		get_model_index(models[file_name])
+	return models[file_name]
+
+def get_annotations(file_name):
+	if file_name not in annotations:
+		annotations[file_name] = layout_final.parse_annotations(get_model(file_name))
+	return annotations[file_name]
+
+def layout_script(file_name):
+	""" Module that renders a layout file """
+	if file_name.lower().endswith(('.json', '.npz')):
+		return json_to_svg
+	return graph_to_svg
+
+def read_manifest(file_name):
+	""" List of (input, args, final args) tuples and the output directory of a manifest file """
+	with open(file_name) as f:
+		manifest = json.load(f)
+	common = manifest.get('args', [])
+	maps = [(m['input'], common + m.get('args', []), m.get('final')) for m in manifest['maps']]
+	return maps, manifest.get('output_dir')
+
+def expand_inputs(inputs):
+	""" Layout files in a list of files and directories """
+	files = []
+	for name in inputs:
+		if os.path.isdir(name):
+			files += sorted(glob.glob(os.path.join(name, '*.json')) + glob.glob(os.path.join(name, '*.graphml')))
+		else:
+			files.append(name)
+	return files
+
+def make_jobs(maps, output_dir):
+	"""
+	Parse the arguments of each map.
+	Output - list of (name, script name, args, layout_final args) tuples.
+	"""
+	jobs = []
+	for i, (file_name, map_args, final_args) in enumerate(maps):
+		name = os.path.splitext(os.path.basename(file_name))[0].replace(' ', '_')
+		script = layout_script(file_name)
+		svg_name = os.path.join(output_dir, 'editable', name + '.svg')
+		args = script.argument_parser().parse_args([file_name, '--svg_name', svg_name] + map_args)
+
+		if final_args is not None:
+			final_args = layout_final.argument_parser().parse_args(
+				[svg_file_name(args.svg_name, args.compress)] + final_args + ['--output_dir', output_dir, '--svg_name', name + '.svg'])
+			final_args.open_browser = False
+		jobs.append((name, script.__name__, args, final_args))
+	return jobs
+
+def load_resources(jobs):
+	""" Load the fonts and models of all maps """
+	for _, _, args, final_args in jobs:
+		get_font(args.font_file)
+		if args.add_cofactors_from_sbml:
+			get_model(' '.join(args.add_cofactors_from_sbml))
+		if final_args is not None:
+			get_font(final_args.font_file)
+			get_model(final_args.SBML_file)
+
+def render_map(job):
+	"""
+	Render one map with the shared resources.
+	Output - (name, list of (stage, seconds) tuples, error message or None).
+	"""
+	name, script_name, args, final_args = job
+	timer = StageTimer()
+	try:
+		script = sys.modules[script_name]
+		svg_dir = os.path.dirname(args.svg_name)
+		if svg_dir and not os.path.isdir(svg_dir):
+			try:
+				os.makedirs(svg_dir)
+			except OSError:
+				# created by another worker
+				pass
+		model = get_model(' '.join(args.add_cofactors_from_sbml)) if args.add_cofactors_from_sbml else None
+		script.main(args, font = get_font(args.font_file), model = model, timer = timer)
+
+		if final_args is not None:
+			with timer.stage('final_annotations'):
+				map_annotations = None if final_args.annotations else get_annotations(final_args.SBML_file)
+			layout_final.main(final_args, get_model(final_args.SBML_file), get_font(final_args.font_file), map_annotations, timer)
+		return name, timer.items(), None
+	except Exception:
+		return name, timer.items(), traceback.format_exc()
+
+def print_timings(results):
+	""" Table with the time of each stage per map """
+	stages = []
+	for _, timings, _ in results:
+		stages += [s for s, _ in timings if s not in stages]
+	print
+	print '{:<40}'.format('map') + ''.join(' {:>10}'.format(s[:10]) for s in stages) + ' {:>10}'.format('total')
+	for name, timings, error in results:
+		t = dict(timings)
+		print '{:<40}'.format(name[:40]) + ''.join(
+			' {:>10.3f}'.format(t[s]) if s in t else ' {:>10}'.format('-') for s in stages) + \
+			' {:>10.3f}'.format(sum(t.values())) + ('  FAILED' if error else '')
+
+def main(args):
+	maps = []
+	output_dir = args.output_dir
+	if args.manifest:
+		maps, manifest_dir = read_manifest(args.manifest)
+		output_dir = output_dir or manifest_dir
+	extra_args = shlex.split(args.args) if args.args else []
+	maps += [(f, extra_args, None) for f in expand_inputs(args.inputs)]
+	output_dir = output_dir or 'batch_maps'
+	if not maps:
+		print 'No maps to render, give a manifest or layout files.'
+		return
+
+	t0 = time.time()
+	jobs = make_jobs(maps, output_dir)
+	load_resources(jobs)
+	t_resources = time.time() - t0
+
+	if args.processes == 1:
+		results = [render_map(job) for job in jobs]
+	else:
+		# workers are forked after loading the resources, so they share them
+		pool = multiprocessing.Pool(args.processes)
+		results = pool.map(render_map, jobs, chunksize = 1)
+		pool.close()
+		pool.join()
+
+	for name, _, error in results:
+		if error:
+			print 'ERROR in map', name
+			print error
+
+	print_timings(results)
+	print
+	print 'loading fonts and models: {:.3f}s, total wall time: {:.3f}s'.format(t_resources, time.time() - t0)
+
+	if args.timings:
+		with open(args.timings, 'wb') as f:
+			json.dump({'resources': t_resources, 'maps': [
+				{'name': name, 'stages': timings, 'error': error} for name, timings, error in results]}, f, indent = 1)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Render many maps with shared resources (see batch_maps.py for the manifest format).")
+	parser.add_argument('inputs', nargs = '*', metavar = 'json_files', help = "Layout files or directories with layout files (json/graphml).")
+	parser.add_argument('--manifest', '-m', metavar = 'maps.json', help = "Manifest with the maps and their arguments.")
+	parser.add_argument('--args', metavar = '"--normalize -s 20"', help = "Command line flags for the layout files given on the command line (use --args=\"...\" if the flags start with a dash).")
+	parser.add_argument('--output_dir', '-o', help = "Directory for the output svg files (default: from the manifest or 'batch_maps').")
+	parser.add_argument('--processes', '-p', type = int, default = multiprocessing.cpu_count(), help = "Number of worker processes (1: render in this process).")
+	parser.add_argument('--timings', metavar = 'timings.json', help = "Save the stage timings in a json file.")
+	args = parser.parse_args()
+	main(args)
@@ -0,0 +1,39 @@
+import sys
+import argparse
+from readers import read_layout_file, read_graphml, read_graph
+from writers import write_graphml, write_layout_npz, write_json_layout
+from json_to_graphml import layout_to_graph
+
+def read_any(file_name, mmap_mode = False):
+	""" Read a json, graphml or binary (npz) layout file to a dictionary with layout info """
+	if file_name.lower().endswith('.graphml'):
+		return read_graph(read_graphml(file_name))
+	return read_layout_file(file_name, mmap_mode)
+
+def write_any(d, file_name):
+	""" Write a dictionary with layout info to a json, graphml or binary (npz) layout file """
+	ext = file_name.lower().split('.')[-1]
+	if ext == 'npz':
+		write_layout_npz(d, file_name)
+	elif ext == 'graphml':
+		write_graphml(layout_to_graph(d), file_name)
+	elif ext == 'json':
+		write_json_layout(d, file_name)
+	else:
+		print "Output format not supported. Supported fileformats: npz, graphml, json"
+		sys.exit(1)
+
+def main(args):
+	file_name = ' '.join(args.layout_file)
+	d = read_any(file_name, args.mmap)
+	write_any(d, args.output)
+	print 'layout saved in', args.output
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Convert layout files between json (Nicholas's output), graphml and the binary layout format (npz).")
+	parser.add_argument('layout_file', metavar = 'file_name.json', nargs = '+', help = "Input layout file (.json, .graphml or .npz).")
+	parser.add_argument('--output', '-o', default = 'layout.npz', help = "Output layout file, the format is based on the extension (.npz, .graphml or .json).")
+	parser.add_argument('--mmap', dest = 'mmap', action = 'store_true', help = "Memory-map binary (npz) input files instead of reading them.")
+	parser.set_defaults(mmap = False)
+	args = parser.parse_args()
+	main(args)
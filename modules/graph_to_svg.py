@@ -3,7 +3,14 @@ import argparse
 import networkx as nx
 from PIL import ImageFont
 from svg_assembly import get_svgdata, get_svgdoc
-from readers import read_graph, get_cofactors_from_sbml
+from readers import read_graph, read_graphml, read_layout_npz, get_cofactors_from_sbml
+from writers import write_layout_npz
+from split_hubs import split_hubs, label_boxes, hubs_to_cofactors, add_cofactors
+from json_to_graphml import layout_to_graph
+from snap_to_grid import snap_to_grid
+from svgdata_cache import svgdata_key, load_svgdata, save_svgdata
+from timing import NoTimer, add_profile_arguments, profile_timer, profile_report
+from svg_output import save_svgdoc
 
 def compatible_graph(graph):
 	""" Check node attributes """
@@ -36,14 +43,11 @@ def compatible_graph(graph):
 
 	return compatible
 
-def main(args):
-	
-	file_name = ' '.join(args.graph_file)
-	
-	# read graph file to networkx.DiGraph object
+def read_graph_file(file_name):
+	""" Read graph file to networkx.DiGraph object (format based on file extension) """
 	ext = file_name.split('.')[-1]
 	if ext == 'graphml':
-		graph = nx.read_graphml(file_name)
+		graph = read_graphml(file_name)
 	elif ext == 'gml':
 		graph = nx.read_gml(file_name)
 	elif ext == 'gexf':
@@ -76,24 +80,68 @@ def main(args):
 		if not 'label' in graph.node[n].keys():
 			graph.node[n]['label'] = n
 
-	if compatible_graph(graph):
-		# get dictionary with layout info
+	return graph
+
+def create_svgdata(args, file_name, font = None, model = None, timer = NoTimer()):
+	"""
+	Read the graph, font and model and get the data to assemble the svg file
+	(None if the graph is incompatible). A font (ImageFont) and model (cbmpy)
+	that are already loaded can be passed to skip reading them; timer records
+	the time of each stage.
+	"""
+
+	with timer.stage('layout'):
+		if file_name.lower().endswith('.npz'):
+			# binary layout file (see json_to_graphml.py)
+			graph = layout_to_graph(read_layout_npz(file_name))
+		else:
+			# read graph file to networkx.DiGraph object
+			graph = read_graph_file(file_name)
+
+		# align nodes with a grid (in memory, the graph file is not changed)
+		if args.grid:
+			snap_to_grid(graph, args.grid, args.grid_offset, args.ctrl_grid, unique = args.unique, clearance = args.clearance)
+
+	if not compatible_graph(graph):
+		return None
+
+	# get dictionary with layout info
+	with timer.stage('layout'):
 		d = read_graph(graph)
+		if args.save_layout:
+			write_layout_npz(d, args.save_layout)
 
-		# get font
+	# get font
+	if font is None:
 		font = ImageFont.truetype(args.font_file, 1000)
 
-		# add cofactors
+	# split hub metabolites (or draw them as cofactors)
+	hub_cofactors = None
+	if args.split_hubs:
+		with timer.stage('hubs'):
+			if args.hub_mode == 'cofactor':
+				hub_cofactors = hubs_to_cofactors(d, args.split_hubs)
+			else:
+				split_hubs(d, args.split_hubs, label_boxes(d, font, args.font_size, args.scale, args.padding_labels))
+
+	# add cofactors
+	with timer.stage('cofactors'):
 		if args.add_cofactors_from_sbml:
 			sbml_file = ' '.join(args.add_cofactors_from_sbml)
-			cofactors = get_cofactors_from_sbml(d, sbml_file)
+			cofactors = get_cofactors_from_sbml(d, sbml_file, model)
 			for r in cofactors:
 				for s in cofactors[r]:
 					d['edge_type'][(r,s)]=cofactors[r][s]['role']
 		else:
 			cofactors = None
-		
-		# get the data to assemble the svg file (editable version)
+		if hub_cofactors:
+			cofactors = add_cofactors(cofactors, hub_cofactors)
+			for r in hub_cofactors:
+				for s in hub_cofactors[r]:
+					d['edge_type'][(r,s)]=cofactors[r][s]['role']
+	
+	# get the data to assemble the svg file (editable version)
+	with timer.stage('svgdata'):
 		svg_data = get_svgdata(
 			d= d,
 			font=font, 
@@ -105,15 +153,47 @@ def main(args):
 			overlap=args.overlap,
 			defdir = args.r_direction,
 			cofactors = cofactors,
-			reverse_cof = args.reverse_cof)
+			reverse_cof = args.reverse_cof,
+			path_precision = args.path_precision,
+			timer = timer)
+	return svg_data
+
+def main(args, font = None, model = None, timer = NoTimer()):
+	
+	file_name = ' '.join(args.graph_file)
+
+	svg_data = None
+	if args.cache_dir:
+		# svg data of earlier runs with the same input files and settings
+		with timer.stage('cache'):
+			key = svgdata_key(
+				files = {'layout': file_name, 'font': args.font_file, 
+					'model': ' '.join(args.add_cofactors_from_sbml) if args.add_cofactors_from_sbml else None},
+				options = {'font_size': args.font_size, 'scale': args.scale, 'padding': args.padding,
+					'padding_labels': args.padding_labels, 'normalize': args.normalize, 'overlap': args.overlap,
+					'r_direction': args.r_direction, 'reverse_cof': args.reverse_cof, 'split_hubs': args.split_hubs, 'hub_mode': args.hub_mode, 'grid': args.grid, 
+					'grid_offset': args.grid_offset, 'ctrl_grid': args.ctrl_grid, 'unique': args.unique, 'clearance': args.clearance, 'path_precision': args.path_precision})
+			svg_data = load_svgdata(args.cache_dir, key)
+		if svg_data is not None:
+			print 'svg data loaded from cache'
+
+	if svg_data is None:
+		svg_data = create_svgdata(args, file_name, font, model, timer)
+		if svg_data is None:
+			return
+		if args.cache_dir:
+			with timer.stage('cache'):
+				save_svgdata(args.cache_dir, key, svg_data)
 		
-		# assemble svg file and save (editable version)
+	# assemble svg file and save (editable version)
+	with timer.stage('svgdoc'):
 		doc = get_svgdoc(**svg_data)
-		doc.save(args.svg_name)
-		print 'output svg saved in', args.svg_name
+	with timer.stage('write'):
+		svg_name = save_svgdoc(doc, args.svg_name, args.compress, args.minify)
+	print 'output svg saved in', svg_name
 
 
-if __name__ == "__main__":
+def argument_parser():
 	parser = argparse.ArgumentParser()
 	parser.add_argument('graph_file', metavar = 'file_name.graphml', nargs = '+')
 	parser.add_argument('--add_cofactors_from_sbml', '-cof', metavar = 'model.xml', nargs = '+', help = "Add the omitted cofactors from this sbml (3fbc) model to the graph.")
@@ -126,9 +206,29 @@ if __name__ == "__main__":
 	parser.add_argument('--reverse_cof', nargs = '+', default = [], metavar = 'R_0001 R_0020 R_0033', help = "List of reaction ids for which the cofactors must be placed in the opposite way to the default (default is substrates top, products bottom).")
 	parser.add_argument('--normalize', dest = 'normalize', action = 'store_true', help = "Translate all coordinates to positive coordinates, so the svg can be viewed in a browser.") 
 	parser.add_argument('--overlap', dest = 'overlap', action = 'store_true', help = "Allow for overlap of the reaction arrow paths and metabolite labels.")
+	parser.add_argument('--compress', dest = 'compress', action = 'store_true', help = "Write a gzip compressed svg (.svgz).")
+	parser.add_argument('--minify', dest = 'minify', action = 'store_true', help = "Write the svg without indentation and superfluous spaces (see svg_output.py).")
+	parser.add_argument('--path_precision', type = int, metavar = '2', help = "Write the paths as compact path data (relative commands, shorthand commands) with coordinates rounded to this number of decimals (see path_encoding.py).")
 	parser.add_argument('--auto_direction', dest = 'r_direction', action = 'store_false', help = "Determine the direction (horizontal/vertical) of the arrow through reaction nodes automatically. (default is all reactions vertical)")
+	parser.add_argument('--save_layout', metavar = 'layout.npz', help = "Also save the layout (after aligning with the grid) in a binary layout file (not when the svg data is taken from the cache).")
+	parser.add_argument('--cache_dir', metavar = 'svgdata_cache', help = "Directory for caching svg data. If the input files and settings are the same as in an earlier run, the svg is assembled from the cached data (no path routing).")
+	parser.add_argument('--split_hubs', type = int, metavar = '10', help = "Split species with more edges than this into copies near their reactions before drawing the paths (see split_hubs.py). Copies make the map easier to read, but all their paths are still drawn, so drawing stays slow for large hubs; use --hub_mode cofactor to draw hub edges as short cofactor arrows instead (much faster).")
+	parser.add_argument('--hub_mode', choices = ['copy', 'cofactor'], default = 'copy', help = "With --split_hubs, split hubs into copies ('copy') or draw their edges as cofactors of the reactions ('cofactor').")
+	parser.add_argument('--grid', '-g', type = float, nargs = '+', metavar = '50.0', help = "Align the nodes with a grid before creating the svg (see snap_to_grid.py).")
+	parser.add_argument('--grid_offset', type = float, nargs = '+', default = [0.0, 0.0], metavar = '0.0', help = "Offset of the grid.")
+	parser.add_argument('--ctrl_grid', type = float, nargs = '+', metavar = '10.0', help = "Grid for the helper (ctrl) nodes. Default is the same grid as the other nodes, use 0 to leave helper nodes in place.")
+	parser.add_argument('--unique', dest = 'unique', action = 'store_true', help = "When aligning with a grid, place reaction and species nodes in distinct grid cells.")
+	parser.add_argument('--clearance', type = int, nargs = '+', default = [1, 1], metavar = '1', help = "Minimum distance (in grid cells) between nodes when using --unique.")
+	add_profile_arguments(parser)
+	parser.set_defaults(unique = False)
 	parser.set_defaults(normalize = False)
 	parser.set_defaults(overlap = False)
 	parser.set_defaults(r_direction = 'vertical')
+	return parser
+
+if __name__ == "__main__":
+	parser = argument_parser()
 	args = parser.parse_args()
-	main(args)
\ No newline at end of file
+	timer = profile_timer(args)
+	main(args, timer = timer)
+	profile_report(args, timer)
\ No newline at end of file
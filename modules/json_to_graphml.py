@@ -2,7 +2,9 @@ import json
 import sys
 import argparse
 import networkx as nx
-from readers import read_json_data
+from readers import read_layout_file
+from transform import transform_layout
+from writers import write_graphml, write_layout_npz
 
 def infodict_to_graph(d, scale = [1,1], padding = [0,0], normalize = False):
 	"""
@@ -11,33 +13,18 @@ def infodict_to_graph(d, scale = [1,1], padding = [0,0], normalize = False):
 	"""
 
 	## adjust coordinates ##
-	if len(scale)==1:
-		scale.append(scale[0])
-	if len(padding) == 1:
-		padding.append(padding[0])
+	transform_layout(d, scale, padding, normalize)
 
-	# get minimum x and maximum y coordinate for normalization
-	min_x = min([p[0] for p in d['pos'].values()])
-	max_y = max([p[1] for p in d['pos'].values()])
+	return layout_to_graph(d)
 
-	for n, p in d['pos'].items():
-		if normalize:
-			p = (p[0]-min_x, p[1]-max_y)           # normalize
-		p = (p[0]*scale[0], p[1]*scale[1])         # scale
-		p = (p[0] + padding[0], p[1] - padding[1]) # add padding
-		d['pos'][n] = p
-
-	for e in d['extra_nodes']:
-		for i in range(len(d['extra_nodes'][e])):
-			p = d['extra_nodes'][e][i]
-			if normalize:
-				p = (p[0]-min_x, p[1]-max_y)           # normalize
-			p = (p[0]*scale[0], p[1]*scale[1])         # scale
-			p = (p[0] + padding[0], p[1] - padding[1]) # add padding
-			d['extra_nodes'][e][i] = p
-
-	## make graph ##
+def layout_to_graph(d):
+	"""
+	Input  - Dictionary with layout info.
+	Output - networkx.DiGraph object, the helper points of the edges are
+			 added as 'ctrl' nodes.
+	"""
 	graph = nx.DiGraph()
+	graph.add_nodes_from(d['nodes'])
 
 	# add edges and nodes
 	for e in d['edges']:
@@ -48,6 +35,7 @@ def infodict_to_graph(d, scale = [1,1], padding = [0,0], normalize = False):
 				d['pos'][hn_ids[i]] = d['extra_nodes'][e][i]
 				d['label'][hn_ids[i]] = 'ctrl'
 				d['node_type'][hn_ids[i]] = 'ctrl'
+				d['pathway'][hn_ids[i]] = d['pathway'][e[0]]
 				graph.add_node(hn_ids[i])
 			node_id_lst = [e[0]] + hn_ids + [e[1]]
 			# add edges to graph (this also adds the nodes)
@@ -60,6 +48,7 @@ def infodict_to_graph(d, scale = [1,1], padding = [0,0], normalize = False):
 				d['pos'][hn_ids[i]] = d['extra_nodes'][e][i]
 				d['label'][hn_ids[i]] = 'ctrl'
 				d['node_type'][hn_ids[i]] = 'ctrl'
+				d['pathway'][hn_ids[i]] = d['pathway'][e[0]]
 			node_id_lst = [e[1]] + hn_ids[::-1] + [e[0]]
 			# add edges to graph (this also adds the nodes)
 			for i in range(len(node_id_lst)-1):
@@ -83,16 +72,19 @@ def infodict_to_graph(d, scale = [1,1], padding = [0,0], normalize = False):
 
 def main(args):
 	file_name = ' '.join(args.json_file)
-	with open(file_name) as json_data:
-		data = json.load(json_data)
-	d = read_json_data(data)
-	graph = infodict_to_graph(d, args.scale, args.padding, args.normalize)
-	nx.write_graphml(graph, args.graph_name)
+	d = read_layout_file(file_name)
+	if args.graph_name.lower().endswith('.npz'):
+		# binary layout file instead of graphml
+		transform_layout(d, args.scale, args.padding, args.normalize)
+		write_layout_npz(d, args.graph_name)
+	else:
+		graph = infodict_to_graph(d, args.scale, args.padding, args.normalize)
+		write_graphml(graph, args.graph_name)
 
 if __name__ == "__main__":
 	parser = argparse.ArgumentParser()
-	parser.add_argument('json_file', metavar= 'file_name.json', nargs= '+')
-	parser.add_argument('--graph_name', '-o', default = 'temp.graphml')
+	parser.add_argument('json_file', metavar= 'file_name.json', nargs= '+', help = "A json file containing the output from nicholas, or a binary layout file (.npz).")
+	parser.add_argument('--graph_name', '-o', default = 'temp.graphml', help = "The name/path of the output graph. Use the .npz extension to save a binary layout file instead of graphml.")
 	parser.add_argument('--scale', '-s', type = float, nargs='+', default = [20.0, 20.0], metavar= '20.0', help = "Scale up the graph with this factor. Example: -s 10.0 (10 in both x- and y-direction) Example: -s 20 10 (20 in x-direction, 10 in y-direction")
 	parser.add_argument('--padding', type = float, nargs='+', default = [20.0, 20.0], metavar= '20', help = "Extra space (pixels) added to the edges of the graph, e.g. so that all labels are visible in a browser when converted to svg.")
 	parser.add_argument('--normalize', dest = 'normalize', action='store_true', help = "Translate all coordinates to positive coordinates, so if converted to svg, it can be viewed in a browser.") 
@@ -4,29 +4,55 @@ import sys
 import re
 import argparse
 from PIL import ImageFont
-from readers import read_json_data, get_cofactors_from_sbml
+from readers import read_layout_file, get_cofactors_from_sbml
+from writers import write_layout_npz
+from split_hubs import split_hubs, label_boxes, hubs_to_cofactors, add_cofactors
 from svg_assembly import get_svgdata, get_svgdoc
+from svgdata_cache import svgdata_key, load_svgdata, save_svgdata
+from timing import NoTimer, add_profile_arguments, profile_timer, profile_report
+from svg_output import save_svgdoc
 
-def main(args):
+def create_svgdata(args, file_name, font = None, model = None, timer = NoTimer()):
+	"""
+	Read the layout, font and model and get the data to assemble the svg file.
+	A font (ImageFont) and model (cbmpy) that are already loaded can be passed
+	to skip reading them; timer records the time of each stage.
+	"""
 
 	# get file with layout data
-	file_name = ' '.join(args.json_file)
-	with open(file_name) as json_data:
-		data = json.load(json_data)
-	d = read_json_data(data) # layout data
-	
+	with timer.stage('layout'):
+		d = read_layout_file(file_name) # layout data
+		if args.save_layout:
+			write_layout_npz(d, args.save_layout)
+
 	# get font
-	font = ImageFont.truetype(args.font_file, 1000)
+	if font is None:
+		font = ImageFont.truetype(args.font_file, 1000)
 
+	# split hub metabolites (or draw them as cofactors)
+	hub_cofactors = None
+	if args.split_hubs:
+		with timer.stage('hubs'):
+			if args.hub_mode == 'cofactor':
+				hub_cofactors = hubs_to_cofactors(d, args.split_hubs)
+			else:
+				split_hubs(d, args.split_hubs, label_boxes(d, font, args.font_size, args.scale, args.padding_labels))
+	
 	# add cofactors
-	if args.add_cofactors_from_sbml:
-		sbml_file = ' '.join(args.add_cofactors_from_sbml)
-		cofactors = get_cofactors_from_sbml(d, sbml_file)
-		for r in cofactors:
-			for s in cofactors[r]:
-				d['edge_type'][(r,s)]=cofactors[r][s]['role']
-	else:
-		cofactors = None
+	with timer.stage('cofactors'):
+		if args.add_cofactors_from_sbml:
+			sbml_file = ' '.join(args.add_cofactors_from_sbml)
+			cofactors = get_cofactors_from_sbml(d, sbml_file, model)
+			for r in cofactors:
+				for s in cofactors[r]:
+					d['edge_type'][(r,s)]=cofactors[r][s]['role']
+		else:
+			cofactors = None
+		if hub_cofactors:
+			cofactors = add_cofactors(cofactors, hub_cofactors)
+			for r in hub_cofactors:
+				for s in hub_cofactors[r]:
+					d['edge_type'][(r,s)]=cofactors[r][s]['role']
 
 	# change labels to ids	
 	if args.ids_as_label:
@@ -37,18 +63,46 @@ def main(args):
 				cofactors[r][s]['label'] = s
 	
 	# get the data to assemble the svg file (editable version)
-	svg_data = get_svgdata(
-		d = d,
-		font = font, 
-		font_size = args.font_size, 
-		scale = args.scale,
-		padding = args.padding,
-		padding_labels= args.padding_labels,
-		normalize = args.normalize,
-		overlap = args.overlap,
-		cofactors = cofactors,
-		defdir = args.r_direction,
-		reverse_cof = args.reverse_cof)
+	with timer.stage('svgdata'):
+		svg_data = get_svgdata(
+			d = d,
+			font = font, 
+			font_size = args.font_size, 
+			scale = args.scale,
+			padding = args.padding,
+			padding_labels= args.padding_labels,
+			normalize = args.normalize,
+			overlap = args.overlap,
+			cofactors = cofactors,
+			defdir = args.r_direction,
+			reverse_cof = args.reverse_cof,
+			path_precision = args.path_precision,
+			timer = timer)
+	return svg_data
+
+def main(args, font = None, model = None, timer = NoTimer()):
+
+	file_name = ' '.join(args.json_file)
+
+	svg_data = None
+	if args.cache_dir:
+		# svg data of earlier runs with the same input files and settings
+		with timer.stage('cache'):
+			key = svgdata_key(
+				files = {'layout': file_name, 'font': args.font_file, 
+					'model': ' '.join(args.add_cofactors_from_sbml) if args.add_cofactors_from_sbml else None},
+				options = {'font_size': args.font_size, 'scale': args.scale, 'padding': args.padding,
+					'padding_labels': args.padding_labels, 'normalize': args.normalize, 'overlap': args.overlap,
+					'r_direction': args.r_direction, 'reverse_cof': args.reverse_cof, 'split_hubs': args.split_hubs, 'hub_mode': args.hub_mode, 'ids_as_label': args.ids_as_label, 'path_precision': args.path_precision})
+			svg_data = load_svgdata(args.cache_dir, key)
+		if svg_data is not None:
+			print 'svg data loaded from cache'
+
+	if svg_data is None:
+		svg_data = create_svgdata(args, file_name, font, model, timer)
+		if args.cache_dir:
+			with timer.stage('cache'):
+				save_svgdata(args.cache_dir, key, svg_data)
 	
 	if args.output_json:
 		# save svg data in json-format
@@ -56,14 +110,20 @@ def main(args):
 			json.dump(svg_data, f)
 	else:
 		# assemble svg file and save (editable version)
-		doc = get_svgdoc(**svg_data)
-		doc.save(args.svg_name)
-		print 'output svg saved in', args.svg_name
+		with timer.stage('svgdoc'):
+			doc = get_svgdoc(**svg_data)
+		with timer.stage('write'):
+			svg_name = save_svgdoc(doc, args.svg_name, args.compress, args.minify)
+		print 'output svg saved in', svg_name
 
-if __name__ == "__main__":
+def argument_parser():
 	parser = argparse.ArgumentParser()
-	parser.add_argument('json_file', metavar= 'file_name.json', nargs= '+', help = "A json file containg the output from nicholas.")
+	parser.add_argument('json_file', metavar= 'file_name.json', nargs= '+', help = "A json file containg the output from nicholas, or a binary layout file (.npz).")
 	parser.add_argument('--svg_name', '-o', default = 'temp.svg', metavar = 'temp.svg', help = "The name/path of the output svg.")
+	parser.add_argument('--save_layout', metavar = 'layout.npz', help = "Also save the layout data in a binary layout file, which is faster to read than the json file (not when the svg data is taken from the cache).")
+	parser.add_argument('--cache_dir', metavar = 'svgdata_cache', help = "Directory for caching svg data. If the input files and settings are the same as in an earlier run, the svg is assembled from the cached data (no path routing).")
+	parser.add_argument('--split_hubs', type = int, metavar = '10', help = "Split species with more edges than this into copies near their reactions before drawing the paths (see split_hubs.py). Copies make the map easier to read, but all their paths are still drawn, so drawing stays slow for large hubs; use --hub_mode cofactor to draw hub edges as short cofactor arrows instead (much faster).")
+	parser.add_argument('--hub_mode', choices = ['copy', 'cofactor'], default = 'copy', help = "With --split_hubs, split hubs into copies ('copy') or draw their edges as cofactors of the reactions ('cofactor').")
 	parser.add_argument('--output_json', '-oj', default = '', metavar = 'svgdata.json', help = "Don't save svg-file, instead save data (info on label coordinates, paths etc.) for creating the svg file in a json file.")
 	parser.add_argument('--add_cofactors_from_sbml', '-cof', metavar='model.xml', nargs='+', help = "Add the omitted cofactors from this sbml (3fbc) model to the graph.")
 	parser.add_argument('--scale', '-s', type = float, nargs='+', default = [20.0, 20.0], metavar= '20.0', help = "Scale up the graph with this factor. Example: -s 10.0 (10 in both x- and y-direction) Example: -s 20 10 (20 in x-direction, 10 in y-direction")
@@ -76,10 +136,20 @@ if __name__ == "__main__":
 	parser.add_argument('--ids_as_label', dest = 'ids_as_label', action='store_true', help = "Use metabolite IDs instead of metabolite names as labels.")
 	parser.add_argument('--normalize', dest = 'normalize', action='store_true', help = "Translate all coordinates to positive coordinates, so the svg can be viewed in a browser.") 
 	parser.add_argument('--overlap', dest='overlap', action='store_true', help = "Allow for overlap of the reaction arrow paths and metabolite labels.")
+	parser.add_argument('--compress', dest = 'compress', action = 'store_true', help = "Write a gzip compressed svg (.svgz).")
+	parser.add_argument('--minify', dest = 'minify', action = 'store_true', help = "Write the svg without indentation and superfluous spaces (see svg_output.py).")
+	parser.add_argument('--path_precision', type = int, metavar = '2', help = "Write the paths as compact path data (relative commands, shorthand commands) with coordinates rounded to this number of decimals (see path_encoding.py).")
+	add_profile_arguments(parser)
 	parser.set_defaults(ids_as_label = False)
 	parser.set_defaults(r_direction = 'vertical')
 	parser.set_defaults(normalize = False)
 	parser.set_defaults(overlap = False)
+	return parser
+
+if __name__ == "__main__":
+	parser = argument_parser()
 	args = parser.parse_args()
 	parser.print_help()
-	main(args)
\ No newline at end of file
+	timer = profile_timer(args)
+	main(args, timer = timer)
+	profile_report(args, timer)
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Level-of-detail output of large final maps (see layout_final.py --tile_size):
+a coarse overview (blocks where the map has reactions and metabolites, no
+labels or tooltips), tiles with the full detail of a part of the map and a
+viewer page that shows the overview when zoomed out and loads the tiles in
+view when zoomed in.
+
+Tiles are javascript files that pass their svg fragment to the viewer, so
+they can be loaded from a local directory (file://) and are added to one svg
+element: paths and tooltips that cross a tile border are not cut off.
+"""
+import math
+import json
+
+def tile_grid(width, height, points, tile_size):
+	""" Number of (columns, rows) of tiles that cover the map and all points """
+	max_x = max([width] + [p[0] for p in points])
+	max_y = max([height] + [p[1] for p in points])
+	return max(1, int(math.ceil(max_x/tile_size))), max(1, int(math.ceil(max_y/tile_size)))
+
+def tile_index(x, y, tile_size, columns, rows):
+	""" (column, row) of the tile of a point """
+	return min(max(int(x//tile_size), 0), columns-1), min(max(int(y//tile_size), 0), rows-1)
+
+def partition_map(rxn_id, met_id, rxn_layout, labels, tile_size, columns, rows):
+	"""
+	Split the reactions and metabolite labels of a map into tiles, by the
+	position of the reaction circle and of the label.
+	Output - dictionary with (column, row) keys and (reactions, metabolites)
+			 values (subsets of rxn_id and met_id).
+	"""
+	tiles = {}
+	for r, rid in rxn_id.items():
+		p = rxn_layout[r]['circle']
+		tiles.setdefault(tile_index(p['x'], p['y'], tile_size, columns, rows), ({}, {}))[0][r] = rid
+	for s, sid in met_id.items():
+		tiles.setdefault(tile_index(labels[s]['x'], labels[s]['y'], tile_size, columns, rows), ({}, {}))[1][s] = sid
+	return tiles
+
+def overview_svg(points, width, height, block_size):
+	"""
+	Svg with a gray block for each block_size x block_size square of the map
+	with points (reactions and metabolite labels), darker for more points.
+	"""
+	counts = {}
+	for x, y in points:
+		key = (int(x//block_size), int(y//block_size))
+		counts[key] = counts.get(key, 0) + 1
+	most = max(counts.values()) if counts else 1
+	blocks = ['<rect x="{}" y="{}" width="{}" height="{}" style="fill:#888888; fill-opacity:{:.2f}" />\n'.format(
+		i*block_size, j*block_size, block_size, block_size, 0.2 + 0.8*n/most) for (i, j), n in sorted(counts.items())]
+	return ('<?xml version="1.0" encoding="ISO-8859-1" standalone="no"?>\n'
+		'<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="{0}" height="{1}" viewBox="0 0 {0} {1}">\n'
+		'{2}</svg>\n').format(width, height, ''.join(blocks))
+
+def tile_name(key):
+	return 'tile_{}_{}.js'.format(*key)
+
+def tile_script(key, xml):
+	""" Javascript of a tile: passes the svg fragment to the viewer """
+	return 'map_tile({}, {});\n'.format(json.dumps('{}_{}'.format(*key)), json.dumps(xml))
+
+viewer_html = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="ISO-8859-1">
+<title>MAP_TITLE</title>
+<style>
+  html, body {margin: 0; height: 100%; overflow: hidden}
+  #viewport {position: absolute; left: 0; right: 0; top: 0; bottom: 0; overflow: auto}
+  #map {position: relative}
+  #map > img, #map > svg {position: absolute; left: 0; top: 0}
+  #controls {position: fixed; right: 25px; top: 10px; z-index: 1}
+</style>
+</head>
+<body>
+<div id="controls"><button id="zoom_in">+</button> <button id="zoom_out">-</button></div>
+<div id="viewport"><div id="map">
+<img id="overview" src="overview.svg">
+<svg id="detail" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" viewBox="0 0 MAP_WIDTH MAP_HEIGHT">
+<style>
+MAP_CSS
+</style>
+MAP_DEFS
+<g id="tiles"></g>
+</svg>
+</div></div>
+<script>
+var map = MAP_INFO;
+var svgns = 'http://www.w3.org/2000/svg';
+var viewport = document.getElementById('viewport'), mapdiv = document.getElementById('map');
+var overview = document.getElementById('overview'), detail = document.getElementById('detail');
+var layer = document.getElementById('tiles');
+// tiles in view: null while loading, then their group
+var loaded = {};
+var zoom = Math.min(viewport.clientWidth/map.width, viewport.clientHeight/map.height);
+
+// called by the tile scripts
+function map_tile(key, xml) {
+  if (!(key in loaded) || loaded[key] !== null) {
+    return;
+  }
+  var g = document.createElementNS(svgns, 'g');
+  g.innerHTML = xml;
+  layer.appendChild(g);
+  loaded[key] = g;
+}
+
+function update() {
+  var w = map.width*zoom, h = map.height*zoom;
+  mapdiv.style.width = w + 'px';
+  mapdiv.style.height = h + 'px';
+  overview.style.width = detail.style.width = w + 'px';
+  overview.style.height = detail.style.height = h + 'px';
+  var show = zoom >= map.detail_zoom;
+  overview.style.display = show ? 'none' : '';
+  detail.style.display = show ? '' : 'none';
+
+  // tiles in (or within half a tile of) the viewport
+  var m = map.tile_size/2;
+  var x0 = viewport.scrollLeft/zoom - m, y0 = viewport.scrollTop/zoom - m;
+  var x1 = (viewport.scrollLeft + viewport.clientWidth)/zoom + m, y1 = (viewport.scrollTop + viewport.clientHeight)/zoom + m;
+  for (var i = 0; i < map.tiles.length; i++) {
+    var key = map.tiles[i], c = key.split('_');
+    var tx = c[0]*map.tile_size, ty = c[1]*map.tile_size;
+    var visible = show && tx < x1 && tx + map.tile_size > x0 && ty < y1 && ty + map.tile_size > y0;
+    if (visible && !(key in loaded)) {
+      loaded[key] = null;
+      var script = document.createElement('script');
+      script.src = 'tiles/tile_' + key + '.js';
+      script.onload = script.onerror = function() { document.body.removeChild(this); };
+      document.body.appendChild(script);
+    } else if (!visible && key in loaded) {
+      if (loaded[key] !== null) {
+        layer.removeChild(loaded[key]);
+      }
+      delete loaded[key];
+    }
+  }
+}
+
+function zoom_by(factor) {
+  // keep the centre of the viewport in place
+  var cx = (viewport.scrollLeft + viewport.clientWidth/2)/zoom, cy = (viewport.scrollTop + viewport.clientHeight/2)/zoom;
+  zoom *= factor;
+  update();
+  viewport.scrollLeft = cx*zoom - viewport.clientWidth/2;
+  viewport.scrollTop = cy*zoom - viewport.clientHeight/2;
+  update();
+}
+
+var pending = false;
+viewport.addEventListener('scroll', function() {
+  if (!pending) {
+    pending = true;
+    window.requestAnimationFrame(function() { pending = false; update(); });
+  }
+});
+window.addEventListener('resize', update);
+document.getElementById('zoom_in').onclick = function() { zoom_by(1.5); };
+document.getElementById('zoom_out').onclick = function() { zoom_by(1/1.5); };
+update();
+</script>
+</body>
+</html>
+"""
+
+def viewer_page(title, css, defs, width, height, tile_size, keys, detail_zoom):
+	"""
+	Html page of the tiled map. The tiles (keys) are shown from a zoom level of
+	detail_zoom (1: map pixels are screen pixels), the overview below it.
+	"""
+	info = {'width': width, 'height': height, 'tile_size': tile_size, 'detail_zoom': detail_zoom,
+		'tiles': ['{}_{}'.format(*key) for key in sorted(keys)]}
+	return viewer_html.replace('MAP_TITLE', title).replace('MAP_WIDTH', str(width)).replace('MAP_HEIGHT', str(height)) \
+		.replace('MAP_INFO', json.dumps(info)).replace('MAP_DEFS', defs).replace('MAP_CSS', css)
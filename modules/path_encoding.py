@@ -0,0 +1,188 @@
+"""
+Compact svg path data: relative commands, coordinates rounded to a number of
+decimals, repeated command letters left out and shorthand commands (h, v and
+s) where they give the same path.
+
+The coordinates are rounded in absolute terms and the relative steps are
+taken between the rounded points, so rounding errors do not add up along a
+path: every point of the compact path is within 0.5*10**-precision (in x and
+y) of the original.
+"""
+import re
+from svg.path import Line, CubicBezier, QuadraticBezier, Arc, Move
+
+class Close(Line):
+	""" Line back to the start of the subpath ('z') """
+	pass
+
+token_pattern = re.compile(r'([MmZzLlHhVvCcSsQqTtAa])|([-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)')
+
+# number of arguments of each command
+num_args = {'m': 2, 'l': 2, 'h': 1, 'v': 1, 'c': 6, 's': 4, 'q': 4, 't': 2, 'a': 7, 'z': 0}
+
+def parse_path_data(d):
+	"""
+	Segments of svg path data (absolute coordinates as complex numbers).
+	Output - list of svg.path segments (Move, Line, CubicBezier, QuadraticBezier,
+			 Arc) and Close; s and t commands give the full curve.
+	"""
+	tokens = [(cmd, float(num) if num else None) for cmd, num in token_pattern.findall(d)]
+	segments = []
+	pos = start = 0j
+	cmd = None
+	control = None	# last control point of the previous curve (s and t)
+	i = 0
+	while i < len(tokens):
+		if tokens[i][0]:
+			cmd = tokens[i][0]
+			i += 1
+		elif cmd is None:
+			raise ValueError('path data does not start with a command: ' + d)
+		c = cmd.lower()
+		args = [t[1] for t in tokens[i:i+num_args[c]]]
+		if len(args) < num_args[c] or None in args:
+			raise ValueError('missing arguments of {} in path data: {}'.format(cmd, d))
+		i += num_args[c]
+		offset = pos if cmd.islower() else 0j
+		point = lambda k: complex(args[k], args[k+1]) + offset
+
+		if c == 'z':
+			segments.append(Close(pos, start))
+			pos = start
+			control = None
+			continue
+		if c == 'm':
+			pos = start = point(0)
+			segments.append(Move(pos))
+			# following coordinate pairs are lines
+			cmd = 'l' if cmd == 'm' else 'L'
+			control = None
+			continue
+
+		if c == 'l':
+			seg = Line(pos, point(0))
+		elif c == 'h':
+			seg = Line(pos, complex(args[0] + offset.real, pos.imag))
+		elif c == 'v':
+			seg = Line(pos, complex(pos.real, args[0] + offset.imag))
+		elif c == 'c':
+			seg = CubicBezier(pos, point(0), point(2), point(4))
+		elif c == 's':
+			c1 = 2*pos - control if control is not None and segments and isinstance(segments[-1], CubicBezier) else pos
+			seg = CubicBezier(pos, c1, point(0), point(2))
+		elif c == 'q':
+			seg = QuadraticBezier(pos, point(0), point(2))
+		elif c == 't':
+			c1 = 2*pos - control if control is not None and segments and isinstance(segments[-1], QuadraticBezier) else pos
+			seg = QuadraticBezier(pos, c1, point(0))
+		else:
+			seg = Arc(pos, complex(args[0], args[1]), args[2], bool(args[3]), bool(args[4]), point(5))
+		segments.append(seg)
+		pos = seg.end
+		control = seg.control2 if isinstance(seg, CubicBezier) else (seg.control if isinstance(seg, QuadraticBezier) else None)
+	return segments
+
+def format_number(value, precision):
+	""" Shortest text of a number rounded to precision decimals (e.g. -0.50 -> -.5) """
+	s = '{:.{}f}'.format(value, precision)
+	if '.' in s:
+		s = s.rstrip('0').rstrip('.')
+	if s.startswith('0.'):
+		s = s[1:]
+	elif s.startswith('-0.'):
+		s = '-' + s[2:]
+	if s in ('-0', ''):
+		s = '0'
+	return s
+
+def encode_path(segments, precision = 2):
+	""" Compact path data of segments (see parse_path_data) """
+	scale = 10**precision
+	rnd = lambda p: complex(round(p.real*scale)/scale, round(p.imag*scale)/scale)
+	tolerance = 0.1/scale
+
+	out = []
+	last = None		# command letter that a number continues (m continues as l)
+	pos = start = 0j	# rounded current point and start of the subpath
+	control = None		# rounded second control point of the previous cubic curve
+
+	def write(cmd, numbers):
+		texts = [format_number(v, precision) for v in numbers]
+		if cmd == last and texts:
+			if not texts[0].startswith('-'):
+				out.append(' ')
+		else:
+			out.append(cmd)
+		for k, t in enumerate(texts):
+			if k and not t.startswith('-'):
+				out.append(' ')
+			out.append(t)
+
+	for seg in segments:
+		if isinstance(seg, Close):
+			out.append('z')
+			last = None
+			pos = start
+			control = None
+			continue
+		if isinstance(seg, Move):
+			end = rnd(seg.start)
+			write('m', [end.real - pos.real, end.imag - pos.imag])
+			last = 'l'
+			pos = start = end
+			control = None
+			continue
+
+		end = rnd(seg.end)
+		step = end - pos
+		cubic = None
+		if isinstance(seg, Line):
+			if abs(step.imag) < tolerance:
+				cmd, numbers = 'h', [step.real]
+			elif abs(step.real) < tolerance:
+				cmd, numbers = 'v', [step.imag]
+			else:
+				cmd, numbers = 'l', [step.real, step.imag]
+		elif isinstance(seg, CubicBezier):
+			c1, c2 = rnd(seg.control1) - pos, rnd(seg.control2) - pos
+			cubic = c2 + pos
+			if control is not None and abs(c1 - (pos - control)) < tolerance:
+				cmd, numbers = 's', [c2.real, c2.imag, step.real, step.imag]
+			else:
+				cmd, numbers = 'c', [c1.real, c1.imag, c2.real, c2.imag, step.real, step.imag]
+		elif isinstance(seg, QuadraticBezier):
+			c1 = rnd(seg.control) - pos
+			cmd, numbers = 'q', [c1.real, c1.imag, step.real, step.imag]
+		else:
+			cmd, numbers = 'a', [round(seg.radius.real*scale)/scale, round(seg.radius.imag*scale)/scale,
+				seg.rotation, int(seg.arc), int(seg.sweep), step.real, step.imag]
+		write(cmd, numbers)
+		last = cmd
+		pos = end
+		control = cubic
+	return ''.join(out)
+
+def compact_path(d, precision = 2):
+	""" Compact version of svg path data d, see encode_path """
+	return encode_path(parse_path_data(d), precision)
+
+def path_points(d, samples = 10):
+	""" Points (complex numbers) at samples+1 evenly spaced parameter values of each drawn segment of path data d """
+	points = []
+	for seg in parse_path_data(d):
+		if isinstance(seg, Move):
+			points.append(seg.start)
+		else:
+			points += [seg.point(k/float(samples)) for k in range(samples + 1)]
+	return points
+
+def path_deviation(d1, d2, samples = 10):
+	"""
+	Largest distance between corresponding points of two versions of a path
+	(see path_points), infinite if they have different segments.
+	"""
+	p1 = path_points(d1, samples)
+	p2 = path_points(d2, samples)
+	if len(p1) != len(p2):
+		return float('inf')
+	return max([abs(a - b) for a, b in zip(p1, p2)] + [0.0])
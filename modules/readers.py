@@ -1,9 +1,106 @@
 import json
 import sys
 import re
+import itertools
+import mmap
+import struct
+import zipfile
+import weakref
+import numpy as np
 import networkx as nx
 import cbmpy as cbm
+from array import array
+from xml.etree import cElementTree as ElementTree
+try:
+	# fast (C) backend of ijson for incremental json parsing
+	import ijson.backends.yajl2_c as ijson
+except ImportError:
+	try:
+		import ijson
+	except ImportError:
+		ijson = None
 
+# node types in Nicholas's output
+node_types = {'1': 'species', '2': 'reaction'}
+
+# codes of the node and edge types in binary (npz) layout files
+layout_node_types = ('species', 'reaction')
+layout_edge_types = ('substrate', 'product')
+layout_version = 1
+
+# (x, y) part of tulip layout coordinates, e.g. '(x,y,z)' or '((x,y,z), (x,y,z))'
+coordinate_pattern = re.compile(r'\(\s*([^(),\s]+)\s*,\s*([^(),\s]+)')
+
+def parse_coordinates(value):
+	""" Get a list of (x, y) tuples from a tulip layout string """
+	return [(float(x), float(y)) for x, y in coordinate_pattern.findall(value)]
+
+# node attributes used in the graph files of the pipeline and their types
+graph_attributes = {'x': float, 'y': float, 'size': float, 'label': unicode, 'node_type': unicode, 'pathway': unicode}
+
+class LayoutGraph:
+	"""
+	Lightweight directed graph with the layout attributes of the nodes. Provides
+	the part of the networkx.DiGraph interface that is used by the pipeline
+	(node attribute dictionary 'node', nodes(), edges(), add_node(), add_edge()).
+	"""
+	def __init__(self):
+		self.node = {}
+		self._edges = []
+
+	def add_node(self, n, **attr):
+		self.node.setdefault(n, {}).update(attr)
+
+	def add_edge(self, u, v):
+		self.node.setdefault(u, {})
+		self.node.setdefault(v, {})
+		self._edges.append((u, v))
+
+	def nodes(self):
+		return self.node.keys()
+
+	def edges(self):
+		return list(self._edges)
+
+def read_graphml(file_name):
+	"""
+	Read a graphml file into a LayoutGraph. Only the node attributes in 
+	graph_attributes are read (other node data and edge data are skipped).
+	"""
+	graph = LayoutGraph()
+	keys = {}     # graphml key id -> (attribute name, type)
+	defaults = {} # attribute name -> default value
+	attr = {}
+
+	for _, el in ElementTree.iterparse(file_name):
+		tag = el.tag
+		if tag[0] == '{':
+			tag = tag[tag.index('}')+1:]
+
+		if tag == 'data':
+			key = keys.get(el.get('key'))
+			if key is not None and el.text is not None:
+				attr[key[0]] = key[1](el.text)
+		elif tag == 'node':
+			# data elements of the node come first
+			node_attr = dict(defaults)
+			node_attr.update(attr)
+			graph.node[el.get('id')] = node_attr
+			attr = {}
+			el.clear()
+		elif tag == 'edge':
+			attr = {}
+			graph.add_edge(el.get('source'), el.get('target'))
+			el.clear()
+		elif tag == 'key':
+			name = el.get('attr.name')
+			if name in graph_attributes and el.get('for') in ('node', 'all'):
+				keys[el.get('id')] = (name, graph_attributes[name])
+				for child in el:
+					if child.tag.endswith('default') and child.text is not None:
+						defaults[name] = graph_attributes[name](child.text)
+
+	return graph
 
 def read_json_data(data):
 	"""
@@ -29,81 +126,105 @@ def read_json_data(data):
 	"""
 
 	graph = data['graph']
+	properties = graph['properties']
 
-	# dictionary of labels
-	label = graph['properties']['name']['nodesValues']
+	# dictionary of (x,y) positions
+	pos = {}
+	for key, val in properties['viewLayout']['nodesValues'].items():
+		# convert strings with coordinates to tuples with floats.
+		pos[key] = parse_coordinates(val)[0]
 
-	# dictionary of pathways
-	pathway = graph['properties']['pathway']['nodesValues']
+	# nodes that are for layout purposes only (don't represent reaction or species)
+	helper_nodes = {}
+	for key, val in properties['viewLayout'].get('edgesValues', {}).items():
+		helper_nodes[key] = parse_coordinates(val)
 
-	# dictionary of node types
-	n_type = {}
-	for node, node_type in graph['properties']['type']['nodesValues'].items():
-		n_type[node] = {'1': 'species', '2':'reaction'}[node_type]
+	return assemble_layout(
+		edges = graph['edges'],
+		node_type = properties['type']['nodesValues'],
+		label = properties['name']['nodesValues'],
+		pathway = properties['pathway']['nodesValues'],
+		view_label = properties['viewLabel']['nodesValues'],
+		pos = pos,
+		helper_nodes = helper_nodes)
 
-	# list of nodes
-	nodes = n_type.keys()
+def load_json_data(file_name):
+	"""
+	Read layout information from a json file with Nicholas's output. If ijson
+	is installed, the file is parsed incrementally and only the properties that
+	are needed for the layout are kept in memory (the edge list is stored in a
+	compact array). Otherwise the whole file is loaded with json.load, which
+	needs several times the file size of memory (a warning is printed).
+	Output - dictionary with layout information (see read_json_data).
+	"""
+	if ijson is None:
+		print "WARNING: ijson is not installed, {} is read with json.load (memory use of several times the file size; install ijson to read it incrementally)".format(file_name)
+		with open(file_name) as f:
+			data = json.load(f)
+		return read_json_data(data)
 
-	# nodes that are for layout purposes only (don't represent reaction or species)
-	if 'edgesValues' in graph['properties']['viewLayout'].keys():
-		helper_nodes = graph['properties']['viewLayout']['edgesValues']
-	else:
-		helper_nodes = {}
-	for e_id in helper_nodes:
-		n = helper_nodes[e_id]
-		l = []
-		for m in n.split('), ('):
-			l.append( [float(k) for k in m.strip('(').strip(')').split(',')[:2]])
-		helper_nodes[e_id] = l
-	
-	# list of edges
-	edges = []
-	
-	# dictionary with edge types
-	e_type = {}
+	node_values = {'type': {}, 'name': {}, 'pathway': {}, 'viewLabel': {}}
+	pos = {}
+	helper_nodes = {}
+	edges = array('l')
 
-	# dictionary with nodes that are for layout purposes only
-	extra_nodes = {}
+	with open(file_name, 'rb') as f:
+		for prefix, event, value in ijson.parse(f):
+			if prefix == 'graph.edges.item.item':
+				edges.append(value)
+			elif event == 'string' and prefix.startswith('graph.properties.'):
+				# prefix is graph.properties.<property name>.<nodesValues/edgesValues>.<id>
+				prop = prefix.split('.')
+				if len(prop) != 5:
+					continue
+				if prop[2] == 'viewLayout':
+					if prop[3] == 'nodesValues':
+						pos[prop[4]] = parse_coordinates(value)[0]
+					elif prop[3] == 'edgesValues':
+						helper_nodes[prop[4]] = parse_coordinates(value)
+				elif prop[2] in node_values and prop[3] == 'nodesValues':
+					node_values[prop[2]][prop[4]] = value
 
-	for i in range(len(graph['edges'])):
-		e = graph['edges'][i]
-		# convert integers to strings, so they can be used as a key later.
-		n0 = str(e[0])
-		n1 = str(e[1])
+	return assemble_layout(
+		edges = itertools.izip(edges[::2], edges[1::2]),
+		node_type = node_values['type'],
+		label = node_values['name'],
+		pathway = node_values['pathway'],
+		view_label = node_values['viewLabel'],
+		pos = pos,
+		helper_nodes = helper_nodes)
 
-		if n_type[n0]=='reaction':
-			edges.append((n0, n1))
-			if str(i) in helper_nodes.keys():
-				extra_nodes[(n0, n1)] = helper_nodes[str(i)]
-			else:
-				extra_nodes[(n0, n1)] = []
-			e_type[(n0, n1)] = 'product'
-		else:
-			# make reaction node always the source node.
-			edges.append((n1, n0))
-			if str(i) in helper_nodes.keys():
-				extra_nodes[(n1, n0)] = helper_nodes[str(i)][::-1]
-			else:
-				extra_nodes[(n1, n0)] = []
-			e_type[(n1, n0)] = 'substrate'
+def assemble_layout(edges, node_type, label, pathway, view_label, pos, helper_nodes):
+	"""
+	Build the layout information dictionary (see read_json_data) from the 
+	(parsed) properties in Nicholas's output.
+	Input  - edges 			iterable of (source, target) node ids.
+			 node_type 		dictionary with node types ('1': species, '2': reaction).
+			 label 			dictionary with node names.
+			 pathway 		dictionary with pathways.
+			 view_label 	dictionary with cmod ids.
+			 pos 			dictionary with (x, y) tuples.
+			 helper_nodes 	dictionary with lists of (x, y) tuples; keys are edge indices.
+	"""
 
-	# dictionary of (x,y) positions
-	pos ={}
-	for key, val in graph['properties']['viewLayout']['nodesValues'].items():
-		# convert strings with coordinats to tuples with floats.
-		val = val.strip('(').strip(')').split(',')
-		pos[key] = (float(val[0]), float(val[1]))
+	# dictionary of node types
+	n_type = {}
+	for node, nt in node_type.items():
+		n_type[node] = node_types[nt]
+
+	# list of nodes
+	nodes = n_type.keys()
 
 	# change node_ids to cmod ids
 	cmod_id = {}
 	copies = {}
-	for n, lab in graph['properties']['viewLabel']['nodesValues'].items():
+	for n, lab in view_label.items():
 		# if cmod id is already in use, add copy number to id
 		if lab in copies:
-			copies[lab].append(n)
-			lab += '_copy_'+str(len(copies[lab])-1)
+			copies[lab] += 1
+			lab += '_copy_'+str(copies[lab])
 		else:
-			copies[lab] = [n]
+			copies[lab] = 0
 		cmod_id[n] = lab
 
 	# return a dictionary with all the extracted information
@@ -114,19 +235,24 @@ def read_json_data(data):
 		d['node_type'][new_n] = n_type[n]
 		d['pos'][new_n] = pos[n]
 		d['label'][new_n] = label[n]
+		d['pathway'][new_n] = pathway.get(n, "Undefined")
 
-	for n in nodes:
-		new_n = cmod_id[n]
-		try:
-			d['pathway'][new_n] = pathway[n]
-		except KeyError:
-			d['pathway'][new_n] = "Undefined"
-	
-	for e in edges:
-		new_e = (cmod_id[e[0]], cmod_id[e[1]])
+	for i, e in enumerate(edges):
+		# convert integers to strings, so they can be used as a key later.
+		n0 = str(e[0])
+		n1 = str(e[1])
+		hn = list(helper_nodes.get(str(i), []))
+
+		if n_type[n0] == 'reaction':
+			new_e = (cmod_id[n0], cmod_id[n1])
+			d['edge_type'][new_e] = 'product'
+		else:
+			# make reaction node always the source node.
+			new_e = (cmod_id[n1], cmod_id[n0])
+			d['edge_type'][new_e] = 'substrate'
+			hn.reverse()
 		d['edges'].append(new_e)
-		d['edge_type'][new_e] = e_type[e]
-		d['extra_nodes'][new_e] = extra_nodes[e]
+		d['extra_nodes'][new_e] = hn
 	
 	return d
 
@@ -161,38 +287,38 @@ def read_graph(graph):
 	pos = {}
 	pathway = {}
 	edges = []
-	nodes = [n for n in graph.nodes() if graph.node[n]['node_type'] != 'ctrl']
-	helper_nodes = [n for n in graph.nodes() if graph.node[n]['node_type'] == 'ctrl']
+	attr = graph.node
+	edge_list = graph.edges()
+	nodes = [n for n in graph.nodes() if attr[n]['node_type'] != 'ctrl']
+
+	# helper nodes form chains between a reaction and a species node,
+	# get the next node in the chain for each helper node (single pass over edges).
+	next_node = {}
+	for n0, n1 in edge_list:
+		if attr[n0]['node_type'] == 'ctrl' and n0 not in next_node:
+			next_node[n0] = n1
+
+	# get real edges, ignore helper nodes. Each chain is walked once, from the
+	# edge that starts at the reaction or species node; edges inside a chain are skipped.
+	for n0, n1 in edge_list:
+		source_type = attr[n0]['node_type']
+		if source_type not in ('reaction', 'species'):
+			continue
 
-	# get real edges, ignore helper nodes
-	for e in graph.edges():
 		hn = []
-		if graph.node[e[0]]['node_type'] == 'reaction':
-			n0 = e[0] # reaction
-			n1 = e[1] # species (or helper node)
-			if n1 in helper_nodes:
-				while graph.node[n1]['node_type'] == 'ctrl':
-					hn.append(n1)
-					n1 = graph.successors(n1)[0]
-			edge_type[(n0, n1)] =  'product'
-			edges.append((n0, n1))
-			extra_nodes[(n0, n1)] = []
-			for n in hn:
-				extra_nodes[(n0, n1)].append((graph.node[n]['x'], graph.node[n]['y']))
-		
-		elif graph.node[e[0]]['node_type'] == 'species':
-			n0 = e[1] # reaction (or helper node)
-			n1 = e[0] # species
-			if n0 in helper_nodes:
-				while graph.node[n0]['node_type'] == 'ctrl':
-					hn.append(n0)
-					n0 = graph.successors(n0)[0]
-			edge_type[(n0, n1)] =  'substrate'
-			edges.append((n0, n1))
-			extra_nodes[(n0, n1)] = []
-			for n in hn[::-1]:
-				extra_nodes[(n0, n1)].append((graph.node[n]['x'], graph.node[n]['y']))
+		while attr[n1]['node_type'] == 'ctrl':
+			hn.append((attr[n1]['x'], attr[n1]['y']))
+			n1 = next_node[n1]
 
+		if source_type == 'reaction':
+			e = (n0, n1) # (reaction, species)
+			edge_type[e] = 'product'
+		else:
+			e = (n1, n0) # (reaction, species)
+			edge_type[e] = 'substrate'
+			hn.reverse()
+		edges.append(e)
+		extra_nodes[e] = hn
 
 	for n in nodes:
 		label[n] = graph.node[n]['label']
@@ -204,10 +330,130 @@ def read_graph(graph):
 	return d
 
 
-def get_cofactors_from_sbml(d, sbml_file):
+def read_layout_arrays(file_name, mmap_mode = False):
+	"""
+	Read the arrays of a binary layout file (see writers.write_layout_npz).
+	If mmap_mode, the arrays are read-only views on the memory-mapped file
+	instead of copies (the file is written without compression, so the array
+	data can be used in place).
+	Output - dictionary with arrays; keys are the array names.
+	"""
+	if not mmap_mode:
+		with np.load(file_name) as f:
+			return dict((name, f[name]) for name in f.files)
+
+	arrays = {}
+	with open(file_name, 'rb') as f:
+		buf = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+		for info in zipfile.ZipFile(f).infolist():
+			if info.compress_type != zipfile.ZIP_STORED:
+				raise ValueError('Cannot memory-map compressed array {} in {}'.format(info.filename, file_name))
+			# the member data follows the local file header (30 bytes + file name + extra field)
+			name_length, extra_length = struct.unpack('<HH', buf[info.header_offset+26:info.header_offset+30])
+			f.seek(info.header_offset + 30 + name_length + extra_length)
+			version = np.lib.format.read_magic(f)
+			if version == (1, 0):
+				shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+			else:
+				shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+			count = int(np.prod(shape))
+			a = np.frombuffer(buf, dtype, count, f.tell())
+			arrays[info.filename[:-4]] = a.reshape(shape, order = 'F' if fortran_order else 'C')
+	return arrays
+
+def read_layout_npz(file_name, mmap_mode = False):
+	"""
+	Read a binary layout file (see writers.write_layout_npz).
+	Output - a dictionary with layout information (see read_json_data).
+	"""
+	arrays = read_layout_arrays(file_name, mmap_mode)
+	if int(arrays['version']) != layout_version:
+		raise ValueError('Unsupported layout file version {}'.format(int(arrays['version'])))
+
+	strings = arrays['strings'].tostring().decode('utf-8').split(u'\0')
+	nodes = [strings[i] for i in arrays['node_id'].tolist()]
+	pos = [tuple(p) for p in arrays['node_pos'].tolist()]
+
+	d = {'edges': [], 'nodes': nodes, 'node_type': {}, 'edge_type':{}, 'extra_nodes':{}, 'pos':{}, 'label': {}, 'pathway': {}}
+	d['node_type'] = dict(zip(nodes, [layout_node_types[t] for t in arrays['node_type'].tolist()]))
+	d['pos'] = dict(zip(nodes, pos))
+	d['label'] = dict(zip(nodes, [strings[i] for i in arrays['node_label'].tolist()]))
+	d['pathway'] = dict(zip(nodes, [strings[i] for i in arrays['node_pathway'].tolist()]))
+
+	helper_pos = [tuple(p) for p in arrays['helper_pos'].tolist()]
+	helper_offsets = arrays['helper_offsets'].tolist()
+	edge_types = arrays['edge_type'].tolist()
+	for i, (r, s) in enumerate(arrays['edge_index'].tolist()):
+		e = (nodes[r], nodes[s])
+		d['edges'].append(e)
+		d['edge_type'][e] = layout_edge_types[edge_types[i]]
+		d['extra_nodes'][e] = helper_pos[helper_offsets[i]:helper_offsets[i+1]]
+
+	return d
+
+def read_layout_file(file_name, mmap_mode = False):
+	"""
+	Read layout information from a json file (Nicholas's output) or a binary 
+	layout file (.npz), based on the file extension.
+	Output - a dictionary with layout information (see read_json_data).
+	"""
+	if file_name.lower().endswith('.npz'):
+		return read_layout_npz(file_name, mmap_mode)
+	return load_json_data(file_name)
+
+# suffix of node ids of copies (node ids are the model ids plus the suffix)
+copy_pattern = re.compile('_copy_[0-9]+')
+
+class ModelIndex:
+	"""
+	Lookup tables of a cbmpy model, so reactions, reagents and species names
+	can be found without the linear searches of model.getReaction, 
+	getReagentWithSpeciesRef and model.getSpecies. Use get_model_index to 
+	build the index once per model.
+	reactions 		reaction id -> reaction.
+	species_ids 	reaction id -> list of species ids of the reagents (as R.getSpeciesIds()).
+	reagents 		reaction id -> {species id: reagent} (first reagent of each species,
+					as R.getReagentWithSpeciesRef), reagent.role is 'substrate' or 'product'.
+	species_name 	species id -> species name.
+	"""
+	def __init__(self, model):
+		self.reactions = {}
+		self.species_ids = {}
+		self.reagents = {}
+		self.species_name = {}
+		for R in model.reactions:
+			self.reactions[R.id] = R
+			self.species_ids[R.id] = [rg.getSpecies() for rg in R.reagents]
+			reagents = {}
+			for rg in R.reagents:
+				reagents.setdefault(rg.getSpecies(), rg)
+			self.reagents[R.id] = reagents
+		for S in model.species:
+			self.species_name[S.id] = S.name
+
+	def role(self, rid, sid):
+		""" Role of species sid in reaction rid ('substrate' or 'product') """
+		return self.reagents[rid][sid].role
+
+model_indices = weakref.WeakKeyDictionary()
+
+def get_model_index(model):
+	""" ModelIndex of a model, built once per model object """
+	try:
+		return model_indices[model]
+	except KeyError:
+		index = ModelIndex(model)
+		model_indices[model] = index
+		return index
+	except TypeError:
+		# model can't be weak referenced
+		return ModelIndex(model)
+
+def get_cofactors_from_sbml(d, sbml_file, model = None):
 	"""
 	Compare layout information dictionary with sbml model.
-	Input  - Dictionary with layout information, sbml model.
+	Input  - Dictionary with layout information, sbml model (file name), optionally
+			 the model that is already read from the sbml file.
 	Output - Dictionary with cofactors; keys are reaction nodes
 			 and values are a dictionaries with the species that are
 			 substrates/products of that reaction according to the 
@@ -221,12 +467,17 @@ def get_cofactors_from_sbml(d, sbml_file):
 			'diphosphate [cytoplasm]': 'PPi',
 			'ammonium [cytoplasm]': 'NH4+'}
 
-	model = cbm.CBRead.readSBML3FBC(sbml_file)
+	if model is None:
+		model = cbm.CBRead.readSBML3FBC(sbml_file)
+	index = get_model_index(model)
+
+	# model ids of the nodes (node ids without copy number)
+	model_id = dict((n, copy_pattern.sub('', n)) for n in set(itertools.chain.from_iterable(d['edges'])))
 
 	# get reagents according to the dictionary
 	reagents = {}
 	for e in d['edges']: reagents[e[0]] = set()
-	for e in d['edges']: reagents[e[0]].add(re.sub('_copy_[0-9]+', '', e[1]))
+	for e in d['edges']: reagents[e[0]].add(model_id[e[1]])
 
 	# dictionary with cofactors
 	cofactors = {}
@@ -235,13 +486,13 @@ def get_cofactors_from_sbml(d, sbml_file):
 	# compare reagents from dictionary to the model, 
 	# output ommitted reagents in cofactors dictionary.
 	for r in reagents:
-		R = model.getReaction(re.sub('_copy_[0-9]+', '', r))
-		cof_ids = set(R.getSpeciesIds()).difference(reagents[r])
+		rid = model_id[r]
+		cof_ids = set(index.species_ids[rid]).difference(reagents[r])
 		for s in cof_ids:
-			role = R.getReagentWithSpeciesRef(s).role
-			lab = model.getSpecies(s).name
+			role = index.role(rid, s)
+			lab = index.species_name[s]
 			if lab in alt_lab:
 				lab = alt_lab[lab]
 			cofactors[r][s] = {'role': role, 'label': lab}
 
-	return cofactors
\ No newline at end of file
+	return cofactors
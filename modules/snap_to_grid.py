@@ -1,35 +1,70 @@
 import sys
 import argparse
 import networkx as nx
+from readers import read_graph, read_layout_npz
+from writers import write_layout_npz
+from json_to_graphml import layout_to_graph
+from transform import pack_graph_coordinates, unpack_graph_coordinates, snap_coordinates, assign_grid_cells, xy_pair
 
-def snap_to_grid(graph, grid, offset):
-	""" Align x,y position of nodes in the graph with a grid """
-	G = nx.DiGraph()
-	G.add_nodes_from(graph.nodes())
-	G.add_edges_from(graph.edges())
-	for n in graph.nodes():
-		x = graph.node[n]['x']
-		y = graph.node[n]['y']
-		x = offset[0] + round((x-offset[0])/grid[0])*grid[0]
-		y = offset[1] + round((y-offset[1])/grid[1])*grid[1]
-		G.node[n]['x'] = x
-		G.node[n]['y'] = y
-		G.node[n]['label'] = graph.node[n]['label']
-		G.node[n]['node_type'] = graph.node[n]['node_type']
-	return G
+def snap_to_grid(graph, grid, offset = [0.0, 0.0], ctrl_grid = None, ctrl_offset = None, unique = False, clearance = [1, 1]):
+	"""
+	Align x,y position of nodes in the graph with a grid. The 'x' and 'y' node
+	attributes are updated in place, all other node data is preserved.
+	Helper nodes (node_type 'ctrl') are snapped separately to ctrl_grid (with
+	ctrl_offset). If ctrl_grid is None the same grid is used for all nodes, if 
+	ctrl_grid is 0 helper nodes are left in place.
+	If unique, reaction and species nodes are assigned to distinct grid cells
+	that are at least 'clearance' cells apart (see transform.assign_grid_cells).
+	"""
+	if ctrl_grid is None:
+		ctrl_grid = grid
+	if ctrl_offset is None:
+		ctrl_offset = offset
+
+	nodes = []
+	ctrl_nodes = []
+	for n, attr in graph.node.items():
+		if attr.get('node_type') == 'ctrl':
+			ctrl_nodes.append(n)
+		else:
+			nodes.append(n)
+
+	for nds, grd, off, unq in [(nodes, grid, offset, unique), (ctrl_nodes, ctrl_grid, ctrl_offset, False)]:
+		if len(nds) == 0 or not any(grd):
+			continue
+		nds, coords = pack_graph_coordinates(graph, nds)
+		if unq:
+			coords = assign_grid_cells(coords, grd, off, clearance)
+		else:
+			coords = snap_coordinates(coords, grd, off)
+		unpack_graph_coordinates(graph, nds, coords)
+
+	return graph
 
 def main(args):
 	file_name = ' '.join(args.graphml_file)
-	graph = nx.read_graphml(file_name)
-	graph = snap_to_grid(graph, args.grid, args.offset)
-	gx, gy = args.grid
+	binary = file_name.lower().endswith('.npz')
+	if binary:
+		graph = layout_to_graph(read_layout_npz(file_name))
+	else:
+		# (networkx keeps all node and edge data, e.g. colours, readers.read_graphml only the layout)
+		graph = nx.read_graphml(file_name)
+	graph = snap_to_grid(graph, args.grid, args.offset, args.ctrl_grid, unique = args.unique, clearance = args.clearance)
+	gx, gy = xy_pair(args.grid)
 	gx, gy = int(gx), int(gy)
-	nx.write_graphml(graph, file_name.replace('.graphml', '')+'_grid_{}_{}.graphml'.format(gx, gy))
+	if binary:
+		write_layout_npz(read_graph(graph), file_name[:-4]+'_grid_{}_{}.npz'.format(gx, gy))
+	else:
+		nx.write_graphml(graph, file_name.replace('.graphml', '')+'_grid_{}_{}.graphml'.format(gx, gy))
 
 if __name__ == "__main__":
 	parser = argparse.ArgumentParser()
-	parser.add_argument('graphml_file', metavar= 'file_name.graphml', nargs='+')
+	parser.add_argument('graphml_file', metavar= 'file_name.graphml', nargs='+', help = "A graphml file or a binary layout file (.npz), the output is saved in the same format.")
 	parser.add_argument('--grid', '-g', type = float, nargs='+', default = [1.0, 1.0])
 	parser.add_argument('--offset', type = float, nargs= '+', default = [0.0, 0.0])
+	parser.add_argument('--ctrl_grid', type = float, nargs= '+', metavar = '10.0', help = "Grid for the helper (ctrl) nodes. Default is the same grid as the other nodes, use 0 to leave helper nodes in place.")
+	parser.add_argument('--unique', dest = 'unique', action = 'store_true', help = "Place reaction and species nodes in distinct grid cells (nodes that would end up in the same cell are moved to the nearest free cell).")
+	parser.add_argument('--clearance', type = int, nargs = '+', default = [1, 1], metavar = '1', help = "Minimum distance (in grid cells) between nodes when using --unique. Example: --clearance 2 1 (keep an empty cell between nodes on the same row)")
+	parser.set_defaults(unique = False)
 	args = parser.parse_args()
-	main(args)
\ No newline at end of file
+	main(args)
@@ -0,0 +1,236 @@
+import re
+import argparse
+import numpy as np
+from readers import copy_pattern
+from convert_layout import read_any, write_any
+from transform import xy_pair
+from svg_assembly import get_label_width
+
+def hub_edges(d, max_degree):
+	"""
+	Edges of the hub metabolites in a layout: species nodes with more than
+	max_degree edges.
+	Output - list of (species, list of edges) tuples, in the order of d['nodes'].
+	"""
+	edges = {}
+	for e in d['edges']:
+		edges.setdefault(e[1], []).append(e)
+	return [(s, edges[s]) for s in d['nodes'] if len(edges.get(s, [])) > max_degree]
+
+def cluster_nodes(nodes, pos, max_size, max_extent = None):
+	"""
+	Split nodes into groups of nearby nodes with at most max_size nodes, by
+	recursive bisection (at the median) of the longest side of their bounding
+	box. The number of groups is ceil(len(nodes)/max_size), or more with
+	max_extent: groups whose bounding box is longer than that are split as well.
+	Output - list of groups (lists of nodes).
+	"""
+	coords = np.array([pos[n] for n in nodes], dtype=float).reshape(-1, 2)
+
+	def bisect(idx):
+		c = coords[idx]
+		extent = c.max(0) - c.min(0)
+		if len(idx) <= max_size and (max_extent is None or extent.max() <= max_extent):
+			return [[nodes[i] for i in idx]]
+		axis = np.argmax(extent)
+		idx = idx[np.argsort(c[:, axis], kind='mergesort')]
+		# split such that both halves can be divided in full groups
+		parts = -(-len(idx)//max_size)
+		half = len(idx)*(parts//2)//parts if parts > 1 else len(idx)//2
+		return bisect(idx[:half]) + bisect(idx[half:])
+
+	return bisect(np.arange(len(nodes)))
+
+def copy_numbers(nodes):
+	""" Highest copy number ('_copy_N' suffix) in use for each node id without suffix """
+	numbers = {}
+	for n in nodes:
+		m = re.search('_copy_([0-9]+)', n)
+		base = copy_pattern.sub('', n)
+		numbers[base] = max(numbers.get(base, 0), int(m.group(1)) if m else 0)
+	return numbers
+
+def label_boxes(d, font, font_size, scale, padding_labels):
+	"""
+	Size of the labels of the species nodes, and of the area around the reaction
+	nodes that labels must stay out of, in layout coordinates, for split_hubs.
+	Above and below a reaction that is the label height plus the minimum path
+	length (the font size, see svg_paths.path_direction_end) and a pixel.
+	font, font_size and padding_labels are those of svg_assembly.get_svgdata,
+	scale is the scale factor of the layout coordinates to the svg.
+	Output - dictionary with (width, height) tuples, keys are the nodes.
+	"""
+	font_size = float(font_size)
+	scale = [float(v) for v in xy_pair(scale)]
+	padding_labels = [float(v) for v in xy_pair(padding_labels)] if padding_labels else (font_size, font_size)
+	h = (font_size + 2*padding_labels[1])/scale[1]
+	boxes = {}
+	for n in d['nodes']:
+		if d['node_type'][n] == 'species':
+			lab = d['label'][n].replace(' [cytoplasm]', '')
+			boxes[n] = ((get_label_width(lab, font, font_size) + 2*padding_labels[0])/scale[0], h)
+		else:
+			boxes[n] = (h*scale[1]/scale[0], h + 2*(font_size + 1)/scale[1])
+	return boxes
+
+def row_spacing(d):
+	"""
+	Smallest horizontal distance between species nodes at the same height
+	(get_svgdata caps the labels to this width), None if there are none.
+	"""
+	rows = {}
+	for n in d['nodes']:
+		if d['node_type'][n] == 'species':
+			rows.setdefault(d['pos'][n][1], []).append(d['pos'][n][0])
+	dx = [np.diff(sorted(x)).min() for x in rows.values() if len(x) > 1]
+	dx = [v for v in dx if v > 0]
+	return min(dx) if dx else None
+
+def free_position(d, boxes, box, pos, step, spacing = None):
+	"""
+	First position from pos, stepping step in y-direction, where a node with a
+	box (width, height) does not overlap the boxes of the nodes in the layout
+	(boxes, centred on the node positions) and is not closer than spacing to a
+	species at the same height.
+	"""
+	nodes = d['nodes']
+	xy = np.array([d['pos'][n] for n in nodes], dtype=float).reshape(-1, 2)
+	wh = np.array([boxes[n] for n in nodes], dtype=float).reshape(-1, 2)
+	species = np.array([d['node_type'][n] == 'species' for n in nodes], dtype=bool)
+	x, y = pos
+	for _ in range(10000):
+		dx = np.abs(xy[:, 0] - x)
+		dy = np.abs(xy[:, 1] - y)
+		overlap = (dx < 0.5*(wh[:, 0] + box[0])) & (dy < 0.5*(wh[:, 1] + box[1]))
+		if spacing:
+			overlap |= species & (dy == 0) & (dx < spacing)
+		if not overlap.any():
+			break
+		y += step
+	return (x, y)
+
+def split_hubs(d, max_degree, boxes = None, max_extent = 4):
+	"""
+	Split hub metabolites into copies, so that no species node has more than
+	max_degree edges. The reactions of a hub are grouped by position (see
+	cluster_nodes, a group is at most max_extent label heights of the hub long,
+	so the copy is near all of its reactions); the group closest to the hub stays connected to it and each
+	other group gets a copy of the species ('_copy_N' node id, same label and
+	pathway). A copy is placed above (or below, on the side of the hub) the
+	centre of its group, so paths from the reactions can be drawn vertically
+	(the default direction), as close to the reactions as their boxes allow
+	(see label_boxes) or further out if that spot is taken: the label of a copy
+	does not overlap the boxes of the other nodes and is not closer to a species
+	at the same height than the labels of the layout are to each other.
+	Without boxes, all nodes get a box of the median vertical distance between
+	the hubs and their reactions. Helper points of the moved edges are dropped.
+	Input  - dictionary with layout information (changed in place).
+	Output - the dictionary.
+	"""
+	hubs = hub_edges(d, max_degree)
+	if boxes is None:
+		dy = [abs(d['pos'][e[0]][1] - d['pos'][s][1]) for s, edges in hubs for e in edges]
+		dy = [v for v in dy if v > 0] or [1.0]
+		boxes = dict((n, (np.median(dy), np.median(dy))) for n in d['nodes'])
+	spacing = row_spacing(d)
+	numbers = copy_numbers(d['nodes'])
+	new_edge = {}
+	for s, edges in hubs:
+		reactions = [e[0] for e in edges]
+		spos = np.array(d['pos'][s], dtype=float)
+		groups = cluster_nodes(reactions, d['pos'], max_degree, max_extent*boxes[s][1])
+		centres = [np.mean([d['pos'][r] for r in rs], axis=0) for rs in groups]
+		keep = np.argmin([np.hypot(*(c - spos)) for c in centres])
+		box = boxes[s]
+
+		base = copy_pattern.sub('', s)
+		for i, rs in enumerate(groups):
+			if i == keep:
+				continue
+			numbers[base] += 1
+			n = base + '_copy_' + str(numbers[base])
+			y = [d['pos'][r][1] for r in rs]
+			gap = 0.5*(max(boxes[r][1] for r in rs) + box[1])
+			if spos[1] >= centres[i][1]:
+				pos = free_position(d, boxes, box, (float(centres[i][0]), max(y) + gap), box[1], spacing)
+			else:
+				pos = free_position(d, boxes, box, (float(centres[i][0]), min(y) - gap), -box[1], spacing)
+			d['nodes'].append(n)
+			d['node_type'][n] = d['node_type'][s]
+			d['label'][n] = d['label'][s]
+			d['pathway'][n] = d['pathway'][s]
+			d['pos'][n] = pos
+			boxes[n] = box
+			for r in rs:
+				e = (r, n)
+				new_edge[(r, s)] = e
+				d['edge_type'][e] = d['edge_type'].pop((r, s))
+				d['extra_nodes'].pop((r, s), None)
+				d['extra_nodes'][e] = []
+
+	d['edges'] = [new_edge.get(e, e) for e in d['edges']]
+	return d
+
+def hubs_to_cofactors(d, max_degree):
+	"""
+	Draw the edges of hub metabolites (species with more than max_degree edges)
+	as cofactors of the reactions instead. Edges are kept if they are the last
+	edge of a reaction; hub nodes without edges are removed.
+	Input  - dictionary with layout information (changed in place).
+	Output - dictionary with cofactors (see readers.get_cofactors_from_sbml),
+			 keys are all reaction nodes.
+	"""
+	cofactors = {}
+	num_edges = {}
+	for e in d['edges']:
+		cofactors[e[0]] = {}
+		num_edges[e[0]] = num_edges.get(e[0], 0) + 1
+
+	removed = set()
+	hubs = []
+	for s, edges in hub_edges(d, max_degree):
+		hubs.append(s)
+		for e in edges:
+			r = e[0]
+			if num_edges[r] == 1:
+				continue
+			num_edges[r] -= 1
+			cofactors[r][copy_pattern.sub('', s)] = {'role': d['edge_type'].pop(e), 'label': d['label'][s]}
+			d['extra_nodes'].pop(e, None)
+			removed.add(e)
+	d['edges'] = [e for e in d['edges'] if e not in removed]
+
+	connected = set(e[1] for e in d['edges'])
+	for s in hubs:
+		if s not in connected:
+			d['nodes'].remove(s)
+			for k in ['node_type', 'pos', 'label', 'pathway']:
+				d[k].pop(s)
+	return cofactors
+
+def add_cofactors(cofactors, hub_cofactors):
+	"""
+	Combine cofactors (e.g. from the sbml model) with the cofactors of
+	hubs_to_cofactors. Cofactors that are in both are taken from the first.
+	"""
+	if cofactors is None:
+		return hub_cofactors
+	for r in hub_cofactors:
+		cofactors.setdefault(r, {})
+		for s in hub_cofactors[r]:
+			cofactors[r].setdefault(s, hub_cofactors[r][s])
+	return cofactors
+
+def main(args):
+	file_name = ' '.join(args.layout_file)
+	d = split_hubs(read_any(file_name), args.max_degree)
+	write_any(d, args.output)
+	print 'layout saved in', args.output
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Split hub metabolites (species with many edges) into copies near their reactions.")
+	parser.add_argument('layout_file', metavar = 'file_name.json', nargs = '+', help = "Input layout file (.json, .graphml or .npz).")
+	parser.add_argument('--max_degree', '-d', type = int, default = 10, help = "Maximum number of edges of a species node.")
+	parser.add_argument('--output', '-o', default = 'layout.npz', help = "Output layout file, the format is based on the extension (.npz, .graphml or .json).")
+	args = parser.parse_args()
+	main(args)
@@ -3,6 +3,10 @@ import argparse
 import itertools
 from PIL import ImageFont
 from svg_paths import get_paths
+from path_encoding import compact_path
+from svg_output import save_svgdoc
+from transform import transform_layout, xy_pair
+from timing import NoTimer
 from pysvg.structure import svg, g
 from pysvg.text import text
 from pysvg.shape import path, circle
@@ -15,7 +19,7 @@ def get_label_width(label, font, font_size):
 	width = width*(font_size/font.size)
 	return width
 
-def get_svgdata(d, font, font_size, scale, padding, padding_labels, normalize, overlap, cofactors = None, cap_labels = True, scale_labels= False, defdir='v', reverse_cof = []):
+def get_svgdata(d, font, font_size, scale, padding, padding_labels, normalize, overlap, cofactors = None, cap_labels = True, scale_labels= False, defdir='v', reverse_cof = [], path_precision = None, timer = NoTimer()):
 	""" Get all information to make an svg-file with the metabolic map. Output in a dictionary.
 	d 				Dictionary with information extracted from json-output from Nicholas (dictionary)
 						>> See read_json_data function in json_to_svg.py
@@ -35,112 +39,95 @@ def get_svgdata(d, font, font_size, scale, padding, padding_labels, normalize, o
 	scale_labels	Scale labels that are very long (bool)
 	defdir			Default direction of arrows from reaction nodes ('v'/'vertical' or 'h'/'horizontal')
 	reverse_cof		List of reaction nodes that should have the cofactors placed in reverse direction compared to default
+	path_precision	Write the paths as compact path data with this number of decimals (see path_encoding.py),
+					None to keep the path data of get_paths (int)
+	timer			Records the time of the stages (coordinate transform, label measurement, path routing
+					and overlap checks) and counters, see timing.py (StageTimer)
 
 	OUTPUT dictionary keys: 'rxn_nodes' (reaction nodes), 'paths' (svg paths), 'labels', 'font_size', 'font_family'
 	"""
 
-	if len(scale)==1:
-		scale.append(scale[0])
-	if len(padding) == 1:
-		padding.append(padding[0])
 	if padding_labels:
-		if len(padding_labels) == 1:
-			padding_labels.append(padding_labels[0])
+		padding_labels = xy_pair(padding_labels)
 	else:
 		padding_labels = [font_size, font_size]
 
 	role = d.pop('edge_type')
 
-	# adjust coordinates
-	min_x = min([p[0] for p in d['pos'].values()])
-	max_y = max([p[1] for p in d['pos'].values()])
-
-	for n, p in d['pos'].items():
-		if normalize:
-			p = (p[0]-min_x, p[1]-max_y) # normalize
-		p = (p[0]*scale[0], p[1]*scale[1]) # scale
-		p = (p[0] + padding[0], p[1] - padding[1]) # add padding
-		p = (p[0], -p[1]) # convert to svg coordinates
-		d['pos'][n] = p
+	# adjust coordinates (normalize, scale, add padding and convert to svg coordinates)
+	with timer.stage('transform'):
+		transform_layout(d, scale, padding, normalize, flip_y = True)
 
-	for e in d['extra_nodes']:
-		for i in range(len(d['extra_nodes'][e])):
-			p = d['extra_nodes'][e][i]
-			if normalize:
-				p = (p[0]-min_x, p[1]-max_y) # normalize
-			p = (p[0]*scale[0], p[1]*scale[1]) # scale
-			p = (p[0] + padding[0], p[1] - padding[1]) # add padding
-			p = (p[0], -p[1]) # convert to svg coordinates
-			d['extra_nodes'][e][i] = p
-
-	# get max width of labels
-	snpos = [d['pos'][n] for n in d['nodes'] if d['node_type'][n]=='species']
-	snpos.sort(key = lambda p: p[1])
-	dx = []
-	for _, group in itertools.groupby(snpos, key = lambda p: p[1]):
-		dx+= [abs(c[0]-c[1]) for c in itertools.combinations([p[0] for p in group], 2)]
-	max_w = min(dx) + 2*padding_labels[0]
+	with timer.stage('labels'):
+		# get max width of labels
+		snpos = [d['pos'][n] for n in d['nodes'] if d['node_type'][n]=='species']
+		snpos.sort(key = lambda p: p[1])
+		dx = []
+		for _, group in itertools.groupby(snpos, key = lambda p: p[1]):
+			dx+= [abs(c[0]-c[1]) for c in itertools.combinations([p[0] for p in group], 2)]
+		max_w = min(dx) + 2*padding_labels[0]
 	
-	# get labels, label size
-	if cofactors:
-		for r in cofactors:
-			for s in cofactors[r]:
-				d['label'][s] = cofactors[r][s]['label']
-	d['label_size'] = {}
-	link_text = {}
-	fs = {}
-	if cap_labels and get_label_width('...', font, font_size) + 2*padding_labels[0] > max_w:
-		print 'Please scale up or use smaller font size to prevent overlapping labels'
-		for n in d['label']:
-			link_text[n] = d['label'][n]
-			d['label'][n] = '...'
-			w = get_label_width(d['label'][n], font, font_size) + 2*padding_labels[0]
-			h = font_size + 2*padding_labels[1]
-			d['label_size'][n] = (w, h)
-			fs[n] = font_size
+		# get labels, label size
+		if cofactors:
+			for r in cofactors:
+				for s in cofactors[r]:
+					d['label'][s] = cofactors[r][s]['label']
+		d['label_size'] = {}
+		link_text = {}
+		fs = {}
+		if cap_labels and get_label_width('...', font, font_size) + 2*padding_labels[0] > max_w:
+			print 'Please scale up or use smaller font size to prevent overlapping labels'
+			for n in d['label']:
+				link_text[n] = d['label'][n]
+				d['label'][n] = '...'
+				w = get_label_width(d['label'][n], font, font_size) + 2*padding_labels[0]
+				h = font_size + 2*padding_labels[1]
+				d['label_size'][n] = (w, h)
+				fs[n] = font_size
 
-	elif cap_labels:
-		for n in d['label']:
-			link_text[n]= d['label'][n]
-			lab = d['label'][n].replace(' [cytoplasm]', '') # yeast concensus models adjustment
-			w = get_label_width(lab, font, font_size) + 2*padding_labels[0]
-			# cap too long labels
-			if w > max_w:
-				for i in range(len(lab),0,-1):
-					newlab = lab[:i]+'...'
-					neww = get_label_width(newlab, font, font_size) + 2*padding_labels[0]
-					if neww <= max_w:
-						lab = newlab
-						break
-				else:
-					lab = '...'
-			d['label'][n] = lab
-			w = get_label_width(d['label'][n], font, font_size) + 2*padding_labels[0]
-			h = font_size + 2*padding_labels[1]
-			d['label_size'][n] = (w, h)
-			fs[n] = font_size
+		elif cap_labels:
+			for n in d['label']:
+				link_text[n]= d['label'][n]
+				lab = d['label'][n].replace(' [cytoplasm]', '') # yeast concensus models adjustment
+				w = get_label_width(lab, font, font_size) + 2*padding_labels[0]
+				# cap too long labels
+				if w > max_w:
+					for i in range(len(lab),0,-1):
+						newlab = lab[:i]+'...'
+						neww = get_label_width(newlab, font, font_size) + 2*padding_labels[0]
+						if neww <= max_w:
+							lab = newlab
+							break
+					else:
+						lab = '...'
+				d['label'][n] = lab
+				w = get_label_width(d['label'][n], font, font_size) + 2*padding_labels[0]
+				h = font_size + 2*padding_labels[1]
+				d['label_size'][n] = (w, h)
+				fs[n] = font_size
 	
-	elif scale_labels:
-		for n in d['label']:
-			link_text[n]= d['label'][n]
-			lab = d['label'][n].replace(' [cytoplasm]', '')
-			d['label'][n] = lab
-			w = get_label_width(lab, font, font_size)
-			# scale too long labels
-			if w > max_w:
-				fs[n] = font_size * max_w/w
-				w = max_w
-			h = font_size + 2*padding_labels[1]
-			d['label_size'][n] = (w, h)
+		elif scale_labels:
+			for n in d['label']:
+				link_text[n]= d['label'][n]
+				lab = d['label'][n].replace(' [cytoplasm]', '')
+				d['label'][n] = lab
+				w = get_label_width(lab, font, font_size)
+				# scale too long labels
+				if w > max_w:
+					fs[n] = font_size * max_w/w
+					w = max_w
+				h = font_size + 2*padding_labels[1]
+				d['label_size'][n] = (w, h)
 
-	else:
-		for n in d['label']:
-			link_text[n]= d['label'][n]
-			lab = d['label'][n].replace(' [cytoplasm]', '')
-			d['label'][n] = lab
-			w = get_label_width(lab, font, font_size)
-			h = font_size + 2*padding_labels[1]
-			d['label_size'][n] = (w, h)
+		else:
+			for n in d['label']:
+				link_text[n]= d['label'][n]
+				lab = d['label'][n].replace(' [cytoplasm]', '')
+				d['label'][n] = lab
+				w = get_label_width(lab, font, font_size)
+				h = font_size + 2*padding_labels[1]
+				d['label_size'][n] = (w, h)
+		timer.count('labels', len(d['label']))
 
 	# get paths
 	paths_svg, d['pos'] = get_paths(
@@ -150,6 +137,7 @@ def get_svgdata(d, font, font_size, scale, padding, padding_labels, normalize, o
 		prevent_overlap = not(overlap), 
 		cofactors= cofactors, 
 		reverse_cofactor_direction = reverse_cof,
+		timer = timer,
 		**d) 
 
 	labels = {}
@@ -177,6 +165,8 @@ def get_svgdata(d, font, font_size, scale, padding, padding_labels, normalize, o
 	pstyle = 'fill:none;stroke:#cccccc;stroke-width:{};fill-opacity:0;stroke-linecap:round;marker-end:url(#{})'
 	paths = {}
 	for e in paths_svg:
+		if path_precision is not None:
+			paths_svg[e] = compact_path(paths_svg[e], path_precision)
 		paths[e]= {'d': paths_svg[e], 'style':pstyle.format(0.2*font_size, role[e])}
 
 	rn = {}
@@ -264,11 +254,13 @@ def main(args):
 	with open(file_name) as json_data:
 		svg_data = json.load(json_data)
 	svgdoc = get_svgdoc(**svg_data)
-	svgdoc.save(args.svg_name)
+	save_svgdoc(svgdoc, args.svg_name, args.compress, args.minify)
 
 if __name__ == "__main__":
 	parser = argparse.ArgumentParser()
 	parser.add_argument('json_file', metavar= 'file_name.json', nargs= '+')
 	parser.add_argument('--svg_name', '-o', default = 'temp.svg')
+	parser.add_argument('--compress', dest = 'compress', action = 'store_true', help = "Write a gzip compressed svg (.svgz).")
+	parser.add_argument('--minify', dest = 'minify', action = 'store_true', help = "Write the svg without indentation and superfluous spaces (see svg_output.py).")
 	args = parser.parse_args()
 	main(args)
\ No newline at end of file
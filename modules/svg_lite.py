@@ -0,0 +1,52 @@
+"""
+Format strings for writing svg elements directly, with the same xml as the
+getXML method of the pysvg element classes (attributes in the same order and
+escaped the same way), for documents that are only written, such as the final
+maps of layout_final.py. No element objects are created.
+"""
+
+def quote_attrib(value):
+	""" Escape xml characters in an attribute value (see pysvg.core.BaseElement.quote_attrib) """
+	s = isinstance(value, basestring) and value or '%s' % value
+	s = s.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+	if '"' in s:
+		s = s.replace('"', '&quot;')
+	return s
+
+def attribute_string(value):
+	""" Attribute value as written by getXML """
+	value = str(value)
+	if '&' in value or '<' in value or '>' in value or '"' in value:
+		value = quote_attrib(value)
+	return value
+
+def start_tag(name, keys, unset = ()):
+	"""
+	Start tag of an element (without the closing ' />' or ' >') as written by
+	getXML, as a format string. keys are the attributes in the order they are
+	set (e.g. constructor arguments first), the values are positional fields in
+	the same order. Attributes in unset are always None: they are not written
+	and have no field, but still count for the order of the other attributes.
+	"""
+	fields = [k for k in keys if k not in unset]
+	tag = '<' + name + ' '
+	for k in dict.fromkeys(keys):
+		if k not in unset:
+			tag += k + '="{' + str(fields.index(k)) + '}" '
+	return tag
+
+def element_template(name, keys, unset = ()):
+	"""
+	Format string of an element with one text child (the last positional
+	field, e.g. a text element with its content), see start_tag.
+	"""
+	fields = [k for k in keys if k not in unset]
+	return start_tag(name, keys, unset) + ' >\n{' + str(len(fields)) + '}</' + name + '>\n'
+
+def empty_element_template(name, keys, unset = ()):
+	""" Format string of an element without children, see start_tag """
+	return start_tag(name, keys, unset) + ' />\n'
+
+def open_element_template(name, keys, unset = ()):
+	""" Format string of the start of an element with children (end with '</name>\n'), see start_tag """
+	return start_tag(name, keys, unset) + ' >\n'
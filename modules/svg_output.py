@@ -0,0 +1,78 @@
+"""
+Writing and reading svg files, optionally minified and/or gzip compressed
+(.svgz), for all svg writers (json_to_svg.py, graph_to_svg.py,
+svg_assembly.py, layout_final.py and visualize.py).
+
+Minifying keeps one line per line of the original (without indentation,
+spaces before the end of tags and spaces in the css), because visualize.py
+changes the final maps line by line: the css rules of a reaction and the flux
+value placeholders must stay on their own lines.
+"""
+import re
+import gzip
+
+gzip_magic = '\x1f\x8b'
+
+def svg_file_name(file_name, compress = False):
+	""" Name of the written file: .svg becomes .svgz when compressed """
+	if compress and file_name.endswith('.svg'):
+		return file_name + 'z'
+	return file_name
+
+def open_svg(file_name):
+	""" Open an svg file for reading, gzip compressed (.svgz) or not """
+	with open(file_name, 'rb') as f:
+		compressed = f.read(2) == gzip_magic
+	if compressed:
+		return gzip.open(file_name, 'rb')
+	return open(file_name, 'rb')
+
+tag_end_pattern = re.compile(r'"\s+(/?>)')
+path_data_end_pattern = re.compile(r'(\sd="[^"]*?)\s+"')
+css_space_pattern = re.compile(r'\s*([{};:,])\s*')
+
+def minify_lines(lines):
+	""" Minified lines of an svg document (see the module docstring), generator """
+	style = script = False
+	for line in lines:
+		line = line.strip()
+		if not line:
+			continue
+		if script:
+			script = '</script>' not in line
+		elif style and not line.startswith('</style>'):
+			line = css_space_pattern.sub(r'\1', re.sub(r'\s+', ' ', line)).replace(';}', '}')
+		else:
+			script = line.startswith('<script') and '</script>' not in line
+			style = line.startswith('<style') and '</style>' not in line
+			if not script:
+				line = path_data_end_pattern.sub(r'\1"', tag_end_pattern.sub(r'"\1', line))
+		if line.startswith('</style>'):
+			style = False
+		yield line + '\n'
+
+def minify_svg(xml):
+	""" Minified svg document """
+	return ''.join(minify_lines(xml.splitlines()))
+
+def write_svg(file_name, xml, compress = False, minify = False):
+	"""
+	Write an svg document (string, or list of strings that are the lines of
+	the document). Output - name of the written file (see svg_file_name).
+	"""
+	if minify:
+		xml = minify_svg(xml if isinstance(xml, basestring) else ''.join(xml))
+	elif not isinstance(xml, basestring):
+		xml = ''.join(xml)
+	file_name = svg_file_name(file_name, compress)
+	if compress:
+		f = gzip.open(file_name, 'wb')
+	else:
+		f = open(file_name, 'wb')
+	with f:
+		f.write(xml)
+	return file_name
+
+def save_svgdoc(doc, file_name, compress = False, minify = False):
+	""" Save a pysvg document (same as doc.save) with write_svg """
+	return write_svg(file_name, doc.wrap_xml(doc.getXML()), compress, minify)
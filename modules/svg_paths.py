@@ -4,8 +4,10 @@ import math
 import numpy as np
 import networkx as nx
 from itertools import groupby, combinations, product
+from collections import Counter
 from PIL import ImageFont
 from svg.path import Path, Line, Arc, CubicBezier
+from timing import NoTimer
 
 from pysvg.structure import svg, g
 from pysvg.text import text
@@ -13,92 +15,146 @@ from pysvg.shape import path
 from pysvg.core import TextContent
 
 
-def get_cofactors_layout(rpos, cofactors, direction, label, label_size, dist = (10, 15)):
-	path = {'v': 'm {x},{y} v {v} c 0,{dy} {dx1},{dy} {dx2},{dy}', 
-	        'h': 'm {x},{y} h {h} c {dx},0 {dx},{dy1} {dx},{dy2}'}
+# character counts of labels and match scores of label pairs (cofactor labels
+# recur in many reactions)
+label_counts = {}
+label_scores = {}
+
+def label_match(lab1, lab2):
+	""" Number of character matches between two labels, i.e. sum([lab1.count(ch) for ch in lab2]) """
+	if (lab1, lab2) not in label_scores:
+		for lab in (lab1, lab2):
+			if lab not in label_counts:
+				label_counts[lab] = Counter(lab)
+		c1 = label_counts[lab1]
+		label_scores[(lab1, lab2)] = sum(c1[ch]*n for ch, n in label_counts[lab2].iteritems())
+	return label_scores[(lab1, lab2)]
+
+def pair_cofactors(subs, prds, label):
+	"""
+	Pair substrate and product cofactors with similar labels (e.g. ATP and ADP).
+	Pairs are chosen greedily in order of (match score, substrate, product).
+	Output - list of [substrate, product] pairs, followed by [substrate, None]
+			 and [None, product] for the cofactors that are not paired.
+	"""
+	scores = sorted(((label_match(label[s], label[p]), s, p) for s, p in product(subs, prds)), reverse = True)
 	gr = []
-	subs = [m for m in cofactors.keys() if cofactors[m]['role']=='substrate']
-	prds = [m for m in cofactors.keys() if cofactors[m]['role']=='product']
-	
-	while len(subs)>0 and len(prds)>0:
-		mtch = []
-		for s, p in product(subs, prds):
-			lab1 = label[s]
-			lab2 = label[p]
-			mtch.append([sum([lab1.count(ch) for ch in lab2]), s, p])
-		mtch.sort()
-		best_mtch = mtch[-1][1:]
-		gr.append(best_mtch)
-		subs.remove(best_mtch[0])
-		prds.remove(best_mtch[1])
-	
-	gr += [[m, None] for m in subs]
-	gr += [[None, m] for m in prds]
+	paired = set()
+	for _, s, p in scores:
+		if s not in paired and p not in paired:
+			gr.append([s, p])
+			paired.update((s, p))
+	gr += [[m, None] for m in subs if m not in paired]
+	gr += [[None, m] for m in prds if m not in paired]
+	return gr
+
+# cofactor geometry relative to the reaction node, keys are (direction, dist, label sizes)
+cofactor_templates = {}
+
+def get_cofactors_template(sizes, direction, dist):
+	"""
+	Positions and paths of the cofactor labels of a reaction relative to the 
+	reaction node.
+	Input  - sizes 		list with a (substrate label size, product label size) 
+						tuple for each group of cofactors (see pair_cofactors),
+						None if the group has no substrate or product.
+			 direction 	'v' (vertical) or 'h' (horizontal).
+			 dist 		(distance, distance) of the labels to the reaction node, 
+						reversed direction if the second distance is negative.
+	Output - list of (group index, index in group, x terms, y terms, path) tuples,
+			 the label position is (x, y) with x = rpos[0] + x terms and 
+			 y = rpos[1] + y terms (added in order) and the path is the svg path
+			 from the reaction node without the initial 'm x,y'.
+	"""
+	path = {'v': 'v {v} c 0,{dy} {dx1},{dy} {dx2},{dy}', 
+	        'h': 'h {h} c {dx},0 {dx},{dy1} {dx},{dy2}'}
+	template = []
 
 	if direction == 'v':
 		dx = -dist[0]
 		dy = -dist[1]
 		add_dy = dy
 
-		for i in range(len(gr)):
-			g = gr[i]
+		for i in range(len(sizes)):
 			dx = dx * -1
 			for j in range(2):
-				if g[j]:
-					x = rpos[0] + dx + 0.5*label_size[g[j]][0]*dx/abs(dx)
-					y = rpos[1] + dy
-					cofactors[g[j]]['pos'] = (x, y)
-					cofactors[g[j]]['path'] = path['v'].format(
-						x = rpos[0], 
-						y = rpos[1], 
-						v = dy-abs(add_dy)*dy/abs(dy),
-						dy = abs(add_dy)*dy/abs(dy), 
-						dx1 = dx/2., 
-						dx2 = dx)
+				if sizes[i][j]:
+					template.append((i, j, 
+						(dx, 0.5*sizes[i][j][0]*dx/abs(dx)), 
+						(dy,),
+						path['v'].format(
+							v = dy-abs(add_dy)*dy/abs(dy),
+							dy = abs(add_dy)*dy/abs(dy), 
+							dx1 = dx/2., 
+							dx2 = dx)))
 				dy = dy * -1
 			if i%2:
 				dy+= add_dy
 	else:
+		# left and right label of each group (substrate left, unless reversed)
+		left, right = 0, 1
 		if dist[1] <0:
 			dist = (dist[0], abs(dist[1]))
-			for i in range(len(gr)):
-				gr[i] = gr[i][::-1]
+			left, right = 1, 0
 
 		dx_path = {0:[-dist[1], dist[1]], 1:[-dist[1], dist[1]]}
 		dx_pos = {0:[0,0], 1:[0,0]}
 		dy = -dist[0]
 
-		for i in range(len(gr)):
-			g = gr[i]
+		for i in range(len(sizes)):
 			dy = dy * -1
 			
-			if g[0]: # left (substrate)
-				x = rpos[0] + dx_pos[i%2][0] - 0.5*label_size[g[0]][0]
-				y = rpos[1] + dy + 0.5*label_size[g[0]][1]*dy/abs(dy)
-				cofactors[g[0]]['pos']  = (x, y)
-				cofactors[g[0]]['path'] = path['h'].format(
-					x = rpos[0],
-					y = rpos[1],
-					h = dx_pos[i%2][0],
-					dx = dx_path[i%2][0], 
-					dy1 = dy/2., 
-					dy2 = dy)
-
-				dx_pos[i%2][0] += -label_size[g[0]][0]
-
-			if g[1]:# right (product)
-				x = rpos[0] + dx_pos[i%2][1] + 0.5*label_size[g[1]][0]
-				y = rpos[1] + dy + 0.5*label_size[g[1]][1]*dy/abs(dy)
-				cofactors[g[1]]['pos']  = (x, y)
-				cofactors[g[1]]['path'] = path['h'].format(
-					x = rpos[0],
-					y = rpos[1],
-					h = dx_pos[i%2][1],
-					dx = dx_path[i%2][1], 
-					dy1 = dy/2., 
-					dy2 = dy)
-
-				dx_pos[i%2][1] += label_size[g[1]][0]
+			if sizes[i][left]: # left (substrate)
+				size = sizes[i][left]
+				template.append((i, left,
+					(dx_pos[i%2][0], - 0.5*size[0]),
+					(dy, 0.5*size[1]*dy/abs(dy)),
+					path['h'].format(
+						h = dx_pos[i%2][0],
+						dx = dx_path[i%2][0], 
+						dy1 = dy/2., 
+						dy2 = dy)))
+
+				dx_pos[i%2][0] += -size[0]
+
+			if sizes[i][right]:# right (product)
+				size = sizes[i][right]
+				template.append((i, right,
+					(dx_pos[i%2][1], 0.5*size[0]),
+					(dy, 0.5*size[1]*dy/abs(dy)),
+					path['h'].format(
+						h = dx_pos[i%2][1],
+						dx = dx_path[i%2][1], 
+						dy1 = dy/2., 
+						dy2 = dy)))
+
+				dx_pos[i%2][1] += size[0]
+
+	return template
+
+def get_cofactors_layout(rpos, cofactors, direction, label, label_size, dist = (10, 15)):
+	subs = [m for m in cofactors.keys() if cofactors[m]['role']=='substrate']
+	prds = [m for m in cofactors.keys() if cofactors[m]['role']=='product']
+	gr = pair_cofactors(subs, prds, label)
+
+	# the geometry only depends on the label sizes, so it is shared by all
+	# reactions with the same (kind of) cofactors
+	sizes = tuple(tuple(tuple(label_size[m]) if m else None for m in g) for g in gr)
+	key = (direction, tuple(dist), sizes)
+	if key not in cofactor_templates:
+		cofactor_templates[key] = get_cofactors_template(sizes, direction, dist)
+
+	start = 'm {x},{y} '.format(x = rpos[0], y = rpos[1])
+	for i, j, x_terms, y_terms, pth in cofactor_templates[key]:
+		x = rpos[0]
+		for t in x_terms:
+			x += t
+		y = rpos[1]
+		for t in y_terms:
+			y += t
+		m = gr[i][j]
+		cofactors[m]['pos'] = (x, y)
+		cofactors[m]['path'] = start + pth
 			
 	return cofactors
 
@@ -250,12 +306,11 @@ def path_position_end(pos, dx, dy, end_curve, label_size, padding = (0,0)):
 	
 	return [x, y]
 
-def adjust_duplicate_path_ends(s, p, spos, p_nodes):
+def path_end_groups(p, spos):
 	"""
-	Adjust duplicate path end points.
+	Group path end nodes by position: ((top, bottom), (left, right)), path ends
+	in group i have the same x (i=0) or y (i=1) coordinate as the species.
 	"""
-
-	# group path end nodes by position
 	gr = (([],[]),([],[]))
 	for r in p:
 		if p[r][0] == spos[0]:
@@ -273,65 +328,79 @@ def adjust_duplicate_path_ends(s, p, spos, p_nodes):
 			else:
 				# adjust y right
 				gr[1][1].append(r)
-	
-	# adjust positions if there are duplicate path end points
-	for i in range(2):
-		for j in range(2):
-			for r in gr[i][j]:
-				# find path ends that should be in middle, so 
-				# that path stays a straight line instead of 
-				# becoming s-shaped.
-				if p_nodes[(r,s)][-2][i] == spos[i]:
-					mid = True
-					mid_r = r
-					break
-			else:
-				mid = False
-
-			if mid:
-				gr[i][j].remove(mid_r) # don't move this position
-				p[mid_r][i] = spos[i]
-
-			# sort r_nodes in group based on r_node x or y positions
-			gr[i][j].sort(key = lambda r: p_nodes[(r,s)][-2][i])
-
-			if mid and not len(gr[i][j])%2:
-				# even:
-				# place half the path ends on one side of mid,
-				# place the other half on the other side.
-				gr1 = gr[i][j][:len(gr[i][j])/2][::-1]
-				gr2 = gr[i][j][len(gr[i][j])/2:]
-				for r in gr1:
-					p[r][i] = spos[i] -10 - 10*gr1.index(r)
-				for r in gr2:
-					p[r][i] = spos[i] +10 + 10*gr2.index(r)
-
-			elif mid and len(gr[i][j])%2:
-				# odd
-				for r in gr[i][j]:
-					# adjust x or y position
-					p[r][i] = spos[i] + (len(gr[i][j])*-5+5) + 10*gr[i][j].index(r)
-				# decide which side of mid has the majority of path ends
-				# based on reaction position.
-				num_side1 = len([r for r in gr[i][j] if p_nodes[(r,s)][-2][i] < spos[i]])
-				num_side2 = len([r for r in gr[i][j] if p_nodes[(r,s)][-2][i] > spos[i]])
-				if num_side1 > num_side2:
-					gr1 = [r for r in gr[i][j] if p[r][i] <= spos[i]][::-1]
-					gr2 = [r for r in gr[i][j] if p[r][i] >  spos[i]]
-				else:
-					gr1 = [r for r in gr[i][j] if p[r][i] <  spos[i]][::-1]
-					gr2 = [r for r in gr[i][j] if p[r][i] >= spos[i]]
-				# place path ends on each side
-				for r in gr1:
-					p[r][i] = spos[i] -10 - 10*gr1.index(r)
-				for r in gr2:
-					p[r][i] = spos[i] +10 + 10*gr2.index(r)				
-			else:
+	return gr
+
+def adjust_all_duplicate_path_ends(path_end, pos, p_nodes):
+	"""
+	Adjust duplicate path end points of all species in one pass. Path ends of
+	a species that share a side (see path_end_groups) are spread 10 apart
+	along that side, in the order of the reaction positions. A path end that
+	is in line with the species stays in the middle (the path stays straight),
+	the others go on either side of it.
+	Input  - path_end 	dictionary with for each species a dictionary with 
+						path end points (lists, changed in place) per reaction.
+			 pos 		node positions.
+			 p_nodes 	path points per edge.
+	Output - path_end
+	"""
+	# path ends with a duplicate coordinate: (species, reaction, coordinate index)
+	ends = []
+	group = []
+	key = []
+	spos = []
+	for s in path_end:
+		gr = path_end_groups(path_end[s], pos[s])
+		for i in range(2):
+			for j in range(2):
 				for r in gr[i][j]:
-					# adjust x or y position
-					p[r][i] = spos[i] + (len(gr[i][j])*-5+5) + 10*gr[i][j].index(r)
-			
-	return p
+					ends.append((s, r, i))
+					group.append(len(spos))
+					key.append(p_nodes[(r,s)][-2][i])
+				spos.append(pos[s][i])
+	if not ends:
+		return path_end
+
+	group = np.array(group)
+	key = np.array(key, dtype=float)
+	spos = np.array(spos, dtype=float)
+	sp = spos[group]
+	num_groups = len(spos)
+
+	# first path end of each group that should stay in the middle
+	candidates = np.flatnonzero(key == sp)
+	_, first = np.unique(group[candidates], return_index=True)
+	is_mid = np.zeros(len(ends), dtype=bool)
+	is_mid[candidates[first]] = True
+	has_mid = np.bincount(group[is_mid], minlength=num_groups) > 0
+
+	# rank of the other path ends in their group, sorted on reaction position
+	rest = np.flatnonzero(~is_mid)
+	order = rest[np.lexsort((rest, key[rest], group[rest]))]
+	g = group[order]
+	n = np.bincount(g, minlength=num_groups)
+	start = np.cumsum(n) - n
+	k = np.arange(len(order)) - start[g]
+	s_pos = spos[g]
+
+	centred = (s_pos + (n[g]*-5+5)) + 10*k
+
+	# number of path ends on the left/top side of the middle one
+	side1 = np.bincount(g, weights=key[order] < s_pos, minlength=num_groups)
+	side2 = np.bincount(g, weights=key[order] > s_pos, minlength=num_groups)
+	left = np.where((side1 > side2)[g], centred <= s_pos, centred < s_pos)
+	half = np.where(n%2, np.bincount(g, weights=left, minlength=num_groups), n/2).astype(int)
+
+	h = half[g]
+	value = np.where(k < h, (s_pos - 10) - 10*(h-1-k), (s_pos + 10) + 10*(k-h))
+	value = np.where(has_mid[g], value, centred)
+
+	for e, v in zip(order.tolist(), value.tolist()):
+		s, r, i = ends[e]
+		path_end[s][r][i] = v
+	for e in np.flatnonzero(is_mid).tolist():
+		s, r, i = ends[e]
+		path_end[s][r][i] = pos[s][i]
+	return path_end
 
 def overlapping(points, label_pos, label_size):
 	"""
@@ -436,6 +505,9 @@ def get_path_segments(start, end, start_direction, end_direction, max_bend= 40,
 
 def path_segments_vh(start, end, max_bend, adj):
 	# j-shaped path 'vertical' to 'horizontal'
+	if start.real == end.real or start.imag == end.imag:
+		# straight line (e.g. the midpoint of an s-shaped path is level with the end)
+		return [Line(start, end)]
 	dx = end.real - start.real
 	dy = end.imag - start.imag
 	dv = adj[0] * dy/abs(dy)
@@ -473,6 +545,9 @@ def path_segments_vh(start, end, max_bend, adj):
 
 def path_segments_hv(start, end, max_bend, adj):
 	# j-shaped path 'horizontal' to 'vertical' 
+	if start.real == end.real or start.imag == end.imag:
+		# straight line (e.g. the midpoint of an s-shaped path is level with the end)
+		return [Line(start, end)]
 	dx = end.real - start.real
 	dy = end.imag - start.imag
 	dv = adj[0] * dy/abs(dy)
@@ -507,7 +582,7 @@ def path_segments_hv(start, end, max_bend, adj):
 
 	return segs
 	
-def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, pathway, cofactors = None, min_path_length = 10, max_bend = 40, prevent_overlap = True, direction_default = 'v', reverse_cofactor_direction = []):
+def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, pathway, cofactors = None, min_path_length = 10, max_bend = 40, prevent_overlap = True, direction_default = 'v', reverse_cofactor_direction = [], timer = NoTimer()):
 	"""
 	Get svg-paths for the metabolic map.
 	INPUT:
@@ -534,6 +609,8 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 	'prevent_overlap':		prevent overlap of paths and labels.
 	'direction_default':	default direction of paths at reaction nodes.
 	'reverse_cofactors':	list of reactions in which cofactors must be placed in opposite order
+	'timer':				records the time of the routing passes and overlap checks, and the number
+							of overlap checks and adjustments (see timing.py)
 	
 	OUTPUT:
 	A dictionary with the svg-paths; keys are edges and values are svg paths (svg path 'd' attribute)	
@@ -686,8 +763,7 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 					path_end[s][r] = p_nodes[e][-1]
 
 	# adjust duplicate path ends
-	for s in path_end:
-		path_end[s] = adjust_duplicate_path_ends(s, path_end[s], pos[s], p_nodes)
+	path_end = adjust_all_duplicate_path_ends(path_end, pos, p_nodes)
 	for e in edges:
 		p_nodes[e][-1] = path_end[e[1]][e[0]]
 
@@ -707,6 +783,7 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 				adjust = [cof_adj[e],0])
 			path_segs[e].append(segs)
 
+	timer.mark('routing')
 	
 	if not prevent_overlap:
 		# return paths if no overlap prevention
@@ -719,6 +796,7 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 		for r in cofactors:
 			for s in cofactors[r]:
 				svg_paths[(r,s)] = cofactors[r][s]['path']
+		timer.mark('path_data')
 
 		return svg_paths, pos
 	
@@ -726,7 +804,6 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 	########## adjust path/label overlap ########## 
 	
 	# change path segment basic shape if overlapping with labels
-	print 'checking path/label overlap...'
 	for e in edges:
 		for i in range(len(path_segs[e])):
 			seg = path_segs[e][i]
@@ -736,9 +813,10 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 			points = [p.point(t) for t in [k/100. for k in range(101)]]
 			for n in s_nodes.difference({e[1]}):
 				# check if any points are inside species labels
+				timer.count('overlap_checks')
 				if overlapping(points, pos[n], label_size[n]):
 					# change j shape to s shape
-					print 'changing path {} shape to prevent {} label overlap...'.format(e, n)
+					timer.count('shape_changes')
 					direction[e][i+1] = direction[e][i]
 					break
 		
@@ -774,10 +852,10 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 					path_end[s][r] = p_nodes[e][-1]	
 	
 	# adjust duplicate path ends
-	for s in path_end:
-		path_end[s] = adjust_duplicate_path_ends(s, path_end[s], pos[s], p_nodes)
+	path_end = adjust_all_duplicate_path_ends(path_end, pos, p_nodes)
 	for e in edges:
 		p_nodes[e][-1] = path_end[e[1]][e[0]]
+	timer.mark('label_overlap')
 
 	# get new path segments
 	vv_shaped=[]
@@ -813,8 +891,6 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 				info = {'x':x, 'dx':dx, 'dy':dy, 'start':start, 'end':end, 'e,i':(e,i)}
 				hh_shaped.append(info)
 
-	print 'adjusting path/path overlap'
-	
 	vv_shaped.sort(key = lambda k:k['y']) # sort by midpoint y-coordinate
 	for y, info in groupby(vv_shaped, key = lambda k:k['y']):
 		# determine overlap for all path segments with same midpoint y-coordinate
@@ -888,10 +964,10 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 				segs = get_path_segments(start,	end, 'h', 'h', max_bend, adj)
 				path_segs[e][i] = segs
 
+	timer.mark('path_overlap')
+
 	# check if still overlap
 	# if overlap, try to adjust path midpoint until there is no overlap
-	print 'checking path/label overlap...'
-
 	for e in edges:
 		for i in range(len(path_segs[e])):
 			seg = path_segs[e][i]
@@ -903,13 +979,14 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 			for n in s_nodes.difference({e[1]}):
 				# check if any points are inside species labels
 				overlap.append(overlapping(points, pos[n], label_size[n]))
+			timer.count('overlap_checks', len(overlap))
 			if any(overlap):
 				start = complex(*p_nodes[e][i])
 				end = complex(*p_nodes[e][i+1])
 				if direction[e][i] == 'v' and start.real==end.real or direction[e][i] == 'h' and start.imag == end.imag:
 					print 'could not find non-overlapping path for {}'.format(e)
 				elif direction[e][i] == direction[e][i+1]:
-					print 'adjusting path {} to prevent path/label overlap...'.format(e)
+					timer.count('adjusted_paths')
 					adjustments = []
 					if direction[e][i] == 'h':
 						len_seg = 0.5*abs(end.real - start.real)
@@ -938,24 +1015,25 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 					adjusted_paths = []
 					num_overlap = []
 					for adj in adjustments:
-						print '.',
-						sys.stdout.flush()
+						timer.count('adjustment_attempts')
 						new_segs = get_path_segments(start, end, direction[e][i], direction[e][i+1], max_bend, adjust=[0,0,adj])
 						p = Path(*new_segs)
 						points = [p.point(t) for t in [k/100. for k in range(101)]]
 						overlap = []
 						for n in s_nodes.difference({e[1]}):
 							overlap.append(overlapping(points, pos[n], label_size[n]))
+						timer.count('overlap_checks', len(overlap))
 						num_overlap.append(sum(overlap))
 						adjusted_paths.append(new_segs)
 						if not any(overlap):
-							print 'ok'
 							path_segs[e][i] = new_segs
 							break
 					else:
-						print 'could not find non-overlapping path'
+						print 'could not find non-overlapping path for {}'.format(e)
 						path_segs[e][i] = adjusted_paths[num_overlap.index(min(num_overlap))]
 
+	timer.mark('overlap_adjust')
+
 	svg_paths = arc_paths
 	for e in edges:
 		p = []
@@ -965,5 +1043,6 @@ def get_paths(edges, nodes, node_type, extra_nodes, pos, label, label_size, path
 	for r in cofactors:
 		for s in cofactors[r]:
 			svg_paths[(r,s)] = cofactors[r][s]['path']
+	timer.mark('path_data')
 
 	return svg_paths, pos
\ No newline at end of file
@@ -0,0 +1,63 @@
+import os
+import json
+import hashlib
+import tempfile
+import cPickle as pickle
+from collections import OrderedDict
+
+# modules that determine the content of svg_data, a change in one of them
+# invalidates the cached svg_data
+source_files = ['svg_assembly.py', 'svg_paths.py', 'path_encoding.py', 'transform.py', 'readers.py', 'snap_to_grid.py', 'split_hubs.py', 'json_to_svg.py', 'graph_to_svg.py']
+
+def file_digest(file_name):
+	""" sha1 hex digest of the content of a file """
+	h = hashlib.sha1()
+	with open(file_name, 'rb') as f:
+		for chunk in iter(lambda: f.read(1 << 20), b''):
+			h.update(chunk)
+	return h.hexdigest()
+
+def svgdata_key(files, options):
+	"""
+	Cache key of the svg_data created from input files and options.
+	Input  - files 		dictionary with input files (e.g. layout file, font file, sbml model);
+						values can be None for unused inputs.
+			 options 	dictionary with all other settings that affect get_svgdata
+						(font size, scale, padding, flags, ...), must be json serializable.
+	Output - sha1 hex digest of the content of the files, the options and the
+			 source code of the modules that create svg_data.
+	"""
+	module_dir = os.path.dirname(os.path.abspath(__file__))
+	content = {
+		'files': dict((k, file_digest(f) if f else None) for k, f in files.items()),
+		'options': options,
+		'source': [file_digest(os.path.join(module_dir, f)) for f in source_files]}
+	return hashlib.sha1(json.dumps(content, sort_keys = True)).hexdigest()
+
+def load_svgdata(cache_dir, key):
+	""" Get cached svg_data (see svg_assembly.get_svgdata), None if not in the cache """
+	file_name = os.path.join(cache_dir, key + '.pickle')
+	if not os.path.exists(file_name):
+		return None
+	try:
+		with open(file_name, 'rb') as f:
+			return pickle.load(f)
+	except (EOFError, pickle.UnpicklingError):
+		# damaged cache file, recreate svg_data
+		return None
+
+def ordered(value):
+	""" Convert (nested) dictionaries to OrderedDicts, so the iteration order survives pickling """
+	if isinstance(value, dict):
+		return OrderedDict((k, ordered(v)) for k, v in value.items())
+	return value
+
+def save_svgdata(cache_dir, key, svg_data):
+	""" Store svg_data in the cache (written to a temporary file first, so readers never see a partial file) """
+	if not os.path.isdir(cache_dir):
+		os.makedirs(cache_dir)
+	fd, tmp = tempfile.mkstemp(dir = cache_dir, suffix = '.tmp')
+	with os.fdopen(fd, 'wb') as f:
+		# same iteration order as svg_data, so get_svgdoc gives the same output
+		pickle.dump(ordered(svg_data), f, pickle.HIGHEST_PROTOCOL)
+	os.rename(tmp, os.path.join(cache_dir, key + '.pickle'))
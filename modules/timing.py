@@ -0,0 +1,161 @@
+import os
+import time
+import json
+import cProfile
+import pstats
+from contextlib import contextmanager
+
+class StageTimer:
+	"""
+	Wall time per stage of the pipeline, and counters (e.g. the number of
+	overlap checks). Stages are either timed with the stage context manager,
+	or with mark, which assigns the time since the previous mark (or the
+	creation of the timer, or the start of the enclosing stage) that is not in
+	a stage to a stage.
+	Stages can be nested: the time of a stage does not include the time of the
+	stages inside it, so the times of all stages add up to the total time.
+	Times of stages with the same name are added up.
+	If profile_dir is given, each stage is also profiled with cProfile (see
+	dump_profiles).
+	"""
+	def __init__(self, profile_dir = None):
+		self.timings = {}
+		self.order = []
+		self.counts = {}
+		self.count_order = []
+		self.stack = []		# names of the running stages, innermost last
+		self.pending = 0.0	# time since the previous mark that is not in a stage
+		self.profile_dir = profile_dir
+		self.profiles = {}	# stage: list of cProfile.Profile
+		self.pending_profiles = []
+		if profile_dir:
+			# profiler of the time since the last start, end or mark of a stage
+			self.profiler = cProfile.Profile()
+			self.profiler.enable()
+		self.last = time.time()
+
+	def _split(self):
+		""" Profile of the time since the last start, end or mark of a stage (None if not profiling) """
+		if not self.profile_dir:
+			return None
+		profiler = self.profiler
+		profiler.disable()
+		self.profiler = cProfile.Profile()
+		self.profiler.enable()
+		return profiler
+
+	def _credit(self, name, seconds, profilers):
+		self.add(name, seconds)
+		if self.profile_dir:
+			self.profiles.setdefault(name, []).extend(profilers)
+
+	def add(self, name, seconds):
+		if name not in self.timings:
+			self.timings[name] = 0.0
+			self.order.append(name)
+		self.timings[name] += seconds
+
+	def count(self, name, n = 1):
+		if name not in self.counts:
+			self.counts[name] = 0
+			self.count_order.append(name)
+		self.counts[name] += n
+
+	def mark(self, name):
+		now = time.time()
+		if self.stack:
+			self._credit(name, now - self.last, [self._split()])
+		else:
+			self._credit(name, self.pending + now - self.last, self.pending_profiles + [self._split()])
+			self.pending = 0.0
+			self.pending_profiles = []
+		self.last = time.time()
+
+	@contextmanager
+	def stage(self, name):
+		now = time.time()
+		if self.stack:
+			self._credit(self.stack[-1], now - self.last, [self._split()])
+		else:
+			self.pending += now - self.last
+			self.pending_profiles.append(self._split())
+		self.stack.append(name)
+		self.last = time.time()
+		try:
+			yield
+		finally:
+			now = time.time()
+			self._credit(self.stack.pop(), now - self.last, [self._split()])
+			self.last = time.time()
+
+	def items(self):
+		""" (stage, seconds) tuples in the order in which the stages were first timed """
+		return [(name, self.timings[name]) for name in self.order]
+
+	def report(self):
+		""" Table of the stages (seconds and percentage of the total) and counters """
+		total = sum(self.timings.values())
+		lines = ['{:<24} {:>10} {:>6}'.format('stage', 'seconds', '%')]
+		for name, seconds in self.items():
+			lines.append('{:<24} {:>10.3f} {:>6.1f}'.format(name, seconds, 100*seconds/total if total else 0.0))
+		lines.append('{:<24} {:>10.3f}'.format('total', total))
+		if self.counts:
+			lines.append('')
+			lines.append('{:<24} {:>10}'.format('counter', 'count'))
+			for name in self.count_order:
+				lines.append('{:<24} {:>10}'.format(name, self.counts[name]))
+		return '\n'.join(lines)
+
+	def save_json(self, file_name):
+		""" Write the stages and counters to a json file """
+		data = {'stages': [[name, seconds] for name, seconds in self.items()],
+			'total': sum(self.timings.values()),
+			'counts': dict((name, self.counts[name]) for name in self.count_order)}
+		with open(file_name, 'wb') as f:
+			json.dump(data, f, indent = 2)
+
+	def dump_profiles(self, directory):
+		""" Write the cProfile statistics of each stage to <directory>/<stage>.prof (see pstats) """
+		if self.profile_dir:
+			self.profiler.disable()
+		if not os.path.exists(directory):
+			os.makedirs(directory)
+		for name, profilers in self.profiles.items():
+			stats = pstats.Stats(profilers[0])
+			for p in profilers[1:]:
+				stats.add(p)
+			stats.dump_stats(os.path.join(directory, name + '.prof'))
+
+class NoTimer:
+	""" Stand-in for StageTimer when no timing is requested """
+	def mark(self, name):
+		pass
+
+	def count(self, name, n = 1):
+		pass
+
+	@contextmanager
+	def stage(self, name):
+		yield
+
+def add_profile_arguments(parser):
+	""" Add the --profile and --profile_dir flags to an argument parser """
+	parser.add_argument('--profile', nargs = '?', const = '-', metavar = 'profile.json', help = "Print the time of each stage (reading, cofactors, label measurement, path routing, overlap checks, writing) and counters, or write them to this json file.")
+	parser.add_argument('--profile_dir', metavar = 'profiles', help = "Write a cProfile dump of each stage to this directory (<stage>.prof, see pstats).")
+
+def profile_timer(args):
+	""" Timer for the --profile and --profile_dir flags """
+	if args.profile or args.profile_dir:
+		return StageTimer(args.profile_dir)
+	return NoTimer()
+
+def profile_report(args, timer):
+	""" Print or save the stages of a timer of profile_timer """
+	if not isinstance(timer, StageTimer):
+		return
+	if args.profile_dir:
+		timer.dump_profiles(args.profile_dir)
+	if args.profile and args.profile != '-':
+		timer.save_json(args.profile)
+	else:
+		print timer.report()
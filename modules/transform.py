@@ -0,0 +1,244 @@
+import heapq
+import numpy as np
+
+
+def xy_pair(values):
+	"""
+	Return an (x, y) tuple from a list with one number (same value in x and y
+	direction) or two numbers. The input list is not modified.
+	"""
+	if len(values) == 1:
+		return (values[0], values[0])
+	return (values[0], values[1])
+
+def round_half_away(a):
+	""" Round array elements to integers, halfway values away from zero (like round in python 2) """
+	return np.copysign(np.floor(np.abs(a) + 0.5), a)
+
+def pack_coordinates(d):
+	"""
+	Pack node coordinates and helper point coordinates of a layout dictionary
+	into a single array.
+	Input  - a dictionary with layout information (see readers.read_json_data).
+	Output - list of nodes, list of (edge, number of helper points) tuples and
+			 an (n, 2) array with the coordinates of the nodes followed by the
+			 coordinates of the helper points ('extra_nodes') of each edge.
+	"""
+	nodes = list(d['pos'].keys())
+	extra = [(e, len(pts)) for e, pts in d['extra_nodes'].items() if len(pts) > 0]
+
+	points = [d['pos'][n] for n in nodes]
+	for e, _ in extra:
+		points.extend(d['extra_nodes'][e])
+
+	coords = np.array(points, dtype=float).reshape(-1, 2)
+	return nodes, extra, coords
+
+def unpack_coordinates(d, nodes, extra, coords):
+	"""
+	Write coordinates packed by pack_coordinates back into the layout dictionary.
+	The 'pos' dictionary and the 'extra_nodes' lists are updated in place.
+	"""
+	points = [tuple(p) for p in coords.tolist()]
+	d['pos'].update(zip(nodes, points[:len(nodes)]))
+	i = len(nodes)
+	for e, num in extra:
+		d['extra_nodes'][e][:] = points[i:i+num]
+		i += num
+	return d
+
+def affine_transform(coords, scale = (1, 1), padding = (0, 0), origin = (0, 0), flip_y = False):
+	"""
+	Translate (minus origin), scale and pad an (n, 2) array of coordinates.
+	Padding is added in x-direction and subtracted in y-direction, since the
+	y-axis points up in the layout coordinates. If flip_y, y-coordinates are
+	negated afterwards (svg coordinates).
+	"""
+	coords = (coords - np.asarray(origin, dtype=float)) * np.asarray(scale, dtype=float)
+	coords += np.array([padding[0], -padding[1]], dtype=float)
+	if flip_y:
+		coords[:, 1] *= -1
+	return coords
+
+def transform_layout(d, scale = [1, 1], padding = [0, 0], normalize = False, flip_y = False):
+	"""
+	Adjust all node and helper point coordinates of a layout dictionary in one go.
+	Input  - d 			dictionary with layout information.
+			 scale 		scale factor(s) (list with one or two numbers).
+			 padding 	extra space added to the borders (list with one or two numbers).
+			 normalize 	translate coordinates such that the minimum x and the maximum y
+			 			coordinate of the nodes become zero.
+			 flip_y 	convert to svg coordinates (y-axis pointing down).
+	Output - the layout dictionary (coordinates are changed in place).
+	"""
+	nodes, extra, coords = pack_coordinates(d)
+	if len(coords) == 0:
+		return d
+
+	if normalize:
+		# get minimum x and maximum y coordinate of the nodes for normalization
+		origin = (coords[:len(nodes), 0].min(), coords[:len(nodes), 1].max())
+	else:
+		origin = (0, 0)
+
+	coords = affine_transform(coords, xy_pair(scale), xy_pair(padding), origin, flip_y)
+	return unpack_coordinates(d, nodes, extra, coords)
+
+def pack_graph_coordinates(graph, nodes = None):
+	"""
+	Pack the 'x' and 'y' node attributes of a networkx graph into an (n, 2) array.
+	Output - list of nodes, coordinate array.
+	"""
+	if nodes is None:
+		nodes = graph.nodes()
+	coords = np.array([(graph.node[n]['x'], graph.node[n]['y']) for n in nodes], dtype=float).reshape(-1, 2)
+	return nodes, coords
+
+def unpack_graph_coordinates(graph, nodes, coords):
+	""" Write an (n, 2) coordinate array back to the 'x' and 'y' node attributes of a graph """
+	for n, (x, y) in zip(nodes, coords.tolist()):
+		graph.node[n]['x'] = x
+		graph.node[n]['y'] = y
+	return graph
+
+def snap_coordinates(coords, grid, offset = (0, 0)):
+	""" Move each point in an (n, 2) coordinate array to the nearest grid point """
+	grid = np.asarray(xy_pair(grid), dtype=float)
+	offset = np.asarray(xy_pair(offset), dtype=float)
+	return offset + round_half_away((coords - offset)/grid)*grid
+
+class _BlockedCells:
+	"""
+	Occupancy grid of assign_grid_cells: a boolean array that marks the cells
+	within the clearance of an assigned cell. The array grows when candidate
+	cells fall outside of it.
+	"""
+	def __init__(self, lower, upper, clearance):
+		self.origin = np.asarray(lower, dtype=int)
+		self.blocked = np.zeros(np.asarray(upper, dtype=int) - self.origin + 1, dtype=bool)
+		self.clearance = clearance
+
+	def include(self, lower, upper):
+		""" Grow the grid such that it contains the cells from lower to upper """
+		below = np.maximum(self.origin - lower, 0)
+		above = np.maximum(np.asarray(upper) - self.origin - np.array(self.blocked.shape) + 1, 0)
+		if below.any() or above.any():
+			# (grow by at least half the size, so the grid is copied a few times at most)
+			below = np.where(below > 0, np.maximum(below, np.array(self.blocked.shape)//2), 0)
+			above = np.where(above > 0, np.maximum(above, np.array(self.blocked.shape)//2), 0)
+			self.blocked = np.pad(self.blocked, list(zip(below, above)), 'constant')
+			self.origin = self.origin - below
+
+	def is_free(self, cell):
+		""" True if a cell (i, j) can be assigned """
+		return not self.blocked[cell[0] - self.origin[0], cell[1] - self.origin[1]]
+
+	def free(self, cells):
+		""" Boolean array, True for the cells in an (n, 2) array that can be assigned """
+		return ~self.blocked[cells[:, 0] - self.origin[0], cells[:, 1] - self.origin[1]]
+
+	def assign(self, cell):
+		""" Mark a cell and the cells within the clearance around it """
+		cx, cy = self.clearance
+		i, j = int(cell[0] - self.origin[0]), int(cell[1] - self.origin[1])
+		if i-cx+1 < 0 or j-cy+1 < 0 or i+cx > self.blocked.shape[0] or j+cy > self.blocked.shape[1]:
+			self.include((cell[0]-cx+1, cell[1]-cy+1), (cell[0]+cx-1, cell[1]+cy-1))
+			i, j = int(cell[0] - self.origin[0]), int(cell[1] - self.origin[1])
+		self.blocked[i-cx+1:i+cx, j-cy+1:j+cy] = True
+
+_ring_offsets = {}
+
+def _square_offsets(k):
+	"""
+	Relative (i, j) cell indices of the square of rings 0 to k around a cell,
+	sorted by ring and index. Output - rings, i and j arrays (cached).
+	"""
+	if k not in _ring_offsets:
+		i, j = np.mgrid[-k:k+1, -k:k+1]
+		i, j = i.ravel(), j.ravel()
+		ring = np.maximum(np.abs(i), np.abs(j))
+		order = np.lexsort((j, i, ring))
+		_ring_offsets[k] = (ring[order], i[order], j[order])
+	return _ring_offsets[k]
+
+def _candidate_cells(ideal, nearest, r0, r1, blocked):
+	"""
+	Free cells (see _BlockedCells) at a distance in (r0, r1] of a point (in
+	grid units), sorted by distance, then by ring (square rings around the
+	nearest cell) and index.
+	Output - distances, rings and an (n, 2) array of cells.
+	"""
+	ring, i, j = _square_offsets(int(np.ceil(r1 + 0.5)))
+	# cells on the rings up to m are at most (m + 0.5)*sqrt(2) away, skip them
+	m = int(np.floor(r0/np.sqrt(2) - 0.5))
+	start = (2*m + 1)**2 if m >= 0 else 0
+	ring = ring[start:]
+	i = i[start:] + nearest[0]
+	j = j[start:] + nearest[1]
+	blocked.include((i.min(), j.min()), (i.max(), j.max()))
+	d = np.hypot(i - ideal[0], j - ideal[1])
+	keep = np.flatnonzero((d > r0) & (d <= r1) & blocked.free(np.column_stack((i, j))))
+	# (a stable sort keeps the order of ring and index for equal distances)
+	keep = keep[np.argsort(d[keep], kind='mergesort')]
+	return d[keep], ring[keep], np.column_stack((i[keep], j[keep]))
+
+def assign_grid_cells(coords, grid, offset = (0, 0), clearance = (1, 1)):
+	"""
+	Move each point in an (n, 2) coordinate array to a grid point, such that no
+	two points share a grid cell. Points are assigned in order of distance to 
+	their candidate cells (a priority queue over all points): the point closest
+	to a free cell claims it, other points move on to the next nearest cell.
+	clearance (in grid cells, x and y direction) is the minimum distance between
+	two assigned cells, e.g. (2, 1) keeps an empty cell between points that are
+	on the same row.
+	The candidate cells of a point are made in batches (all cells within a
+	radius, the radius doubles for the next batch) and the queue only holds the
+	nearest free candidate of each point; taken cells are looked up in an
+	occupancy grid (see _BlockedCells).
+	"""
+	grid = np.asarray(xy_pair(grid), dtype=float)
+	offset = np.asarray(xy_pair(offset), dtype=float)
+	cx, cy = [int(c) for c in xy_pair(clearance)]
+	if len(coords) == 0:
+		return offset + np.zeros((0, 2))
+
+	# point positions in grid units and their nearest cells
+	ideal = (coords - offset)/grid
+	nearest = round_half_away(ideal).astype(int)
+
+	radius = 2.0
+	blocked = _BlockedCells(nearest.min(axis=0), nearest.max(axis=0), (cx, cy))
+	# per point: candidate distances, rings and cells, index of the next candidate
+	# and batch radius (at first only the nearest cell, None)
+	distance = np.hypot(*(nearest - ideal).T)
+	candidates = [[distance[n:n+1], np.zeros(1, dtype=int), nearest[n:n+1], 0, None] for n in range(len(ideal))]
+	heap = [(distance[n], n, 0, nearest[n][0], nearest[n][1]) for n in range(len(ideal))]
+	heapq.heapify(heap)
+
+	cells = np.zeros(nearest.shape, dtype=int)
+	while heap:
+		entry = heapq.heappop(heap)
+		n = entry[1]
+		d, k, c, p, r = candidates[n]
+		if blocked.is_free(c[p]):
+			blocked.assign(c[p])
+			cells[n] = c[p]
+			candidates[n] = None
+			continue
+		# move on to the next free candidate (cells are never freed again,
+		# the next few candidates are checked first)
+		while True:
+			free = np.flatnonzero(blocked.free(c[p:p+32]))
+			if len(free) == 0 and p + 32 < len(c):
+				free = 32 + np.flatnonzero(blocked.free(c[p+32:]))
+			if len(free) > 0:
+				p += free[0]
+				break
+			# next batch of candidates (the first one has all cells within radius)
+			r0, r = (-1.0, radius) if r is None else (r, 2*r)
+			d, k, c = _candidate_cells(ideal[n], nearest[n], r0, r, blocked)
+			p = 0
+		candidates[n] = [d, k, c, p, r]
+		heapq.heappush(heap, (d[p], n, k[p], c[p][0], c[p][1]))
+
+	return offset + cells*grid
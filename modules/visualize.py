@@ -3,6 +3,47 @@ import cbmpy as cbm
 import re
 from numpy import log
 import webbrowser
+from svg_output import open_svg, write_svg
+from timing import NoTimer
+
+rules_start_pattern = re.compile(r'/\*\s*reaction rules\s*\*/')
+rules_end_pattern = re.compile(r'/\*\s*end of reaction rules\s*\*/')
+
+reaction_rules = """    #{r} {{stroke:#cccccc; stroke-width:1.0; stroke-dasharray:1.5}}
+    #{r}.substrate {{marker-end:url(#substrate)}}
+    #{r}.product   {{marker-end:url(#product)}}
+    #{r}.fluxvalue_tooltip {{fill-opacity:0}}
+    #{r}.fluxvalue {{fill-opacity:0}}
+    #{r}.FVAspan {{fill-opacity:0}}
+    #{r}.FVAmin {{fill-opacity:0}}
+    #{r}.FVAmax {{fill-opacity:0}}
+"""
+
+reversibility_rules = """    #{r}.reversible {{stroke-opacity:0}}
+    #{r}.irreversible {{stroke-opacity:0}}
+    #{r}.inactive {{stroke-opacity:0}}
+"""
+
+def expand_reaction_rules(svg_lines, rids, reversibility = False):
+	"""
+	Replace the shared reaction rules of a map of layout_final.py (between the
+	reaction rules comments) by rules per reaction (rids), which mapFBA and mapFVA
+	change line by line. The reversibility rules are added if reversibility is
+	True (they are set from the reaction bounds). Maps with rules per reaction
+	are returned unchanged, as are maps without reactions with the r_prefix of
+	mapFBA and mapFVA (no rids).
+	"""
+	start = [i for i, line in enumerate(svg_lines) if rules_start_pattern.search(line)]
+	end = [i for i, line in enumerate(svg_lines) if rules_end_pattern.search(line)]
+	if not start or not end or not rids:
+		return svg_lines
+	rules = []
+	for rid in sorted(rids):
+		rules.append(reaction_rules.format(r=rid))
+		if reversibility:
+			rules.append(reversibility_rules.format(r=rid))
+	rules = ''.join(rules).splitlines(True)
+	return svg_lines[:start[0]] + rules + svg_lines[end[0]+1:]
 
 class Vmod:
 
@@ -12,13 +53,13 @@ class Vmod:
 		self.model = model
 		self.r_prefix = r_prefix
 
-		with open(svg, 'rb') as f:
+		with open_svg(svg) as f:
 			svg_lines=f.readlines()
 		self.svg_lines = svg_lines
 
 
 
-	def mapFBA(self, D_fluxes=None, D_bounds=None, absminval=1e-15, out_file='FBA_result.svg'):
+	def mapFBA(self, D_fluxes=None, D_bounds=None, absminval=1e-15, out_file='FBA_result.svg', compress=False, minify=False, timer=NoTimer()):
 
 		svg_lines = [line for line in self.svg_lines]
 		r_prefix = self.r_prefix
@@ -32,6 +73,7 @@ class Vmod:
 				D_bounds[r.id] = (r.getLowerBound(), r.getUpperBound())
 
 		rids = set(re.findall('id="({}\w+)"'.format(r_prefix), ''.join(svg_lines)))
+		svg_lines = expand_reaction_rules(svg_lines, rids, bool(D_bounds))
 		maxval = max([abs(D_fluxes[rid]) for rid in rids])
 		minval = min([abs(D_fluxes[rid]) for rid in rids if abs(D_fluxes[rid]) != 0])
 		minval = max(minval, absminval)
@@ -96,12 +138,13 @@ class Vmod:
 					svg_lines[i] = line.replace(m.group(), val_str)
 		
 
-		with open(out_file, 'wb') as f:
-			f.write(''.join(svg_lines))
+		timer.mark('visualize_style')
+		out_file = write_svg(out_file, svg_lines, compress, minify)
+		timer.mark('visualize_write')
 
 		webbrowser.open_new_tab(os.path.join(os.getcwd(), out_file))
 
-	def mapFVA(self, fva_result, D_bounds=None, absminval=1e-15, minspan=1e-15, out_file='FVA_result.svg'):
+	def mapFVA(self, fva_result, D_bounds=None, absminval=1e-15, minspan=1e-15, out_file='FVA_result.svg', compress=False, minify=False, timer=NoTimer()):
 		
 		svg_lines = [line for line in self.svg_lines]
 		r_prefix = self.r_prefix
@@ -116,6 +159,7 @@ class Vmod:
 				D_bounds[r.id] = (r.getLowerBound(), r.getUpperBound())
 
 		rids = set(re.findall('id="({}\w+)"'.format(r_prefix), ''.join(svg_lines)))
+		svg_lines = expand_reaction_rules(svg_lines, rids, bool(D_bounds))
 		maxspan = max([D_fva[rid][4] for rid in rids])
 		minspan_ = min([D_fva[rid][4] for rid in rids if D_fva[rid][4] != 0])
 		minspan = max(minspan, minspan_)
@@ -225,8 +269,9 @@ class Vmod:
 				svg_lines[i] = line.replace(m.group(), val_str)
 
 
-		with open(out_file, 'wb') as f:
-			f.write(''.join(svg_lines))
+		timer.mark('visualize_style')
+		out_file = write_svg(out_file, svg_lines, compress, minify)
+		timer.mark('visualize_write')
 
 		webbrowser.open_new_tab(os.path.join(os.getcwd(), out_file))
 
@@ -0,0 +1,135 @@
+import re
+import json
+import numpy as np
+from xml.sax.saxutils import escape, quoteattr
+from readers import graph_attributes, node_types, layout_node_types, layout_edge_types, layout_version
+
+# graphml types of the node attributes
+graphml_types = {float: 'double', unicode: 'string'}
+
+def graphml_value(value):
+	""" String representation of an attribute value (exact for floats) """
+	if isinstance(value, float):
+		return repr(value)
+	return escape(unicode(value))
+
+def write_graphml(graph, file_name):
+	"""
+	Write a graph (LayoutGraph or networkx.DiGraph) to a graphml file. Only
+	the node attributes in readers.graph_attributes are written.
+	"""
+	used = set()
+	for attr in graph.node.values():
+		used.update(attr)
+	names = sorted(used.intersection(graph_attributes))
+	key = dict((name, 'd{}'.format(i)) for i, name in enumerate(names))
+	
+	lines = ['<?xml version="1.0" encoding="utf-8"?>',
+			'<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">']
+	for name in names:
+		lines.append('  <key attr.name="{}" attr.type="{}" for="node" id="{}" />'.format(
+			name, graphml_types[graph_attributes[name]], key[name]))
+	lines.append('  <graph edgedefault="directed">')
+
+	for n, attr in graph.node.items():
+		lines.append('    <node id={}>'.format(quoteattr(unicode(n))))
+		for name in names:
+			if name in attr:
+				lines.append('      <data key="{}">{}</data>'.format(key[name], graphml_value(attr[name])))
+		lines.append('    </node>')
+
+	for u, v in graph.edges():
+		lines.append('    <edge source={} target={} />'.format(quoteattr(unicode(u)), quoteattr(unicode(v))))
+
+	lines.append('  </graph>')
+	lines.append('</graphml>\n')
+
+	with open(file_name, 'wb') as f:
+		f.write(u'\n'.join(lines).encode('utf-8'))
+
+def write_layout_npz(d, file_name):
+	"""
+	Write a dictionary with layout information (see readers.read_json_data) to a
+	binary layout file (uncompressed .npz, can be memory-mapped when read). Arrays:
+	'strings' 			utf-8 encoded string table (strings separated by '\\0').
+	'node_id', 'node_label', 'node_pathway'		string table indices of the nodes.
+	'node_type' 		node type codes (see readers.layout_node_types).
+	'node_pos' 			(n, 2) array with node coordinates.
+	'edge_index' 		(m, 2) array with (reaction, species) node indices.
+	'edge_type' 		edge type codes (see readers.layout_edge_types).
+	'helper_offsets' 	helper points of edge i are helper_pos[helper_offsets[i]:helper_offsets[i+1]].
+	'helper_pos' 		(k, 2) array with helper point coordinates.
+	"""
+	strings = []
+	string_index = {}
+	def index(value):
+		value = unicode(value)
+		if value not in string_index:
+			if u'\0' in value:
+				raise ValueError('Null character in string {!r}'.format(value))
+			string_index[value] = len(strings)
+			strings.append(value)
+		return string_index[value]
+
+	nodes = d['nodes']
+	node_index = dict((n, i) for i, n in enumerate(nodes))
+	edges = d['edges']
+	helper_lengths = [len(d['extra_nodes'].get(e, [])) for e in edges]
+	helper_pos = [p for e in edges for p in d['extra_nodes'].get(e, [])]
+
+	arrays = {
+		'version': np.array(layout_version),
+		'node_id': np.array([index(n) for n in nodes], dtype = np.int32),
+		'node_label': np.array([index(d['label'][n]) for n in nodes], dtype = np.int32),
+		'node_pathway': np.array([index(d['pathway'][n]) for n in nodes], dtype = np.int32),
+		'node_type': np.array([layout_node_types.index(d['node_type'][n]) for n in nodes], dtype = np.int8),
+		'node_pos': np.array([d['pos'][n] for n in nodes], dtype = float).reshape(-1, 2),
+		'edge_index': np.array([(node_index[r], node_index[s]) for r, s in edges], dtype = np.int32).reshape(-1, 2),
+		'edge_type': np.array([layout_edge_types.index(d['edge_type'][e]) for e in edges], dtype = np.int8),
+		'helper_offsets': np.concatenate(([0], np.cumsum(helper_lengths, dtype = np.int64))),
+		'helper_pos': np.array(helper_pos, dtype = float).reshape(-1, 2)}
+	arrays['strings'] = np.frombuffer(u'\0'.join(strings).encode('utf-8'), dtype = np.uint8)
+
+	# write to a file object, np.savez would add the .npz extension to the file name
+	with open(file_name, 'wb') as f:
+		np.savez(f, **arrays)
+
+def tulip_coordinates(points):
+	""" Tulip layout string of a list of (x, y) tuples """
+	return ','.join('({!r},{!r},0)'.format(float(x), float(y)) for x, y in points)
+
+def write_json_layout(d, file_name):
+	"""
+	Write a dictionary with layout information (see readers.read_json_data) to a
+	json file in the format of Nicholas's output (only the properties that are
+	read by readers.load_json_data). Node ids of copies are stored as cmod id
+	(viewLabel) without the '_copy_' suffix.
+	"""
+	index = dict((n, str(i)) for i, n in enumerate(d['nodes']))
+	properties = {'type': {}, 'name': {}, 'pathway': {}, 'viewLabel': {}, 'viewLayout': {}}
+	for name in properties:
+		properties[name]['nodesValues'] = {}
+	properties['viewLayout']['edgesValues'] = {}
+
+	type_codes = dict((t, c) for c, t in node_types.items())
+	for n, i in index.items():
+		properties['type']['nodesValues'][i] = type_codes[d['node_type'][n]]
+		properties['name']['nodesValues'][i] = d['label'][n]
+		properties['pathway']['nodesValues'][i] = d['pathway'][n]
+		properties['viewLabel']['nodesValues'][i] = re.sub('_copy_[0-9]+$', '', n)
+		properties['viewLayout']['nodesValues'][i] = tulip_coordinates([d['pos'][n]])
+
+	edges = []
+	for i, e in enumerate(d['edges']):
+		hn = list(d['extra_nodes'].get(e, []))
+		if d['edge_type'][e] == 'product':
+			edges.append([int(index[e[0]]), int(index[e[1]])])
+		else:
+			# substrate edges point from species to reaction in Nicholas's output
+			edges.append([int(index[e[1]]), int(index[e[0]])])
+			hn.reverse()
+		if hn:
+			properties['viewLayout']['edgesValues'][str(i)] = '(' + tulip_coordinates(hn) + ')'
+
+	with open(file_name, 'wb') as f:
+		json.dump({'graph': {'edges': edges, 'properties': properties}}, f)